@@ -38,7 +38,7 @@ CREATE TABLE IF NOT EXISTS product_details (
 );
 
 CREATE TABLE IF NOT EXISTS inbound_log (
-    inbound_log_id SERIAL PRIMARY KEY,
+    inbound_log_id SERIAL,
     inbound_date DATE NOT NULL,
     supplier_id VARCHAR(255) REFERENCES supplier_details(supplier_id) ON DELETE SET NULL,
     delivery_note_id VARCHAR(255) NOT NULL,
@@ -49,13 +49,14 @@ CREATE TABLE IF NOT EXISTS inbound_log (
     rejected_reason VARCHAR(255),
     unloading_started_time TIME NOT NULL,
     unloading_completed_time TIME NOT NULL,
-    inbound_putaway_completed_time TIME NOT NULL
-);
+    inbound_putaway_completed_time TIME NOT NULL,
+    PRIMARY KEY (inbound_log_id, inbound_date)
+) PARTITION BY RANGE (inbound_date);
 
 CREATE TABLE IF NOT EXISTS outbound_log (
-    outbound_log_id SERIAL PRIMARY KEY,
+    outbound_log_id SERIAL,
     outbound_date DATE NOT NULL,
-    order_id VARCHAR(255) UNIQUE NOT NULL,
+    order_id VARCHAR(255) NOT NULL,
     customer_id VARCHAR(255) REFERENCES customer_details(customer_id) ON DELETE SET NULL,
     product_id VARCHAR(255) REFERENCES product_details(product_id) ON DELETE CASCADE,
     ordered_qty INT NOT NULL,
@@ -63,14 +64,15 @@ CREATE TABLE IF NOT EXISTS outbound_log (
     pick_sheet_issued_time TIME NOT NULL,
     pick_completed_time TIME NOT NULL,
     vehicle_no VARCHAR(255) REFERENCES vehicle_details(vehicle_no) ON DELETE SET NULL,
-    loading_completed_time TIME NOT NULL
-);
+    loading_completed_time TIME NOT NULL,
+    PRIMARY KEY (outbound_log_id, outbound_date)
+) PARTITION BY RANGE (outbound_date);
 
 CREATE TABLE IF NOT EXISTS return_handling_log (
     return_handling_log_id SERIAL PRIMARY KEY,
     return_date DATE NOT NULL,
     customer_id VARCHAR(255) REFERENCES customer_details(customer_id) ON DELETE SET NULL,
-    order_id VARCHAR(255) REFERENCES outbound_log(order_id) ON DELETE CASCADE,
+    order_id VARCHAR(255), -- outbound_log(order_id), checked by the loader (integrity.py)
     product_id VARCHAR(255) REFERENCES product_details(product_id) ON DELETE CASCADE,
     returned_qty INT NOT NULL,
     return_reason VARCHAR(255) NOT NULL,
@@ -88,7 +90,7 @@ CREATE TABLE IF NOT EXISTS vehicle_ncr_log (
 );
 
 CREATE TABLE IF NOT EXISTS vehicle_hygiene_inspection_log (
-    inspection_log_id SERIAL PRIMARY KEY,
+    inspection_log_id SERIAL,
     inspection_date DATE NOT NULL,
     vehicle_no VARCHAR(255) REFERENCES vehicle_details(vehicle_no) ON DELETE SET NULL,
     good_truckbox VARCHAR(50) NOT NULL,
@@ -97,8 +99,9 @@ CREATE TABLE IF NOT EXISTS vehicle_hygiene_inspection_log (
     good_curtain VARCHAR(50) NOT NULL,
     good_cooling_unit VARCHAR(50) NOT NULL,
     pest_check VARCHAR(50) NOT NULL,
-    odor_check VARCHAR(50) NOT NULL
-);
+    odor_check VARCHAR(50) NOT NULL,
+    PRIMARY KEY (inspection_log_id, inspection_date)
+) PARTITION BY RANGE (inspection_date);
 
 CREATE TABLE IF NOT EXISTS inbound_inspection_log (
     inbound_inspection_id SERIAL PRIMARY KEY,
@@ -140,12 +143,13 @@ CREATE TABLE IF NOT EXISTS product_disposal_log (
 );
 
 CREATE TABLE IF NOT EXISTS warehouse_temperature_monitoring_log (
-    monitoring_id SERIAL PRIMARY KEY,
+    monitoring_id SERIAL,
     monitoring_date DATE NOT NULL,
     location_code VARCHAR(100) NOT NULL,
     inspection_time VARCHAR(50) NOT NULL,
-    temperature INT NOT NULL
-);
+    temperature INT NOT NULL,
+    PRIMARY KEY (monitoring_id, monitoring_date)
+) PARTITION BY RANGE (monitoring_date);
 
 -- Step 4: New Table 16 – Warehouse Incident Reporting Log
 CREATE TABLE IF NOT EXISTS warehouse_incident_reporting_log (
@@ -156,19 +160,289 @@ CREATE TABLE IF NOT EXISTS warehouse_incident_reporting_log (
 );
 
 -- Step 5: Indexes
-CREATE INDEX idx_inbound_supplier ON inbound_log (supplier_id);
-CREATE INDEX idx_inbound_product ON inbound_log (product_id);
-CREATE INDEX idx_outbound_customer ON outbound_log (customer_id);
-CREATE INDEX idx_outbound_product ON outbound_log (product_id);
-CREATE INDEX idx_outbound_vehicle ON outbound_log (vehicle_no);
-CREATE INDEX idx_return_customer ON return_handling_log (customer_id);
-CREATE INDEX idx_return_order ON return_handling_log (order_id);
-CREATE INDEX idx_return_product ON return_handling_log (product_id);
-CREATE INDEX idx_ncr_vehicle ON vehicle_ncr_log (vehicle_no);
-CREATE INDEX idx_hygiene_vehicle ON vehicle_hygiene_inspection_log (vehicle_no);
-CREATE INDEX idx_inspection_delivery ON inbound_inspection_log (delivery_note_id);
-CREATE INDEX idx_inspection_product ON inbound_inspection_log (product_id);
-CREATE INDEX idx_complaint_customer ON complaint_handling_log (customer_id);
-CREATE INDEX idx_complaint_product ON complaint_handling_log (product_id);
-CREATE INDEX idx_cycle_product ON cycle_count_log (product_id);
-CREATE INDEX idx_disposal_product ON product_disposal_log (product_id);
+CREATE INDEX IF NOT EXISTS idx_inbound_supplier ON inbound_log (supplier_id);
+CREATE INDEX IF NOT EXISTS idx_inbound_product ON inbound_log (product_id);
+CREATE INDEX IF NOT EXISTS idx_outbound_order ON outbound_log (order_id);
+CREATE INDEX IF NOT EXISTS idx_outbound_customer ON outbound_log (customer_id);
+CREATE INDEX IF NOT EXISTS idx_outbound_product ON outbound_log (product_id);
+CREATE INDEX IF NOT EXISTS idx_outbound_vehicle ON outbound_log (vehicle_no);
+CREATE INDEX IF NOT EXISTS idx_return_customer ON return_handling_log (customer_id);
+CREATE INDEX IF NOT EXISTS idx_return_order ON return_handling_log (order_id);
+CREATE INDEX IF NOT EXISTS idx_return_product ON return_handling_log (product_id);
+CREATE INDEX IF NOT EXISTS idx_ncr_vehicle ON vehicle_ncr_log (vehicle_no);
+CREATE INDEX IF NOT EXISTS idx_hygiene_vehicle ON vehicle_hygiene_inspection_log (vehicle_no);
+CREATE INDEX IF NOT EXISTS idx_inspection_delivery ON inbound_inspection_log (delivery_note_id);
+CREATE INDEX IF NOT EXISTS idx_inspection_product ON inbound_inspection_log (product_id);
+CREATE INDEX IF NOT EXISTS idx_complaint_customer ON complaint_handling_log (customer_id);
+CREATE INDEX IF NOT EXISTS idx_complaint_product ON complaint_handling_log (product_id);
+CREATE INDEX IF NOT EXISTS idx_cycle_product ON cycle_count_log (product_id);
+CREATE INDEX IF NOT EXISTS idx_disposal_product ON product_disposal_log (product_id);
+
+-- Monthly partitions (<table>_yYYYYmMM) of the four large logs are created by
+-- the loader as new months arrive (src/partitions.py). BRIN indexes on the
+-- partition column keep date-range scans within a month cheap.
+CREATE INDEX IF NOT EXISTS brin_inbound_date ON inbound_log USING brin (inbound_date);
+CREATE INDEX IF NOT EXISTS brin_outbound_date ON outbound_log USING brin (outbound_date);
+CREATE INDEX IF NOT EXISTS brin_hygiene_date ON vehicle_hygiene_inspection_log USING brin (inspection_date);
+CREATE INDEX IF NOT EXISTS brin_temperature_date ON warehouse_temperature_monitoring_log USING brin (monitoring_date);
+
+-- Step 6: Load control tables (incremental loading, see src/data_loader.py)
+CREATE TABLE IF NOT EXISTS load_file_manifest (
+    csv_name VARCHAR(255) PRIMARY KEY,
+    file_size BIGINT NOT NULL,
+    file_mtime DOUBLE PRECISION NOT NULL,
+    content_hash VARCHAR(64) NOT NULL,
+    loaded_at TIMESTAMP NOT NULL DEFAULT now()
+);
+
+CREATE TABLE IF NOT EXISTS load_watermark (
+    table_name VARCHAR(255) PRIMARY KEY,
+    watermark_column VARCHAR(255) NOT NULL,
+    high_water_mark DATE NOT NULL,
+    updated_at TIMESTAMP NOT NULL DEFAULT now()
+);
+
+
+-- Step 7: Clean tables (the vw_* view rules applied at load time, see src/cleansing.py)
+CREATE TABLE IF NOT EXISTS clean_vehicle_details (
+    vehicle_no VARCHAR(255) PRIMARY KEY,
+    vehicle_capacity VARCHAR(50),
+    vehicle_cbm VARCHAR(10) NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS clean_supplier_details (
+    supplier_id VARCHAR(255) PRIMARY KEY,
+    country VARCHAR(100)
+);
+
+CREATE TABLE IF NOT EXISTS clean_customer_details (
+    customer_id VARCHAR(255) PRIMARY KEY,
+    customer_name VARCHAR(255)
+);
+
+CREATE TABLE IF NOT EXISTS clean_employee_details (
+    emp_id VARCHAR(255) PRIMARY KEY,
+    employee_name VARCHAR(255),
+    department VARCHAR(100),
+    designation VARCHAR(100),
+    emp_email VARCHAR(255),
+    date_of_birth DATE NOT NULL,
+    age INT,
+    years_to_retire INT
+);
+
+CREATE TABLE IF NOT EXISTS clean_product_details (
+    product_id VARCHAR(255) PRIMARY KEY,
+    product_name VARCHAR(255) NOT NULL,
+    delivery_note_id VARCHAR(255) NOT NULL,
+    supplier_id VARCHAR(255) NOT NULL,
+    system_qty INT NOT NULL,
+    product_cost DECIMAL(10, 2) NOT NULL,
+    product_price DECIMAL(10, 2) NOT NULL,
+    product_cbm DECIMAL(10, 2) NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS clean_inbound_log (
+    clean_id BIGSERIAL PRIMARY KEY,
+    inbound_date DATE NOT NULL,
+    supplier_id VARCHAR(255) NOT NULL,
+    delivery_note_id VARCHAR(255) NOT NULL,
+    product_id VARCHAR(255) NOT NULL,
+    received_qty INT NOT NULL,
+    rejected_qty INT NOT NULL,
+    inbound_status VARCHAR(50) NOT NULL,
+    reason_to_reject VARCHAR(255),
+    unloading_started_time TIME NOT NULL,
+    unloading_completed_time TIME NOT NULL,
+    putaway_completed_time TIME NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS clean_outbound_log (
+    outbound_date DATE NOT NULL,
+    customer_id VARCHAR(255) NOT NULL,
+    order_id VARCHAR(255) PRIMARY KEY,
+    product_id VARCHAR(255) NOT NULL,
+    ordered_qty INT NOT NULL,
+    picked_qty INT NOT NULL,
+    pick_failed_qty INT,
+    allocated_vehicle VARCHAR(255) NOT NULL,
+    pick_sheet_issued_time TIME NOT NULL,
+    pick_completed_time TIME NOT NULL,
+    loading_completed_time TIME NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS clean_return_handling_log (
+    clean_id BIGSERIAL PRIMARY KEY,
+    return_date DATE NOT NULL,
+    customer_id VARCHAR(255) NOT NULL,
+    order_id VARCHAR(255) NOT NULL,
+    product_id VARCHAR(255) NOT NULL,
+    return_reason VARCHAR(255) NOT NULL,
+    returned_qty INT NOT NULL,
+    unloading_started_time TIME NOT NULL,
+    putaway_completed_time TIME NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS clean_vehicle_ncr_log (
+    ncr_raised_date DATE NOT NULL,
+    ncr_id VARCHAR(255) PRIMARY KEY,
+    vehicle_no VARCHAR(255) NOT NULL,
+    ncr_reason VARCHAR(255) NOT NULL,
+    nc_severity VARCHAR(10),
+    ca_completed_date DATE NOT NULL,
+    ncr_status VARCHAR(50) NOT NULL,
+    days_to_complete INT
+);
+
+CREATE TABLE IF NOT EXISTS clean_vehicle_hygiene_inspection_log (
+    clean_id BIGSERIAL PRIMARY KEY,
+    inspection_date DATE NOT NULL,
+    vehicle_no VARCHAR(255) NOT NULL,
+    good_truckbox VARCHAR(50) NOT NULL,
+    good_truckfloor VARCHAR(50) NOT NULL,
+    good_truckdoor VARCHAR(50) NOT NULL,
+    good_curtain VARCHAR(50) NOT NULL,
+    good_cooling_unit VARCHAR(50) NOT NULL,
+    pest_check VARCHAR(50) NOT NULL,
+    odor_check VARCHAR(50) NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS clean_complaint_handling_log (
+    complaint_date DATE NOT NULL,
+    complaint_id VARCHAR(255) PRIMARY KEY,
+    customer_id VARCHAR(255) NOT NULL,
+    complaint_qty INT NOT NULL,
+    product_id VARCHAR(255) NOT NULL,
+    complaint_category VARCHAR(255),
+    complaint_status VARCHAR(50) NOT NULL,
+    resolution_completed_date DATE,
+    days_to_complete INT
+);
+
+CREATE TABLE IF NOT EXISTS clean_cycle_count_log (
+    clean_id BIGSERIAL PRIMARY KEY,
+    count_date DATE NOT NULL,
+    product_id VARCHAR(255) NOT NULL,
+    system_qty INT NOT NULL,
+    counted_qty INT NOT NULL,
+    adjusted_qty INT,
+    cycle_count_status VARCHAR(10) NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS clean_product_disposal_log (
+    clean_id BIGSERIAL PRIMARY KEY,
+    disposal_date DATE NOT NULL,
+    product_id VARCHAR(255) NOT NULL,
+    disposal_qty INT NOT NULL,
+    disposal_reason VARCHAR(255) NOT NULL,
+    qcm_approval VARCHAR(50) NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS clean_warehouse_temperature_monitoring_log (
+    clean_id BIGSERIAL PRIMARY KEY,
+    monitoring_date DATE NOT NULL,
+    location_code VARCHAR(100) NOT NULL,
+    inspection_time TIME,
+    temperature INT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS clean_warehouse_incident_reporting_log (
+    reporting_id VARCHAR(255) PRIMARY KEY,
+    reporting_date DATE NOT NULL,
+    operation_shift VARCHAR(50) NOT NULL,
+    no_of_incidents VARCHAR(10) NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_clean_inbound_date ON clean_inbound_log (inbound_date);
+CREATE INDEX IF NOT EXISTS idx_clean_outbound_date ON clean_outbound_log (outbound_date);
+CREATE INDEX IF NOT EXISTS idx_clean_return_date ON clean_return_handling_log (return_date);
+CREATE INDEX IF NOT EXISTS idx_clean_ncr_date ON clean_vehicle_ncr_log (ncr_raised_date);
+CREATE INDEX IF NOT EXISTS idx_clean_hygiene_date ON clean_vehicle_hygiene_inspection_log (inspection_date);
+CREATE INDEX IF NOT EXISTS idx_clean_complaint_date ON clean_complaint_handling_log (complaint_date);
+CREATE INDEX IF NOT EXISTS idx_clean_cycle_date ON clean_cycle_count_log (count_date);
+CREATE INDEX IF NOT EXISTS idx_clean_disposal_date ON clean_product_disposal_log (disposal_date);
+CREATE INDEX IF NOT EXISTS idx_clean_temperature_date ON clean_warehouse_temperature_monitoring_log (monitoring_date);
+CREATE INDEX IF NOT EXISTS idx_clean_incident_date ON clean_warehouse_incident_reporting_log (reporting_date);
+
+-- Step 8: Daily KPI rollups (kept current by the loader, see src/kpi_rollups.py)
+CREATE TABLE IF NOT EXISTS kpi_inbound_daily (
+    day DATE NOT NULL,
+    shift VARCHAR(20) NOT NULL,
+    supplier_id VARCHAR(255) NOT NULL,
+    inbounds INT NOT NULL,
+    received_qty BIGINT NOT NULL,
+    rejected_qty BIGINT NOT NULL,
+    received_cbm NUMERIC(18, 2) NOT NULL,
+    received_value NUMERIC(18, 2) NOT NULL,
+    cycle_seconds BIGINT NOT NULL,
+    on_time_putaways INT NOT NULL,
+    PRIMARY KEY (day, shift, supplier_id)
+);
+
+CREATE TABLE IF NOT EXISTS kpi_outbound_daily (
+    day DATE NOT NULL,
+    shift VARCHAR(20) NOT NULL,
+    customer_id VARCHAR(255) NOT NULL,
+    orders INT NOT NULL,
+    ordered_qty BIGINT NOT NULL,
+    picked_qty BIGINT NOT NULL,
+    failed_qty BIGINT NOT NULL,
+    dispatched_cbm NUMERIC(18, 2) NOT NULL,
+    dispatched_value NUMERIC(18, 2) NOT NULL,
+    revenue NUMERIC(18, 2) NOT NULL,
+    lost_gp NUMERIC(18, 2) NOT NULL,
+    pick_seconds BIGINT NOT NULL,
+    loading_seconds BIGINT NOT NULL,
+    on_time_dispatches INT NOT NULL,
+    PRIMARY KEY (day, shift, customer_id)
+);
+
+CREATE TABLE IF NOT EXISTS kpi_returns_daily (
+    day DATE NOT NULL,
+    shift VARCHAR(20) NOT NULL,
+    customer_id VARCHAR(255) NOT NULL,
+    return_reason VARCHAR(255) NOT NULL,
+    returns INT NOT NULL,
+    returned_qty BIGINT NOT NULL,
+    returned_value NUMERIC(18, 2) NOT NULL,
+    cycle_seconds BIGINT NOT NULL,
+    on_time_putaways INT NOT NULL,
+    PRIMARY KEY (day, shift, customer_id, return_reason)
+);
+
+CREATE TABLE IF NOT EXISTS kpi_failed_picks_daily (
+    day DATE NOT NULL,
+    product_id VARCHAR(255) NOT NULL,
+    failed_picks INT NOT NULL,
+    failed_qty BIGINT NOT NULL,
+    lost_gp NUMERIC(18, 2) NOT NULL,
+    PRIMARY KEY (day, product_id)
+);
+
+CREATE TABLE IF NOT EXISTS kpi_vehicle_daily (
+    day DATE NOT NULL,
+    vehicle_no VARCHAR(255) NOT NULL,
+    loads INT NOT NULL,
+    loaded_cbm NUMERIC(18, 2) NOT NULL,
+    capacity_cbm NUMERIC(10, 2) NOT NULL,
+    PRIMARY KEY (day, vehicle_no)
+);
+
+CREATE INDEX IF NOT EXISTS idx_clean_inbound_product ON clean_inbound_log (product_id);
+CREATE INDEX IF NOT EXISTS idx_clean_outbound_product ON clean_outbound_log (product_id);
+CREATE INDEX IF NOT EXISTS idx_clean_outbound_vehicle ON clean_outbound_log (allocated_vehicle);
+CREATE INDEX IF NOT EXISTS idx_clean_return_product ON clean_return_handling_log (product_id);
+
+-- Step 9: Hourly temperature aggregates written by the telemetry stream (src/telemetry.py)
+CREATE TABLE IF NOT EXISTS warehouse_temperature_hourly (
+    location_code VARCHAR(100) NOT NULL,
+    reading_hour TIMESTAMP NOT NULL,
+    reading_count INT NOT NULL,
+    min_temperature DOUBLE PRECISION,
+    max_temperature DOUBLE PRECISION,
+    sum_temperature DOUBLE PRECISION,
+    avg_temperature DOUBLE PRECISION GENERATED ALWAYS AS (sum_temperature / NULLIF(reading_count, 0)) STORED,
+    excursion_readings INT NOT NULL,
+    PRIMARY KEY (location_code, reading_hour)
+);
+CREATE INDEX IF NOT EXISTS idx_temperature_hourly_hour ON warehouse_temperature_hourly (reading_hour);
@@ -11,8 +11,7 @@ select
 		when vd.vehicle_capacity = '12 ton' then '60'
 		else '75'
 	end as vehicle_cbm
-from vehicle_details vd
-order by vehicle_no;
+from vehicle_details vd;
 
 --	Table 02 - Supplier details
 CREATE OR REPLACE VIEW vw_supplier_details AS
@@ -49,8 +48,7 @@ select
 	REGEXP_REPLACE(
         cd.customer_name, '([a-z])([A-Z])', '\1 \2', 'g'
     ) AS customer_name
-from customer_details cd
-ORDER BY customer_id;
+from customer_details cd;
 
 -- Table 04 - Employee details
 CREATE OR REPLACE VIEW vw_employee_details AS
@@ -95,8 +93,7 @@ select
 	(60 - e.age) as years_to_retire
 from employee_details ed
 inner join
-	employee e on ed.emp_id = e.emp_id
-order by emp_id;
+	employee e on ed.emp_id = e.emp_id;
 	
 -- Table 05 - Product details
 CREATE OR REPLACE VIEW vw_product_details AS
@@ -109,8 +106,7 @@ select
     coalesce(cast(product_cost as decimal(10,2)), 0) as product_cost,
     coalesce(cast(product_price as decimal(10,2)), 0) as product_price,
     coalesce(cast(product_carton_volume_cbm as decimal(10,2)), 0) as product_cbm
-from product_details
-order by product_id;
+from product_details;
 
 -- Table 06 - Inbound log
 CREATE OR REPLACE VIEW vw_inbound_log AS
@@ -123,14 +119,13 @@ select
 	coalesce(il.rejected_qty, -999) rejected_qty,
 	coalesce(nullif(trim(il.inbound_status), ''), 'missing') inbound_status,
 	case
-		when il.rejected_reason = 'NaN' then 'Accepted'
+		when il.rejected_reason = 'NaN' or il.rejected_reason is null then 'Accepted'
 		else rejected_reason
 	end as reason_to_reject,	
 	COALESCE(il.unloading_started_time::time, TIME '00:00:00') unloading_started_time,
 	COALESCE(il.unloading_completed_time::time, TIME '00:00:00') unloading_completed_time,
 	COALESCE(inbound_putaway_completed_time::time, TIME '00:00:00') putaway_completed_time
-from inbound_log il
-order by inbound_date;
+from inbound_log il;
 
 -- Table 07 - Outbound_log
 CREATE OR REPLACE VIEW vw_outbound_log AS
@@ -146,8 +141,7 @@ select
 	coalesce(ol.pick_sheet_issued_time::time, time '00:00:00') pick_sheet_issued_time,
 	coalesce(ol.pick_completed_time::time, time '00:00:00') pick_completed_time,
 	coalesce(ol.loading_completed_time::time, time '00:00:00') loading_completed_time
-from outbound_log ol
-order by outbound_date;
+from outbound_log ol;
 
 -- Table 08 - Return handling log
 CREATE OR REPLACE VIEW vw_return_handling_log AS
@@ -160,8 +154,7 @@ select
 	coalesce(returned_qty, -999) returned_qty,
 	coalesce(return_unloading_started_time::time, time '00:00:00') unloading_started_time,
 	coalesce(return_putaway_completed_time::time, time '00:00:00') putaway_completed_time
-FROM return_handling_log rhl
-order by return_date;
+FROM return_handling_log rhl;
 
 -- Table 09 - Inbound inspection log -> Will be derived from inbound log
 
@@ -182,13 +175,12 @@ select
 		when vnl.ncr_status = 'CA completed' then vnl.ca_completed_date - vnl.ncr_raised_date
 		else null
 	end as days_to_complete
-from vehicle_ncr_log vnl
-order by ncr_raised_date;
+from vehicle_ncr_log vnl;
 
 -- Table 11 - Vehicle hygiene inspection log
 CREATE OR REPLACE VIEW vw_vehicle_hygiene_inspection_log AS
 select
-	coalesce(inspection_date, date '1900-01-01'),
+	coalesce(inspection_date, date '1900-01-01') inspection_date,
 	coalesce(nullif(trim(vehicle_no),''),'mising') vehicle_no,
 	coalesce(nullif(trim(good_truckbox),''),'mising') good_truckbox,
 	coalesce(nullif(trim(good_truckfloor),''),'mising') good_truckfloor,
@@ -198,10 +190,9 @@ select
 	coalesce(nullif(trim(pest_check),''),'mising') pest_check,
 	coalesce(nullif(trim(odor_check),''),'mising') odor_check
 from
-	vehicle_hygiene_inspection_log vhil
-order by inspection_date
+	vehicle_hygiene_inspection_log vhil;
 
-	Table 12 - Complaint handling log
+-- Table 12 - Complaint handling log
 CREATE OR REPLACE VIEW vw_complaint_handling_log AS
 Select 
 	coalesce(complaint_date, date '1900-01-01') complaint_date,
@@ -220,8 +211,7 @@ Select
 		when complaint_status = 'Resolved' then resolution_completed_date - complaint_date
 		else null
 	end as days_to_complete
-from complaint_handling_log chl
-order by complaint_date;
+from complaint_handling_log chl;
 
 -- Table 13 - Cycle count log
 CREATE OR REPLACE VIEW vw_cycle_count_log AS
@@ -243,8 +233,7 @@ Select
 	end as cycle_count_status
 from cycle_count_log ccl
 inner join
-	na_qty n on ccl.cycle_count_id = n.cycle_count_id
-order by count_date;
+	na_qty n on ccl.cycle_count_id = n.cycle_count_id;
 
 -- Table 14 - Product disposal log
 CREATE OR REPLACE VIEW vw_product_disposal_log AS
@@ -254,11 +243,10 @@ Select
 	coalesce(pdl.disposal_qty, -999) disposal_qty,
 	coalesce(nullif(trim(pdl.disposal_reason),''),'mising') disposal_reason,
 	coalesce(nullif(trim(pdl.qcm_approval),''),'mising') qcm_approval
-from product_disposal_log pdl
-order by disposal_date;
+from product_disposal_log pdl;
 
 -- Table 15 – Warehouse temperature monitoring log
-CREATE OR REPLACE VIEW public.vw_warehouse_temperature_monitoring_log
+CREATE OR REPLACE VIEW public.vw_warehouse_temperature_monitoring_log AS
 select
     coalesce(wtml.monitoring_date, date '1900-01-01')::date as monitoring_date,
     coalesce(nullif(trim(wtml.location_code),''), 'missing') as location_code,
@@ -271,8 +259,7 @@ select
         ELSE NULL::TIME
     END AS inspection_time,
     coalesce(wtml.temperature, -999) as temperature
-FROM warehouse_temperature_monitoring_log wtml
-order by monitoring_date;
+FROM warehouse_temperature_monitoring_log wtml;
 
 -- Table 16 – Warehouse incident reporting log
 CREATE OR REPLACE VIEW public.vw_warehouse_incident_reporting_log
@@ -280,5 +267,4 @@ AS SELECT reporting_id,
     COALESCE(reporting_date, '1900-01-01'::date) AS reporting_date,
     COALESCE(NULLIF(TRIM(BOTH FROM operation_shift), ''::text), 'missing'::text) AS operation_shift,
     COALESCE(NULLIF(TRIM(BOTH FROM no_of_incidents), ''::text), 'missing'::text) AS no_of_incidents
-   FROM warehouse_incident_reporting_log
-  ORDER BY (COALESCE(reporting_date, '1900-01-01'::date));
\ No newline at end of file
+   FROM warehouse_incident_reporting_log;
\ No newline at end of file
@@ -0,0 +1,362 @@
+import os
+import sys
+import json
+import time
+import shutil
+import inspect
+import logging
+import platform
+import tempfile
+import multiprocessing
+from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+# ------------------------------
+# Benchmark Suite
+# ------------------------------
+# Runs every generate_* function in data_generator.py and load_table from
+# data_loader.py at fixed scale tiers (multiples of the default row counts).
+# Each case runs in a fresh process, so its peak RSS is its own.
+# Per case it records rows/sec, peak RSS and output size (file bytes for
+# generation, table + index bytes for loads).
+# Results are saved as JSON and compared with a committed baseline.
+#
+#   python benchmark.py                         # run, compare, exit 1 on regressions
+#   WIAP_BENCH_UPDATE=1 python benchmark.py     # run and store as the new baseline
+#
+# Names come from the stub LLM backend, so no model server is needed.
+# Loads go to WIAP_DB_URL's server when it is set (into throwaway wiap_bench_* databases).
+# Otherwise they use an embedded PostgreSQL from the `pgserver` package.
+# With neither, only generation is measured.
+
+ROOT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+SCHEMA_FILE = os.path.join(ROOT_DIR, "sql", "schema.sql")
+
+TIERS = [float(tier) for tier in os.environ.get("WIAP_BENCH_TIERS", "1,10,100").split(",")]
+BASELINE_FILE = os.environ.get("WIAP_BENCH_BASELINE", os.path.join(ROOT_DIR, "benchmarks", "baseline.json"))
+RESULTS_FILE = os.environ.get("WIAP_BENCH_RESULTS", "benchmark_results.json")
+# Relative change that counts as a regression (0.25 -> 25% fewer rows/sec, or 25% more RSS/output)
+THRESHOLD = float(os.environ.get("WIAP_BENCH_THRESHOLD", 0.25))
+# Cases faster than this are too noisy to compare on rows/sec
+MIN_SECONDS = 0.05
+UPDATE_BASELINE = os.environ.get("WIAP_BENCH_UPDATE", "0") == "1"
+RUN_LOADS = os.environ.get("WIAP_BENCH_LOAD", "1") == "1"
+# Keep generated files and the embedded database here instead of a temp dir
+WORK_DIR = os.environ.get("WIAP_BENCH_DIR")
+SEED = int(os.environ.get("WIAP_SEED", 42))
+# Generator backends to measure; loads read the files of the first one
+BACKENDS = os.environ.get("WIAP_BENCH_BACKENDS", os.environ.get("WIAP_GENERATOR_BACKEND", "numpy,python")).split(",")
+
+# Same order as generate_all_tables; each name is the output file and generate_<name> its function
+GENERATE_TABLES = [
+    'vehicle_details', 'supplier_details', 'customer_details', 'employee_details', 'product_details',
+    'inbound_log', 'outbound_log', 'return_handling_log', 'vehicle_ncr_log', 'vehicle_hygiene_log',
+    'inbound_inspection_log', 'complaint_handling_log', 'cycle_count_log', 'product_disposal_log',
+    'warehouse_incident_reporting_log', 'warehouse_temperature_monitoring_log',
+]
+
+# Compared metric -> direction that is worse
+METRICS = {"rows_per_sec": "lower", "peak_rss_mb": "higher", "output_bytes": "higher"}
+
+
+# ------------------------------
+# Measurement Helpers
+# ------------------------------
+def reset_peak_rss():
+    # Linux: writing 5 to clear_refs resets VmHWM, so setup work is not counted
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+    except OSError:
+        pass
+
+
+def peak_rss_mb():
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    import resource
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Bytes on macOS, kilobytes elsewhere
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def path_size(path):
+    if os.path.isdir(path):
+        return sum(os.path.getsize(os.path.join(root, name)) for root, _, names in os.walk(path) for name in names)
+    return os.path.getsize(path)
+
+
+def tier_label(scale):
+    return f"{scale:g}x"
+
+
+def run_isolated(fn, *args):
+    # One fresh interpreter per case; spawn so nothing is inherited from the parent's heap
+    with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as pool:
+        try:
+            return pool.submit(fn, *args).result()
+        except Exception as e:
+            return {"error": f"{type(e).__name__}: {e}"}
+
+
+# ------------------------------
+# Generation Cases
+# ------------------------------
+def generate_case(table, scale, output_dir, backend):
+    # Runs in a worker process
+    os.environ.setdefault("WIAP_LLM_BACKEND", "stub")
+    os.environ["WIAP_LLM_CACHE"] = os.path.join(output_dir, "llm_cache.sqlite")
+    import data_generator
+    from generation_scheduler import INPUT_TABLES
+    logging.getLogger().setLevel(logging.WARNING)
+
+    data_generator.set_backend(backend, SEED)
+    row_counts = data_generator.scaled_row_counts(scale)
+    frames = {}
+
+    def build(name):
+        # Inputs are rebuilt in the same order with the same seed, so they match the files of their own cases
+        if name not in frames:
+            generate = getattr(data_generator, f"generate_{name}")
+            frames[name] = generate(**arguments(generate, name))
+        return frames[name]
+
+    def arguments(generate, name):
+        params = inspect.signature(generate).parameters
+        kwargs = {param: build(INPUT_TABLES[param]) for param in params if param in INPUT_TABLES}
+        # Dimension tables keep their fixed sizes; log tables scale with the tier
+        if 'num_rows' in params and name in row_counts:
+            kwargs['num_rows'] = row_counts[name]
+        return kwargs
+
+    # Dimension tables come first in every case, in generate_dimension_tables order
+    for name in GENERATE_TABLES[:5]:
+        if name == table:
+            break
+        build(name)
+    generate = getattr(data_generator, f"generate_{table}")
+    kwargs = arguments(generate, table)
+
+    reset_peak_rss()
+    start_time = time.perf_counter()
+    df = generate(**kwargs)
+    seconds = time.perf_counter() - start_time
+
+    write_start = time.perf_counter()
+    data_generator.save_tables([(table, df)], output_dir)
+    write_seconds = time.perf_counter() - write_start
+    output_path = os.path.join(output_dir, f"{table}.csv")
+    if data_generator.OUTPUT_FORMAT == "parquet":
+        import columnar
+        output_path = columnar.dataset_path(table, output_dir)
+
+    return {
+        "rows": len(df),
+        "seconds": round(seconds, 4),
+        "rows_per_sec": round(len(df) / max(seconds, 1e-9), 1),
+        "write_seconds": round(write_seconds, 4),
+        "peak_rss_mb": round(peak_rss_mb(), 1),
+        "output_bytes": path_size(output_path),
+    }
+
+
+# ------------------------------
+# Load Cases
+# ------------------------------
+def bench_server(work_dir):
+    from sqlalchemy.engine import make_url
+
+    if os.environ.get("WIAP_DB_URL"):
+        return make_url(os.environ["WIAP_DB_URL"]), None
+    try:
+        import pgserver
+    except ImportError:
+        logger.warning("No WIAP_DB_URL and pgserver is not installed - skipping load benchmarks")
+        return None, None
+    logging.getLogger("pgserver").setLevel(logging.WARNING)
+    server = pgserver.get_server(os.path.join(work_dir, "pgdata"), cleanup_mode="stop")
+    return make_url(server.get_uri("postgres")).set(drivername="postgresql+psycopg2"), server
+
+
+def create_bench_database(server_url, tier):
+    from sqlalchemy import create_engine
+
+    name = f"wiap_bench_{tier.replace('.', '_')}"
+    admin = create_engine(server_url.set(database="postgres"), isolation_level="AUTOCOMMIT")
+    with admin.connect() as conn:
+        conn.exec_driver_sql(f"DROP DATABASE IF EXISTS {name}")
+        conn.exec_driver_sql(f"CREATE DATABASE {name}")
+    admin.dispose()
+
+    url = server_url.set(database=name)
+    engine = create_engine(url)
+    with open(SCHEMA_FILE) as f, engine.begin() as conn:
+        conn.exec_driver_sql(f.read())
+    engine.dispose()
+    return url.render_as_string(hide_password=False)
+
+
+def load_case(csv_name, table_name, conflict_key, csv_dir, db_url):
+    # Runs in a worker process; data_loader reads its config at import
+    os.environ["WIAP_CSV_DIR"] = csv_dir
+    os.environ["WIAP_DB_URL"] = db_url
+    os.environ["WIAP_INCREMENTAL"] = "0"
+    # Raw load only, comparable with the baseline; WIAP_CLEANSE=1 includes the clean_* tables
+    # and WIAP_VALIDATE=1 the foreign key check
+    os.environ.setdefault("WIAP_CLEANSE", "0")
+    os.environ.setdefault("WIAP_VALIDATE", "0")
+    os.chdir(csv_dir)
+    import data_loader
+    from sqlalchemy import text
+
+    reset_peak_rss()
+    start_time = time.perf_counter()
+    rows = data_loader.load_table(csv_name, table_name, conflict_key)
+    seconds = time.perf_counter() - start_time
+    if rows is None:
+        raise RuntimeError(f"load_table failed for {table_name}, see loader.log")
+
+    with data_loader.engine.connect() as conn:
+        # Partitioned tables hold no data themselves: sum over their partitions
+        output_bytes = conn.execute(text("""
+            SELECT coalesce((SELECT sum(pg_total_relation_size(relid))::bigint FROM pg_partition_tree(:t)),
+                            pg_total_relation_size(:t))
+        """), {"t": table_name}).scalar()
+    return {
+        "rows": rows,
+        "seconds": round(seconds, 4),
+        "rows_per_sec": round(rows / max(seconds, 1e-9), 1),
+        "peak_rss_mb": round(peak_rss_mb(), 1),
+        "output_bytes": output_bytes,
+    }
+
+
+# ------------------------------
+# Baselines
+# ------------------------------
+def environment():
+    return {
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "generator_backends": BACKENDS,
+        "output_format": os.environ.get("WIAP_OUTPUT_FORMAT", "csv"),
+        "load_method": os.environ.get("WIAP_LOAD_METHOD", "copy"),
+        "seed": SEED,
+        "tiers": [tier_label(scale) for scale in TIERS],
+    }
+
+
+def compare(results, baseline, threshold=THRESHOLD):
+    regressions = []
+    for case, current in results.items():
+        previous = baseline.get(case)
+        if not previous or "error" in current or "error" in previous or current["rows"] != previous["rows"]:
+            continue
+        for metric, worse in METRICS.items():
+            if metric == "rows_per_sec" and min(current["seconds"], previous["seconds"]) < MIN_SECONDS:
+                continue
+            before, after = previous.get(metric), current.get(metric)
+            if not before or after is None:
+                continue
+            change = (after - before) / before
+            if (change < -threshold) if worse == "lower" else (change > threshold):
+                regressions.append((case, metric, before, after, change))
+    return regressions
+
+
+def report(results):
+    logger.info(f"{'case':<50} {'rows':>10} {'rows/sec':>12} {'peak MB':>9} {'output MB':>10}")
+    for case, result in results.items():
+        if "error" in result:
+            logger.info(f"{case:<50} ERROR {result['error']}")
+            continue
+        logger.info(f"{case:<50} {result['rows']:>10} {result['rows_per_sec']:>12,.0f} "
+                    f"{result['peak_rss_mb']:>9.1f} {result['output_bytes'] / 1e6:>10.2f}")
+
+
+# ------------------------------
+# Main
+# ------------------------------
+def run(work_dir):
+    os.environ.setdefault("WIAP_LLM_BACKEND", "stub")
+    results = {}
+    server_url, server = bench_server(work_dir) if RUN_LOADS else (None, None)
+    if server_url is not None:
+        os.environ.setdefault("WIAP_DB_URL", server_url.render_as_string(hide_password=False))
+        from data_loader import LOAD_SEQUENCE
+
+    for scale in TIERS:
+        tier = tier_label(scale)
+        tier_dir = os.path.join(work_dir, tier)
+        for backend in BACKENDS:
+            output_dir = os.path.join(tier_dir, backend)
+            os.makedirs(output_dir, exist_ok=True)
+            for table in GENERATE_TABLES:
+                case = f"generate/{backend}/{table}@{tier}"
+                results[case] = result = run_isolated(generate_case, table, scale, output_dir, backend)
+                logger.info(f"{case}: {result}")
+
+        if server_url is not None:
+            db_url = create_bench_database(server_url, tier)
+            csv_dir = os.path.join(tier_dir, BACKENDS[0])
+            for csv_name, table_name, key in LOAD_SEQUENCE:
+                if not os.path.exists(os.path.join(csv_dir, csv_name)):
+                    continue
+                results[f"load/{table_name}@{tier}"] = result = run_isolated(
+                    load_case, csv_name, table_name, key, csv_dir, db_url)
+                logger.info(f"load/{table_name}@{tier}: {result}")
+        if not WORK_DIR:
+            shutil.rmtree(tier_dir)
+    if server is not None:
+        server.cleanup()
+    return results
+
+
+def main():
+    logging.basicConfig(level=logging.INFO)
+    work_dir = WORK_DIR or tempfile.mkdtemp(prefix="wiap_bench_")
+    os.makedirs(work_dir, exist_ok=True)
+    try:
+        results = run(work_dir)
+    finally:
+        if not WORK_DIR:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    report(results)
+    with open(RESULTS_FILE, "w") as f:
+        json.dump({"environment": environment(), "results": results}, f, indent=2)
+    logger.info(f"Saved results to {RESULTS_FILE}")
+
+    if UPDATE_BASELINE:
+        os.makedirs(os.path.dirname(os.path.abspath(BASELINE_FILE)), exist_ok=True)
+        with open(BASELINE_FILE, "w") as f:
+            json.dump({"environment": environment(), "results": results}, f, indent=2)
+        logger.info(f"Updated baseline {BASELINE_FILE}")
+        return 0
+
+    if not os.path.exists(BASELINE_FILE):
+        logger.warning(f"No baseline at {BASELINE_FILE}; run with WIAP_BENCH_UPDATE=1 to create one")
+        return 0
+    with open(BASELINE_FILE) as f:
+        baseline = json.load(f)["results"]
+    regressions = compare(results, baseline)
+    for case, metric, before, after, change in regressions:
+        logger.warning(f"⚠️ REGRESSION {case} {metric}: {before:,.1f} -> {after:,.1f} ({change:+.0%})")
+    if regressions:
+        logger.warning(f"{len(regressions)} regressions beyond {THRESHOLD:.0%}")
+        return 1
+    logger.info(f"No regressions beyond {THRESHOLD:.0%} against {BASELINE_FILE}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
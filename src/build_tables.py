@@ -0,0 +1,315 @@
+import os
+import ast
+import sys
+import argparse
+import json
+import time
+import hashlib
+import inspect
+
+# ------------------------------
+# Selective Table Builds
+# ------------------------------
+# `python build_tables.py [table ...]` rebuilds only the tables that changed.
+# Each table gets a build key, hashed from:
+#   - the code that generates it: the generate_<table> function in
+#     data_generator.py plus every function/constant it reaches there and in
+#     vectorized_generator.py (read with ast, so comments and formatting don't count)
+#   - its parameters: seed, backend, row count, and the LLM backend for the
+#     tables with LLM-generated names
+#   - the keys of the tables it reads (INPUT_TABLES), so a change upstream
+#     rebuilds everything below it
+# Keys are recorded per output directory in build_manifest.json, and a table
+# whose key and output file are unchanged is skipped. Tables that other tables
+# read (the dimensions, inbound_log, outbound_log) are also kept as artifacts
+# in WIAP_ARTIFACT_DIR, named by key, so a downstream rebuild, another output
+# directory or a switch back to an earlier seed reads them instead of calling
+# the LLM again.
+#
+# Every table draws from its own random streams (data_generator.seed_table),
+# so a table built alone equals the same table from a full build.
+#
+# Planning only needs the standard library; pandas, NumPy and the generators
+# are imported once something has to be built.
+
+SRC_DIR = os.path.dirname(os.path.abspath(__file__))
+SOURCE_MODULES = ("data_generator", "vectorized_generator")
+ARTIFACT_DIR = os.environ.get("WIAP_ARTIFACT_DIR", "build_cache")
+MANIFEST_NAME = "build_manifest.json"
+
+# Build order: every table comes after the tables it reads
+TABLES = [
+    'vehicle_details', 'supplier_details', 'customer_details', 'employee_details', 'product_details',
+    'inbound_log', 'outbound_log', 'return_handling_log', 'vehicle_ncr_log', 'vehicle_hygiene_log',
+    'inbound_inspection_log', 'complaint_handling_log', 'cycle_count_log', 'product_disposal_log',
+    'warehouse_incident_reporting_log', 'warehouse_temperature_monitoring_log',
+]
+
+# Generator argument name -> table it reads
+INPUT_TABLES = {
+    'vehicle_df': 'vehicle_details',
+    'supplier_df': 'supplier_details',
+    'customer_df': 'customer_details',
+    'product_df': 'product_details',
+    'outbound_log_df': 'outbound_log',
+    'inbound_log_df': 'inbound_log',
+}
+
+LLM_FUNCTION = ("data_generator", "generate_with_ollama_cached")
+# Same as data_generator.BACKENDS, without importing pandas to plan
+BACKENDS = ("python", "numpy")
+
+
+# ------------------------------
+# Code Fingerprints
+# ------------------------------
+def module_definitions(modules=SOURCE_MODULES):
+    # (module, name) -> top-level function, class or assignment node
+    definitions = {}
+    for module in modules:
+        with open(os.path.join(SRC_DIR, f"{module}.py")) as f:
+            tree = ast.parse(f.read())
+        for node in tree.body:
+            if isinstance(node, (ast.FunctionDef, ast.ClassDef)):
+                definitions[(module, node.name)] = node
+            elif isinstance(node, (ast.Assign, ast.AnnAssign)):
+                for target in (node.targets if isinstance(node, ast.Assign) else [node.target]):
+                    if isinstance(target, ast.Name):
+                        definitions[(module, target.id)] = node
+    return definitions
+
+
+def reachable(definitions, start):
+    # Definitions used by `start`, directly or through other definitions
+    seen, stack = set(), [start]
+    while stack:
+        key = stack.pop()
+        if key in seen or key not in definitions:
+            continue
+        seen.add(key)
+        for node in ast.walk(definitions[key]):
+            if isinstance(node, ast.Name):
+                stack.append((key[0], node.id))
+            elif isinstance(node, ast.Attribute) and isinstance(node.value, ast.Name) and node.value.id in SOURCE_MODULES:
+                stack.append((node.value.id, node.attr))
+    return seen
+
+
+def code_fingerprint(definitions, keys):
+    digest = hashlib.sha256()
+    for key in sorted(keys):
+        digest.update(f"{key[0]}.{key[1]}\n{ast.dump(definitions[key])}\n".encode())
+    return digest.hexdigest()
+
+
+# ------------------------------
+# Build Plan
+# ------------------------------
+def row_counts(definitions, scale):
+    # Same scaling as data_generator.scaled_row_counts, read from the source
+    counts = ast.literal_eval(definitions[("data_generator", "LOG_ROW_COUNTS")].value)
+    return {table: max(1, int(rows * scale)) for table, rows in counts.items()}
+
+
+def plan(seed, backend, scale, llm_backend):
+    # table -> {"key", "inputs", "params"}, in build order
+    definitions = module_definitions()
+    counts = row_counts(definitions, scale)
+    tables = {}
+    for table in TABLES:
+        function = definitions[("data_generator", f"generate_{table}")]
+        args = [arg.arg for arg in function.args.args]
+        inputs = [INPUT_TABLES[arg] for arg in args if arg in INPUT_TABLES]
+        used = reachable(definitions, ("data_generator", function.name))
+        params = {"seed": seed}
+        if "backend" in args:
+            params["backend"] = backend
+        if "num_rows" in args and table in counts:
+            params["num_rows"] = counts[table]
+        if LLM_FUNCTION in used:
+            params["llm_backend"] = llm_backend
+        key_source = {"table": table, "params": params, "code": code_fingerprint(definitions, used),
+                      "inputs": {name: tables[name]["key"] for name in inputs}}
+        key = hashlib.sha256(json.dumps(key_source, sort_keys=True).encode()).hexdigest()[:16]
+        tables[table] = {"key": key, "inputs": inputs, "params": params}
+    return tables
+
+
+def dependents(tables):
+    return {name for info in tables.values() for name in info["inputs"]}
+
+
+def artifact_path(table, key, artifact_dir=None):
+    return os.path.join(artifact_dir or ARTIFACT_DIR, f"{table}-{key}.pkl")
+
+
+def output_mtime(table, output_dir, output_format):
+    # None when the table has no output in `output_dir` yet
+    if output_format == "parquet":
+        # A month-partitioned dataset directory or a single file (see columnar.dataset_path)
+        paths = [os.path.join(output_dir, table), os.path.join(output_dir, f"{table}.parquet")]
+    else:
+        paths = [os.path.join(output_dir, f"{table}.csv")]
+    return next((os.stat(path).st_mtime_ns for path in paths if os.path.exists(path)), None)
+
+
+def read_manifest(output_dir):
+    path = os.path.join(output_dir, MANIFEST_NAME)
+    if not os.path.exists(path):
+        return {"tables": {}}
+    with open(path) as f:
+        return json.load(f)
+
+
+def write_manifest(output_dir, manifest):
+    path = os.path.join(output_dir, MANIFEST_NAME)
+    with open(path + ".tmp", "w") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(path + ".tmp", path)
+
+
+def stale_reason(table, info, manifest, output_dir, output_format):
+    entry = manifest["tables"].get(table)
+    if entry is None:
+        return "not built"
+    if entry["key"] != info["key"]:
+        return "changed"
+    mtime = output_mtime(table, output_dir, output_format)
+    if entry.get("format") != output_format or mtime is None:
+        return "output missing"
+    if mtime != entry.get("mtime"):
+        # Written by something else since, e.g. a full data_generator.py run
+        return "output replaced"
+    return None
+
+
+def select(tables, names, manifest, output_dir, output_format, force=False):
+    # -> {table: reason} for the tables to write, in build order. Tables read by
+    # a rebuilt table are added when neither this run nor the artifact cache has them.
+    reasons = {}
+    for table in names:
+        reason = "forced" if force else stale_reason(table, tables[table], manifest, output_dir, output_format)
+        if reason:
+            reasons[table] = reason
+    for table in reversed(TABLES):
+        if table not in reasons:
+            continue
+        for name in tables[table]["inputs"]:
+            if name not in reasons and not os.path.exists(artifact_path(name, tables[name]["key"])):
+                reasons[name] = f"needed by {table}"
+    return {table: reasons[table] for table in TABLES if table in reasons}
+
+
+# ------------------------------
+# Build
+# ------------------------------
+def build(tables, reasons, output_dir, seed, backend, output_format):
+    import pandas as pd
+    import data_generator
+
+    data_generator.set_backend(backend, seed)
+    keep = dependents(tables)
+    frames = {}
+
+    def frame(table):
+        if table not in frames:
+            frames[table] = pd.read_pickle(artifact_path(table, tables[table]["key"]))
+        return frames[table]
+
+    manifest = read_manifest(output_dir)
+    manifest.update(seed=seed, backend=backend)
+    for table, reason in reasons.items():
+        info = tables[table]
+        artifact = artifact_path(table, info["key"])
+        start = time.time()
+        # A forced table is generated again even when its artifact exists
+        if os.path.exists(artifact) and reason != "forced":
+            df = frame(table)
+            source = "artifact"
+        else:
+            generate = getattr(data_generator, f"generate_{table}")
+            args = inspect.signature(generate).parameters
+            kwargs = {name: frame(INPUT_TABLES[name]) for name in args if name in INPUT_TABLES}
+            kwargs.update({name: value for name, value in info["params"].items() if name in args})
+            data_generator.seed_table(table, seed)
+            df = frames[table] = data_generator.timed_generate(table, generate, **kwargs)
+            source = "generated"
+            if table in keep:
+                os.makedirs(ARTIFACT_DIR, exist_ok=True)
+                df.to_pickle(artifact + ".tmp")
+                os.replace(artifact + ".tmp", artifact)
+        data_generator.save_tables([(table, df)], output_dir, output_format)
+        manifest["tables"][table] = {"key": info["key"], "rows": len(df), "format": output_format,
+                                     "mtime": output_mtime(table, output_dir, output_format),
+                                     "built_at": time.strftime("%Y-%m-%d %H:%M:%S")}
+        write_manifest(output_dir, manifest)
+        print(f"{table:<38} {reason:<28} {source} in {time.time() - start:.2f}s ({len(df):,} rows)")
+
+
+def positive_float(value):
+    scale = float(value)
+    if not scale > 0:
+        raise argparse.ArgumentTypeError(f"must be greater than 0, got {value}")
+    return scale
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description="Rebuild only the warehouse tables that changed.")
+    parser.add_argument("tables", nargs="*", metavar="table", help="tables to build (default: all)")
+    parser.add_argument("--seed", type=int, default=os.environ.get("WIAP_SEED"),
+                        help="random seed (default: WIAP_SEED, else the seed the output directory was built with)")
+    parser.add_argument("--backend", choices=BACKENDS, default=os.environ.get("WIAP_GENERATOR_BACKEND", "python"))
+    parser.add_argument("--scale", type=positive_float, default=os.environ.get("WIAP_ROW_SCALE", "1"),
+                        help="multiplier for the log tables' row counts")
+    parser.add_argument("--output-dir", default=os.environ.get("WIAP_OUTPUT_DIR", "."))
+    parser.add_argument("--force", action="store_true", help="rebuild the tables even when up to date")
+    parser.add_argument("--dry-run", action="store_true", help="only list the tables that would be built")
+    args = parser.parse_intermixed_args(argv)
+    if args.backend not in BACKENDS:
+        # A WIAP_GENERATOR_BACKEND default is not checked against `choices`
+        parser.error(f"argument --backend: invalid choice: '{args.backend}' (choose from {', '.join(BACKENDS)})")
+    return args
+
+
+def main(argv=None):
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    unknown = sorted(set(args.tables) - set(TABLES))
+    if unknown:
+        print(f"Unknown tables: {', '.join(unknown)}. Expected any of: {', '.join(TABLES)}")
+        return 2
+
+    names = args.tables
+    output_dir = args.output_dir
+    os.makedirs(output_dir, exist_ok=True)
+    manifest = read_manifest(output_dir)
+    # Without a seed, keep the one this directory was built with so reruns stay incremental
+    seed = args.seed if args.seed is not None else manifest.get("seed")
+    seed = int(seed) if seed is not None else int.from_bytes(os.urandom(8), "big") >> 1
+    backend, scale = args.backend, args.scale
+    output_format = os.environ.get("WIAP_OUTPUT_FORMAT", "csv")
+    llm_backend = os.environ.get("WIAP_LLM_BACKEND", "ollama")
+
+    tables = plan(seed, backend, scale, llm_backend)
+    reasons = select(tables, names or TABLES, manifest, output_dir, output_format, force=args.force)
+    skipped = [table for table in (names or TABLES) if table not in reasons]
+    print(f"Seed {seed}, {backend} backend, scale {scale:g}: {len(reasons)} to build, {len(skipped)} up to date")
+    if args.dry_run:
+        for table, reason in reasons.items():
+            print(f"{table:<38} {reason}")
+        return 0
+    if not reasons:
+        return 0
+
+    import metrics
+    metrics.configure_logging()
+    start = time.time()
+    build(tables, reasons, output_dir, seed, backend, output_format)
+    print(f"Built {len(reasons)} tables in {time.time() - start:.2f}s")
+    for line in metrics.summary():
+        print(f"   {line}")
+    metrics.export("generator")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,348 @@
+import re
+from decimal import Decimal, ROUND_HALF_UP
+import numpy as np
+import pandas as pd
+import schema
+
+# ------------------------------
+# Load-time Cleansing (sql/views.sql in pandas)
+# ------------------------------
+# Each clean_* function applies the rules of one vw_* view to the rows of a
+# source CSV and returns the view's columns, in the view's order. The loader
+# writes the result to the matching clean_* table (sql/schema.sql, Step 7) in
+# the same transaction as the raw table, so dashboards can read clean,
+# indexed tables instead of re-running the views on every query.
+#
+# Input frames hold the CSV text as read with dtype=str (empty field -> NaN),
+# i.e. what COPY stores in the raw table. SQL semantics are kept on purpose:
+# trim() strips spaces only, LIKE is case-sensitive, arithmetic on NULL stays
+# NULL, and the views' typos ('missingt', 'mising') are reproduced.
+
+MISSING = 'missing'
+MISSING_TYPO = 'mising'
+NO_DATE = pd.Timestamp('1900-01-01')
+REPORT_DATE_YEAR = 2024
+
+
+# ------------------------------
+# SQL Helpers
+# ------------------------------
+def clean_text(series, fill=MISSING):
+    # coalesce(nullif(trim(x), ''), fill)
+    trimmed = series.str.strip(" ")
+    return trimmed.mask(trimmed.isna() | (trimmed == ""), fill)
+
+
+def to_date(series, fill=NO_DATE):
+    # coalesce(x::date, fill); fill=None keeps NULLs
+    dates = pd.to_datetime(series, format="ISO8601", errors="coerce")
+    return dates if fill is None else dates.fillna(fill)
+
+
+def to_time(series):
+    # coalesce(x::time, time '00:00:00'), rendered as HH:MM:SS. Values already
+    # in that form are kept as they are; only the rest go through the slow parser.
+    canonical = pd.to_datetime(series, format="%H:%M:%S", errors="coerce").notna() & (series.str.len() == 8)
+    times = series.where(canonical, "00:00:00")
+    other = series.notna() & ~canonical
+    if other.any():
+        seconds = pd.to_timedelta(series[other], errors="coerce").dt.total_seconds()
+        times[other] = format_seconds(seconds.fillna(0))
+    return times
+
+
+def format_seconds(seconds):
+    return pd.to_datetime(seconds.astype(np.int64) % 86400, unit="s").dt.strftime("%H:%M:%S")
+
+
+def to_int(series, fill=-999):
+    # coalesce(x, fill); fill=None keeps NULLs
+    values = pd.to_numeric(series, errors="coerce").astype("Int64")
+    return values if fill is None else values.fillna(fill)
+
+
+def to_money(series):
+    # coalesce(cast(x as decimal(10,2)), 0)
+    return pd.Series([Decimal(value).quantize(Decimal("0.01"), ROUND_HALF_UP) if isinstance(value, str) else Decimal("0.00")
+                      for value in series], index=series.index, dtype=object)
+
+
+def like_cascade(series, rules, default):
+    # CASE WHEN x LIKE '%a%' THEN ... (first match wins) ELSE default END
+    conditions = [series.str.contains(pattern, regex=False, na=False) for pattern, _ in rules]
+    choices = [value for _, value in rules]
+    return pd.Series(np.select(conditions, choices, default=default.astype(object)), index=series.index)
+
+
+def days_between(end, start, when):
+    # CASE WHEN cond THEN end - start END (integer days, NULL otherwise)
+    return (end - start).dt.days.astype("Int64").where(when)
+
+
+# ------------------------------
+# Dimension Tables
+# ------------------------------
+def clean_vehicle_details(df):
+    capacity = df['vehicle_capacity']
+    return pd.DataFrame({
+        'vehicle_no': clean_text(df['vehicle_no']),
+        'vehicle_capacity': capacity.mask(capacity == '12 ton', '15 ton'),
+        'vehicle_cbm': np.select([capacity == '10 ton', capacity == '12 ton'], ['45', '60'], default='75'),
+    })
+
+
+SUPPLIER_COUNTRY_RULES = [
+    ('Light', 'Italy'), ('Cosmetics', 'Australia'), ('Refrigerator', 'Germany'), ('Furniture', 'Italy'),
+    ('Cosmetics', 'Norway'), ('Clothing', 'Nepal'), ('Food Items', 'Iran'), ('Shoes', 'Brazil'), ('Car', 'Oman'),
+    ('Smartphone', 'Qatar'), ('Jewelry', 'India'), ('Washing Machine', 'Japan'), ('Toys', 'Canada'),
+    ('China', 'China'), ('Appliances', 'Vietnam'), ('Television', 'UAE'), ('Software', 'Sri Lanka'),
+    ('Bicycle', 'Maldives'), ('Indo', 'Indonesia'),
+]
+
+
+def clean_supplier_details(df):
+    return pd.DataFrame({
+        'supplier_id': clean_text(df['supplier_id']),
+        'country': like_cascade(df['country'], SUPPLIER_COUNTRY_RULES, df['country']),
+    })
+
+
+CAMEL_CASE = re.compile(r"([a-z])([A-Z])")
+
+
+def clean_customer_details(df):
+    return pd.DataFrame({
+        'customer_id': clean_text(df['customer_id']),
+        'customer_name': df['customer_name'].str.replace(CAMEL_CASE, r"\1 \2", regex=True),
+    })
+
+
+def clean_employee_details(df):
+    name, designation, email = df['emp_name'], df['designation'], df['email_address']
+    birth = to_date(df['date_of_birth'], fill=None)
+    age = (REPORT_DATE_YEAR - birth.dt.year).astype("Int64")
+    return pd.DataFrame({
+        'emp_id': clean_text(df['emp_id'], 'missingID'),
+        'employee_name': np.select(
+            [name == 'Male Names: Jack', name.str.contains('Cameron', regex=False, na=False)],
+            ['Jack', 'Cameron'], default=name.astype(object)),
+        'department': np.select(
+            [designation == 'WH labour - outbound', designation == 'WH labour - inbound', name == 'Anthony',
+             name == 'Jacob', name == 'Charles', name == 'Andrew', name == 'Mark'],
+            ['WH Outbound', 'WH Inbound', 'Warehouse', 'Transport', 'Inventory Control', 'Quality Control',
+             'Admin & HR'], default=None),
+        'designation': designation.mask(designation.isin(['WH labour - outbound', 'WH labour - inbound']), 'WH labour'),
+        'emp_email': np.select(
+            [email == 'male.names:.jack@logisticsone.com',
+             email.str.contains('emma@logisticsone.com', regex=False, na=False)],
+            ['jack@logisticsone.com', 'cameron@logisticsone.com'], default=email.astype(object)),
+        'date_of_birth': birth.fillna(NO_DATE),
+        'age': age,
+        'years_to_retire': 60 - age,
+    })
+
+
+def clean_product_details(df):
+    return pd.DataFrame({
+        'product_id': clean_text(df['product_id']),
+        'product_name': clean_text(df['product_name'], 'missingt'),
+        'delivery_note_id': clean_text(df['delivery_note_id']),
+        'supplier_id': clean_text(df['supplier_id']),
+        'system_qty': to_int(df['system_qty']),
+        'product_cost': to_money(df['product_cost']),
+        'product_price': to_money(df['product_price']),
+        'product_cbm': to_money(df['product_carton_volume_cbm']),
+    })
+
+
+# ------------------------------
+# Log Tables
+# ------------------------------
+def clean_inbound_log(df):
+    reason = df['rejected_reason']
+    return pd.DataFrame({
+        'inbound_date': to_date(df['inbound_date']),
+        'supplier_id': clean_text(df['supplier_id']),
+        'delivery_note_id': clean_text(df['delivery_note_id']),
+        'product_id': clean_text(df['product_id']),
+        'received_qty': to_int(df['received_qty']),
+        'rejected_qty': to_int(df['rejected_qty']),
+        'inbound_status': clean_text(df['inbound_status']),
+        'reason_to_reject': reason.mask(reason.isna() | (reason == 'NaN'), 'Accepted'),
+        'unloading_started_time': to_time(df['unloading_started_time']),
+        'unloading_completed_time': to_time(df['unloading_completed_time']),
+        'putaway_completed_time': to_time(df['inbound_putaway_completed_time']),
+    })
+
+
+def clean_outbound_log(df):
+    ordered, picked = to_int(df['ordered_qty'], None), to_int(df['picked_qty'], None)
+    return pd.DataFrame({
+        'outbound_date': to_date(df['outbound_date']),
+        'customer_id': clean_text(df['customer_id']),
+        'order_id': clean_text(df['order_id']),
+        'product_id': clean_text(df['product_id']),
+        'ordered_qty': ordered.fillna(-999),
+        'picked_qty': picked.fillna(-999),
+        'pick_failed_qty': ordered - picked,
+        'allocated_vehicle': clean_text(df['vehicle_no']),
+        'pick_sheet_issued_time': to_time(df['pick_sheet_issued_time']),
+        'pick_completed_time': to_time(df['pick_completed_time']),
+        'loading_completed_time': to_time(df['loading_completed_time']),
+    })
+
+
+def clean_return_handling_log(df):
+    return pd.DataFrame({
+        'return_date': to_date(df['return_date']),
+        'customer_id': clean_text(df['customer_id']),
+        'order_id': clean_text(df['order_id']),
+        'product_id': clean_text(df['product_id']),
+        'return_reason': clean_text(df['return_reason']),
+        'returned_qty': to_int(df['returned_qty']),
+        'unloading_started_time': to_time(df['return_unloading_started_time']),
+        'putaway_completed_time': to_time(df['return_putaway_completed_time']),
+    })
+
+
+def clean_vehicle_ncr_log(df):
+    reason, status = df['ncr_reason'], df['ncr_status']
+    raised, completed = to_date(df['ncr_raised_date'], None), to_date(df['ca_completed_date'], None)
+    return pd.DataFrame({
+        'ncr_raised_date': raised.fillna(NO_DATE),
+        'ncr_id': clean_text(df['ncr_id']),
+        'vehicle_no': clean_text(df['vehicle_no']),
+        'ncr_reason': clean_text(reason),
+        'nc_severity': np.select(
+            [reason.isin(['Defective cooling unit', 'Defective truck door', 'Pest', 'Odor']),
+             reason.isin(['Defective truck box', 'Defective truck floor'])],
+            ['Major', 'Minor'], default=None),
+        'ca_completed_date': completed.fillna(NO_DATE),
+        'ncr_status': clean_text(status),
+        'days_to_complete': days_between(completed, raised, status == 'CA completed'),
+    })
+
+
+HYGIENE_CHECKS = ['vehicle_no', 'good_truckbox', 'good_truckfloor', 'good_truckdoor', 'good_curtain',
+                  'good_cooling_unit', 'pest_check', 'odor_check']
+
+
+def clean_vehicle_hygiene_inspection_log(df):
+    cleaned = {'inspection_date': to_date(df['inspection_date'])}
+    cleaned.update({column: clean_text(df[column], MISSING_TYPO) for column in HYGIENE_CHECKS})
+    return pd.DataFrame(cleaned)
+
+
+def clean_complaint_handling_log(df):
+    category, status = df['complaint_category'], df['complaint_status']
+    complained, resolved = to_date(df['complaint_date'], None), to_date(df['resolution_completed_date'], None)
+    return pd.DataFrame({
+        'complaint_date': complained.fillna(NO_DATE),
+        'complaint_id': clean_text(df['complaint_id'], MISSING_TYPO),
+        'customer_id': clean_text(df['customer_id'], MISSING_TYPO),
+        'complaint_qty': to_int(df['complaint_qty']),
+        'product_id': clean_text(df['product_id'], MISSING_TYPO),
+        'complaint_category': category.replace({'Off-Taste/ Off-Smell/ Off-Color': 'Off-Sensory',
+                                                'Spoilage/ Contamination': 'Spoilage'}),
+        'complaint_status': clean_text(status, MISSING_TYPO),
+        'resolution_completed_date': resolved,
+        'days_to_complete': days_between(resolved, complained, status == 'Resolved'),
+    })
+
+
+def clean_cycle_count_log(df):
+    system_qty, counted_qty = to_int(df['system_qty'], None), to_int(df['counted_qty'], None)
+    adjusted = system_qty - counted_qty
+    return pd.DataFrame({
+        'count_date': to_date(df['count_date']),
+        'product_id': clean_text(df['product_id'], MISSING_TYPO),
+        'system_qty': system_qty.fillna(-999),
+        'counted_qty': counted_qty.fillna(-999),
+        'adjusted_qty': adjusted,
+        'cycle_count_status': np.where((adjusted == 0).fillna(False), 'Accurate', 'Adjusted'),
+    })
+
+
+def clean_product_disposal_log(df):
+    return pd.DataFrame({
+        'disposal_date': to_date(df['disposal_date']),
+        'product_id': clean_text(df['product_id'], MISSING_TYPO),
+        'disposal_qty': to_int(df['disposal_qty']),
+        'disposal_reason': clean_text(df['disposal_reason'], MISSING_TYPO),
+        'qcm_approval': clean_text(df['qcm_approval'], MISSING_TYPO),
+    })
+
+
+AM_PM_TIME = r"^\s*(\d{1,2})\s*[:.]\s*(\d{1,2})\s*([AaPp][Mm])$"
+
+
+def am_pm_to_time(raw):
+    # '03.00PM' -> 15:00:00; anything not ending in AM/PM -> NULL
+    suffix = raw.str.upper().str[-2:]
+    parts = raw.str.extract(AM_PM_TIME)
+    hours = pd.to_numeric(parts[0], errors="coerce") % 12 + np.where(suffix == 'PM', 12, 0)
+    seconds = hours * 3600 + pd.to_numeric(parts[1], errors="coerce") * 60
+    valid = suffix.isin(['AM', 'PM']) & seconds.notna()
+    return format_seconds(seconds.fillna(0)).where(valid)
+
+
+def clean_warehouse_temperature_monitoring_log(df):
+    # Only a handful of distinct inspection times: parse each once, then map
+    raw = df['inspection_time']
+    distinct = pd.Series(raw.dropna().unique(), dtype=object)
+    return pd.DataFrame({
+        'monitoring_date': to_date(df['monitoring_date']),
+        'location_code': clean_text(df['location_code']),
+        'inspection_time': raw.map(dict(zip(distinct, am_pm_to_time(distinct)))),
+        'temperature': to_int(df['temperature']),
+    })
+
+
+def clean_warehouse_incident_reporting_log(df):
+    return pd.DataFrame({
+        'reporting_id': df['reporting_id'],
+        'reporting_date': to_date(df['reporting_date']),
+        'operation_shift': clean_text(df['operation_shift']),
+        'no_of_incidents': clean_text(df['no_of_incidents']),
+    })
+
+
+# raw table -> (clean function, clean table, key used to upsert the clean table or None to append)
+CLEAN_TABLES = {
+    'vehicle_details': (clean_vehicle_details, 'clean_vehicle_details', 'vehicle_no'),
+    'supplier_details': (clean_supplier_details, 'clean_supplier_details', 'supplier_id'),
+    'customer_details': (clean_customer_details, 'clean_customer_details', 'customer_id'),
+    'employee_details': (clean_employee_details, 'clean_employee_details', 'emp_id'),
+    'product_details': (clean_product_details, 'clean_product_details', 'product_id'),
+    'inbound_log': (clean_inbound_log, 'clean_inbound_log', None),
+    'outbound_log': (clean_outbound_log, 'clean_outbound_log', 'order_id'),
+    'return_handling_log': (clean_return_handling_log, 'clean_return_handling_log', None),
+    'vehicle_ncr_log': (clean_vehicle_ncr_log, 'clean_vehicle_ncr_log', 'ncr_id'),
+    'vehicle_hygiene_inspection_log': (clean_vehicle_hygiene_inspection_log, 'clean_vehicle_hygiene_inspection_log', None),
+    'complaint_handling_log': (clean_complaint_handling_log, 'clean_complaint_handling_log', 'complaint_id'),
+    'cycle_count_log': (clean_cycle_count_log, 'clean_cycle_count_log', None),
+    'product_disposal_log': (clean_product_disposal_log, 'clean_product_disposal_log', None),
+    'warehouse_temperature_monitoring_log': (clean_warehouse_temperature_monitoring_log,
+                                             'clean_warehouse_temperature_monitoring_log', None),
+    'warehouse_incident_reporting_log': (clean_warehouse_incident_reporting_log,
+                                         'clean_warehouse_incident_reporting_log', 'reporting_id'),
+}
+
+
+def read_source(source):
+    # Same text COPY stores: every field a string, empty fields NULL
+    return pd.read_csv(source, dtype=str, keep_default_na=False, na_values=[""])
+
+
+def clean_table(table_name, df):
+    clean, clean_table_name, key = CLEAN_TABLES[table_name]
+    return clean_table_name, key, clean(df)
+
+
+def to_csv(df):
+    return df.to_csv(index=False, date_format="%Y-%m-%d")
+
+
+# Tables without a key in CLEAN_TABLES are append-only, like their raw tables;
+# their dashboards filter on the date index (sql/schema.sql, Step 7).
+CLEAN_TABLES_DDL = schema.table_ddl(clean_table for _, clean_table, _ in CLEAN_TABLES.values())
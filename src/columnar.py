@@ -0,0 +1,190 @@
+import os
+import shutil
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pa_csv
+import pyarrow.dataset as ds
+
+# ------------------------------
+# Columnar (Parquet) Table Storage
+# ------------------------------
+# Explicit Arrow schema per generated table: dictionary-encoded enum columns,
+# date32/time32 for dates and times, and integer widths sized to each column's
+# range. Dated logs are written as Hive-style month partitions
+# (<table>/month=2024-01/part-*.parquet); dimension tables are one file each.
+
+# Enum-like columns (a handful of values)
+ENUM = pa.dictionary(pa.int8(), pa.string())
+# Repeated ids with up to a few thousand distinct values (products, customers, vehicles)
+KEY = pa.dictionary(pa.int32(), pa.string())
+MONEY = pa.decimal128(12, 2)
+DATE = pa.date32()
+TIME = pa.time32("s")
+
+TABLE_SCHEMAS = {
+    'vehicle_details': pa.schema([
+        ('vehicle_no', pa.string()), ('vehicle_capacity', ENUM)]),
+    'supplier_details': pa.schema([
+        ('supplier_id', pa.string()), ('supplier_name', pa.string()), ('country', ENUM)]),
+    'customer_details': pa.schema([
+        ('customer_id', pa.string()), ('customer_name', pa.string())]),
+    'employee_details': pa.schema([
+        ('emp_id', pa.string()), ('emp_name', pa.string()), ('designation', ENUM), ('department', ENUM),
+        ('email_address', pa.string()), ('date_of_birth', DATE), ('joined_date', DATE)]),
+    'product_details': pa.schema([
+        ('supplier_id', KEY), ('delivery_note_id', pa.string()), ('product_id', pa.string()),
+        ('product_name', pa.string()), ('system_qty', pa.int16()), ('product_cost', MONEY),
+        ('product_price', MONEY), ('product_carton_volume_cbm', MONEY)]),
+    'inbound_log': pa.schema([
+        ('inbound_date', DATE), ('supplier_id', KEY), ('delivery_note_id', pa.string()), ('product_id', KEY),
+        ('received_qty', pa.int16()), ('rejected_qty', pa.int16()), ('inbound_status', ENUM),
+        ('rejected_reason', ENUM), ('unloading_started_time', TIME), ('unloading_completed_time', TIME),
+        ('inbound_putaway_completed_time', TIME)]),
+    'outbound_log': pa.schema([
+        ('outbound_date', DATE), ('order_id', pa.string()), ('customer_id', KEY), ('product_id', KEY),
+        ('ordered_qty', pa.int16()), ('picked_qty', pa.int16()), ('pick_sheet_issued_time', TIME),
+        ('pick_completed_time', TIME), ('vehicle_no', KEY), ('loading_completed_time', TIME)]),
+    'return_handling_log': pa.schema([
+        ('return_date', DATE), ('customer_id', KEY), ('order_id', pa.string()), ('product_id', KEY),
+        ('returned_qty', pa.int16()), ('return_reason', ENUM), ('return_unloading_started_time', TIME),
+        ('return_putaway_completed_time', TIME)]),
+    'vehicle_ncr_log': pa.schema([
+        ('ncr_raised_date', DATE), ('ncr_id', pa.string()), ('vehicle_no', KEY), ('ncr_reason', ENUM),
+        ('ncr_status', ENUM), ('ca_completed_date', DATE)]),
+    'vehicle_hygiene_log': pa.schema([
+        ('inspection_date', DATE), ('vehicle_no', KEY), ('good_truckbox', ENUM), ('good_truckfloor', ENUM),
+        ('good_truckdoor', ENUM), ('good_curtain', ENUM), ('good_cooling_unit', ENUM), ('pest_check', ENUM),
+        ('odor_check', ENUM)]),
+    'inbound_inspection_log': pa.schema([
+        ('inbound_date', DATE), ('delivery_note_id', pa.string()), ('product_id', KEY), ('received_qty', pa.int16()),
+        ('rejected_qty', pa.int16()), ('rejected_reason', ENUM)]),
+    'complaint_handling_log': pa.schema([
+        ('complaint_date', DATE), ('complaint_id', pa.string()), ('customer_id', KEY), ('product_id', KEY),
+        ('complaint_qty', pa.int16()), ('complaint_category', ENUM), ('complaint_status', ENUM),
+        ('resolution_completed_date', DATE)]),
+    'cycle_count_log': pa.schema([
+        ('count_date', DATE), ('product_id', KEY), ('system_qty', pa.int16()), ('counted_qty', pa.int16())]),
+    'product_disposal_log': pa.schema([
+        ('disposal_date', DATE), ('product_id', KEY), ('disposal_reason', ENUM), ('disposal_qty', pa.int16()),
+        ('qcm_approval', ENUM)]),
+    'warehouse_incident_reporting_log': pa.schema([
+        ('reporting_id', pa.string()), ('reporting_date', DATE), ('operation_shift', ENUM), ('no_of_incidents', pa.int8())]),
+    # inspection_time stays a string: the log keeps the "12.00AM" labels as written
+    'warehouse_temperature_monitoring_log': pa.schema([
+        ('monitoring_date', DATE), ('location_code', KEY), ('inspection_time', pa.string()), ('temperature', pa.int8())]),
+}
+
+# Date column each log is partitioned on (by month)
+PARTITION_COLUMNS = {
+    'inbound_log': 'inbound_date',
+    'outbound_log': 'outbound_date',
+    'return_handling_log': 'return_date',
+    'vehicle_ncr_log': 'ncr_raised_date',
+    'vehicle_hygiene_log': 'inspection_date',
+    'inbound_inspection_log': 'inbound_date',
+    'complaint_handling_log': 'complaint_date',
+    'cycle_count_log': 'count_date',
+    'product_disposal_log': 'disposal_date',
+    'warehouse_incident_reporting_log': 'reporting_date',
+    'warehouse_temperature_monitoring_log': 'monitoring_date',
+}
+
+MONTH_PARTITIONING = ds.partitioning(pa.schema([('month', pa.string())]), flavor="hive")
+
+
+# ------------------------------
+# Conversion
+# ------------------------------
+def _to_arrow_column(series, arrow_type):
+    if pa.types.is_date32(arrow_type):
+        values = pd.to_datetime(series, errors="coerce")
+        return pa.array(values, type=pa.timestamp("s"), from_pandas=True).cast(DATE)
+    if pa.types.is_time32(arrow_type):
+        # "HH:MM:SS" strings or datetime.time objects -> seconds since midnight
+        seconds = pd.to_timedelta(series.astype("string"), errors="coerce").dt.total_seconds()
+        return pa.array(seconds, type=pa.float64(), from_pandas=True).cast(pa.int32()).cast(TIME)
+    if pa.types.is_dictionary(arrow_type):
+        values = series.astype("string").replace("", pd.NA)
+        return pa.array(values, type=pa.string(), from_pandas=True).dictionary_encode().cast(arrow_type)
+    if pa.types.is_decimal(arrow_type):
+        return pa.array(series.round(2).astype(str), type=pa.string(), from_pandas=True).cast(arrow_type)
+    if pa.types.is_string(arrow_type):
+        return pa.array(series.astype("string"), type=pa.string(), from_pandas=True)
+    return pa.array(series, from_pandas=True).cast(arrow_type)
+
+
+def to_arrow(table_name, df):
+    schema = TABLE_SCHEMAS[table_name]
+    return pa.Table.from_arrays([_to_arrow_column(df[field.name], field.type) for field in schema], schema=schema)
+
+
+def dataset_path(table_name, output_dir="."):
+    if table_name in PARTITION_COLUMNS:
+        return os.path.join(output_dir, table_name)
+    return os.path.join(output_dir, f"{table_name}.parquet")
+
+
+def clear_table(table_name, output_dir="."):
+    path = dataset_path(table_name, output_dir)
+    if os.path.isdir(path):
+        shutil.rmtree(path)
+    elif os.path.exists(path):
+        os.remove(path)
+
+
+# `part` numbers the files of a table written in several calls (chunks/shards)
+def write_table(table_name, df, output_dir=".", part=0):
+    table = to_arrow(table_name, df)
+    path = dataset_path(table_name, output_dir)
+    if table_name not in PARTITION_COLUMNS:
+        if part:
+            raise ValueError(f"{table_name} is not partitioned and must be written in one call")
+        import pyarrow.parquet as pq
+        pq.write_table(table, path, compression="zstd")
+        return table.num_rows
+    month = pc.strftime(table[PARTITION_COLUMNS[table_name]], format="%Y-%m")
+    ds.write_dataset(
+        table.append_column('month', month), path, format="parquet",
+        partitioning=MONTH_PARTITIONING, basename_template=f"part-{part:05d}-{{i}}.parquet",
+        existing_data_behavior="overwrite_or_ignore",
+        file_options=ds.ParquetFileFormat().make_write_options(compression="zstd"),
+    )
+    return table.num_rows
+
+
+# ------------------------------
+# Reading
+# ------------------------------
+def find_table(table_name, source_dir="."):
+    path = dataset_path(table_name, source_dir)
+    return path if os.path.exists(path) else None
+
+
+def open_dataset(table_name, path):
+    schema = TABLE_SCHEMAS[table_name]
+    if os.path.isdir(path):
+        return ds.dataset(path, schema=schema.append(pa.field('month', pa.string())), format="parquet",
+                          partitioning=MONTH_PARTITIONING)
+    return ds.dataset(path, schema=schema, format="parquet")
+
+
+def month_filter(table_name, after=None):
+    # Rows strictly after an ISO date; the month key prunes whole partitions first
+    if after is None:
+        return None
+    column = PARTITION_COLUMNS[table_name]
+    return (ds.field('month') >= after[:7]) & (ds.field(column) > pa.scalar(pd.Timestamp(after).date(), type=DATE))
+
+
+def read_table(table_name, path, columns=None, filter=None):
+    columns = columns or TABLE_SCHEMAS[table_name].names
+    return open_dataset(table_name, path).to_table(columns=columns, filter=filter)
+
+
+def write_csv(table, sink):
+    # Dictionary columns are decoded; nulls become empty fields (NULL for COPY)
+    decoded = table.cast(pa.schema([
+        pa.field(f.name, f.type.value_type if pa.types.is_dictionary(f.type) else f.type) for f in table.schema
+    ]))
+    pa_csv.write_csv(decoded, sink, write_options=pa_csv.WriteOptions(quoting_style="needed"))
@@ -2,38 +2,78 @@ import pandas as pd
 import random
 import os
 import datetime
-import ollama
+import zlib
+import sys
 from functools import lru_cache
-import time
 import logging
+import numpy as np
+import vectorized_generator
+import llm_cache
+import metrics
 
-# Setup logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Cache LLM responses
+# ------------------------------
+# Generation Backend
+# ------------------------------
+# "python" builds the log tables row by row with the random module,
+# "numpy" builds whole columns at once (see vectorized_generator.py).
+# Both can be picked per run through WIAP_GENERATOR_BACKEND / WIAP_SEED.
+BACKENDS = ("python", "numpy")
+GENERATOR_BACKEND = os.environ.get("WIAP_GENERATOR_BACKEND", "python")
+GENERATOR_SEED = os.environ.get("WIAP_SEED")
+
+_numpy_rng = None
+
+
+def set_backend(backend, seed=None):
+    global GENERATOR_BACKEND, GENERATOR_SEED, _numpy_rng
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown generator backend '{backend}', expected one of {BACKENDS}")
+    GENERATOR_BACKEND = backend
+    GENERATOR_SEED = seed
+    _numpy_rng = None
+    if seed is not None:
+        random.seed(int(seed))
+
+
+def numpy_rng():
+    global _numpy_rng
+    if _numpy_rng is None:
+        _numpy_rng = np.random.default_rng(None if GENERATOR_SEED is None else int(GENERATOR_SEED))
+    return _numpy_rng
+
+
+def seed_table(table_name, seed):
+    # Separate random streams per table, so a table can be rebuilt on its own
+    # (build_tables.py) and still match a full run with the same seed
+    global _numpy_rng
+    random.seed(f"{seed}:{table_name}")
+    _numpy_rng = np.random.default_rng([int(seed), zlib.crc32(table_name.encode())])
+
+
+def use_numpy(backend=None):
+    return (backend or GENERATOR_BACKEND) == "numpy"
+
+
+def shuffled_mix(num_rows, mix):
+    # Scale a fixed status mix (e.g. 22500/2000/500) to num_rows and shuffle it,
+    # like vectorized_generator._shuffled_mix; the default row counts are unchanged
+    total = sum(count for _, count in mix)
+    counts = [num_rows * count // total for _, count in mix]
+    counts[0] += num_rows - sum(counts)
+    statuses = [label for (label, _), count in zip(mix, counts) for _ in range(count)]
+    random.shuffle(statuses)
+    return statuses
+
+
+if GENERATOR_SEED is not None:
+    random.seed(int(GENERATOR_SEED))
+
+# Cache LLM responses: in memory for this run, on disk across runs (see llm_cache.py)
 @lru_cache(maxsize=1000)
 def generate_with_ollama_cached(prompt, model="mistral", num_items=1):
-    start_time = time.time()
-    try:
-        response = ollama.chat(
-            model=model,
-            messages=[
-                {'role': 'system', 'content': 'Provide realistic names/data as a comma-separated list without extra text.'},
-                {'role': 'user', 'content': f'{prompt}. Provide {num_items} items in a comma-separated list.'},
-            ],
-        )
-        generated_text = response['message']['content'].strip()
-        items = [item.strip() for item in generated_text.split(',') if item.strip()]
-        elapsed = time.time() - start_time
-        logger.info(f"LLM call for {prompt} returned {len(items)} items in {elapsed:.2f} seconds")
-        if len(items) < num_items:
-            logger.warning(f"LLM returned {len(items)} items, expected {num_items}. Using fallback.")
-            items.extend([f"Fallback_{i}" for i in range(len(items), num_items)])
-        return items
-    except Exception as e:
-        logger.error(f"LLM error for {prompt}: {e}")
-        return [f"Fallback_{i}" for i in range(1, num_items + 1)]
+    return tuple(llm_cache.generate_items(prompt, model=model, num_items=num_items))
 
 # ------------------------------
 # Table Generators
@@ -74,23 +114,21 @@ def generate_employee_details(num_rows=65):
     return pd.DataFrame(data, columns=['emp_id', 'emp_name', 'designation', 'department', 'email_address', 'date_of_birth', 'joined_date']).dropna(subset=['emp_id', 'emp_name', 'designation', 'email_address'])
 
 def generate_product_details(supplier_df, num_rows=1000):
-    start_time = time.time()
     supplier_ids = supplier_df['supplier_id'].tolist()
     product_names = [f"Product_{i}" for i in range(num_rows)]
     data = [[random.choice(supplier_ids), str(random.randint(100000, 999999)), str(random.randint(100000, 999999)),
              product_names[i], random.randint(20, 1000), round(random.uniform(5.0, 500.0), 2),
              round(random.uniform(5.0, 500.0) * 1.3, 2), round(random.uniform(0.05, 1.50), 2)]
             for i in range(num_rows)]
-    elapsed = time.time() - start_time
-    logger.info(f"Product details generation took {elapsed:.2f} seconds")
     return pd.DataFrame(data, columns=['supplier_id', 'delivery_note_id', 'product_id', 'product_name',
                                       'system_qty', 'product_cost', 'product_price', 'product_carton_volume_cbm']).dropna()
 
-def generate_inbound_log(supplier_df, product_df, num_rows=25000):
+def generate_inbound_log(supplier_df, product_df, num_rows=25000, backend=None):
+    if use_numpy(backend):
+        return vectorized_generator.generate_inbound_log(supplier_df, product_df, num_rows, rng=numpy_rng())
     supplier_ids = supplier_df['supplier_id'].unique().tolist()
     product_details_tuples = list(zip(product_df['delivery_note_id'], product_df['product_id']))
-    inbound_statuses = ['Accepted'] * 22500 + ['Rejected'] * 2000 + ['On-hold'] * 500
-    random.shuffle(inbound_statuses)
+    inbound_statuses = shuffled_mix(num_rows, [('Accepted', 22500), ('Rejected', 2000), ('On-hold', 500)])
     rejected_reasons = ["Quality Issue", "Regulatory issue"]
     start_date = datetime.date(2022, 1, 1)
     end_date = datetime.date(2024, 12, 31)
@@ -113,11 +151,13 @@ def generate_inbound_log(supplier_df, product_df, num_rows=25000):
                                       'rejected_qty', 'inbound_status', 'rejected_reason', 'unloading_started_time',
                                       'unloading_completed_time', 'inbound_putaway_completed_time']).dropna()
 
-def generate_outbound_log(customer_df, product_df, vehicle_df, num_rows=25000):
+def generate_outbound_log(customer_df, product_df, vehicle_df, num_rows=25000, backend=None):
+    if use_numpy(backend):
+        return vectorized_generator.generate_outbound_log(customer_df, product_df, vehicle_df, num_rows, rng=numpy_rng())
     customer_ids = customer_df['customer_id'].tolist()
     product_ids = product_df['product_id'].tolist()
     vehicle_nos = vehicle_df['vehicle_no'].tolist()
-    mismatch_indices = random.sample(range(num_rows), 750)
+    mismatch_indices = set(random.sample(range(num_rows), min(num_rows, round(num_rows * 750 / 25000))))
     start_date = datetime.date(2022, 1, 1)
     end_date = datetime.date(2024, 12, 31)
     date_range = (end_date - start_date).days
@@ -142,7 +182,9 @@ def generate_outbound_log(customer_df, product_df, vehicle_df, num_rows=25000):
                                       'picked_qty', 'pick_sheet_issued_time', 'pick_completed_time',
                                       'vehicle_no', 'loading_completed_time']).dropna()
 
-def generate_return_handling_log(customer_df, product_df, outbound_log_df, num_rows=1000):
+def generate_return_handling_log(customer_df, product_df, outbound_log_df, num_rows=1000, backend=None):
+    if use_numpy(backend):
+        return vectorized_generator.generate_return_handling_log(customer_df, product_df, outbound_log_df, num_rows, rng=numpy_rng())
     customer_ids = customer_df['customer_id'].tolist()
     product_ids = product_df['product_id'].tolist()
     order_qty_lookup = dict(zip(outbound_log_df['order_id'], outbound_log_df['ordered_qty']))
@@ -171,7 +213,9 @@ def generate_return_handling_log(customer_df, product_df, outbound_log_df, num_r
     return pd.DataFrame(data, columns=['return_date', 'customer_id', 'order_id', 'product_id', 'returned_qty',
                                       'return_reason', 'return_unloading_started_time', 'return_putaway_completed_time']).dropna()
 
-def generate_vehicle_ncr_log(vehicle_df, num_rows=200):
+def generate_vehicle_ncr_log(vehicle_df, num_rows=200, backend=None):
+    if use_numpy(backend):
+        return vectorized_generator.generate_vehicle_ncr_log(vehicle_df, num_rows, rng=numpy_rng())
     vehicle_nos = vehicle_df['vehicle_no'].tolist()
     ncr_reasons = ["Defective truck box", "Defective truck floor", "Defective truck door", "Defective cooling unit", "Odor", "Pest"]
     ncr_statuses = ["CA completed"] * (num_rows // 2) + ["CA pending"] * (num_rows - (num_rows // 2))
@@ -190,7 +234,9 @@ def generate_vehicle_ncr_log(vehicle_df, num_rows=200):
         data.append([ncr_raised_date, ncr_id, vehicle_no, ncr_reason, ncr_status, ca_completed_date])
     return pd.DataFrame(data, columns=['ncr_raised_date', 'ncr_id', 'vehicle_no', 'ncr_reason', 'ncr_status', 'ca_completed_date']).dropna()
 
-def generate_vehicle_hygiene_log(outbound_log_df):
+def generate_vehicle_hygiene_log(outbound_log_df, backend=None):
+    if use_numpy(backend):
+        return vectorized_generator.generate_vehicle_hygiene_log(outbound_log_df, rng=numpy_rng())
     data = []
     yes_no_options = ["Yes"] * 98 + ["No"] * 2
     for index, row in outbound_log_df.iterrows():
@@ -204,12 +250,13 @@ def generate_inbound_inspection_log(inbound_log_df):
     required_columns = ['inbound_date', 'delivery_note_id', 'product_id', 'received_qty', 'rejected_qty', 'rejected_reason']
     return inbound_log_df[required_columns].copy().dropna()
 
-def generate_complaint_handling_log(customer_df, product_df, num_rows=125):
+def generate_complaint_handling_log(customer_df, product_df, num_rows=125, backend=None):
+    if use_numpy(backend):
+        return vectorized_generator.generate_complaint_handling_log(customer_df, product_df, num_rows, rng=numpy_rng())
     customer_ids = customer_df['customer_id'].tolist()
     product_ids = product_df['product_id'].tolist()
     complaint_categories = ["Spoilage/ Contamination", "Damaged", "Off-Taste/ Off-Smell/ Off-Color", "Expired", "Foreign Substance", "Mold Growth", "Defrosted"]
-    complaint_statuses = ["Resolved"] * 100 + ["Pending"] * 25
-    random.shuffle(complaint_statuses)
+    complaint_statuses = shuffled_mix(num_rows, [("Resolved", 100), ("Pending", 25)])
     start_date = datetime.date(2022, 1, 1)
     end_date = datetime.date(2024, 12, 31)
     date_range = (end_date - start_date).days
@@ -227,11 +274,13 @@ def generate_complaint_handling_log(customer_df, product_df, num_rows=125):
     return pd.DataFrame(data, columns=['complaint_date', 'complaint_id', 'customer_id', 'product_id', 'complaint_qty',
                                       'complaint_category', 'complaint_status', 'resolution_completed_date']).dropna()
 
-def generate_cycle_count_log(product_df, num_rows=2500):
+def generate_cycle_count_log(product_df, num_rows=2500, backend=None):
+    if use_numpy(backend):
+        return vectorized_generator.generate_cycle_count_log(product_df, num_rows, rng=numpy_rng())
     product_qty_lookup = product_df.set_index('product_id')['system_qty'].to_dict()
     product_ids = product_df['product_id'].tolist()
-    mismatch_rows = 125
-    mismatch_indices = random.sample(range(num_rows), mismatch_rows)
+    mismatch_rows = min(num_rows, round(num_rows * 125 / 2500))
+    mismatch_indices = set(random.sample(range(num_rows), mismatch_rows))
     start_date = datetime.date(2022, 1, 1)
     end_date = datetime.date(2024, 12, 31)
     date_range = (end_date - start_date).days
@@ -249,11 +298,12 @@ def generate_cycle_count_log(product_df, num_rows=2500):
         data.append([count_date, product_id, system_qty, counted_qty])
     return pd.DataFrame(data, columns=['count_date', 'product_id', 'system_qty', 'counted_qty']).dropna()
 
-def generate_product_disposal_log(product_df, num_rows=700):
+def generate_product_disposal_log(product_df, num_rows=700, backend=None):
+    if use_numpy(backend):
+        return vectorized_generator.generate_product_disposal_log(product_df, num_rows, rng=numpy_rng())
     product_ids = product_df['product_id'].tolist()
     disposal_reasons = ["Expired", "Quality issue", "Physical damage", "Regulatory issue"]
-    qcm_approvals = ["Approved"] * 679 + ["Pending"] * 21
-    random.shuffle(qcm_approvals)
+    qcm_approvals = shuffled_mix(num_rows, [("Approved", 679), ("Pending", 21)])
     start_date = datetime.date(2022, 1, 1)
     end_date = datetime.date(2024, 12, 31)
     date_range = (end_date - start_date).days
@@ -267,7 +317,9 @@ def generate_product_disposal_log(product_df, num_rows=700):
         data.append([disposal_date, product_id, disposal_reason, disposal_qty, qcm_approval])
     return pd.DataFrame(data, columns=['disposal_date', 'product_id', 'disposal_reason', 'disposal_qty', 'qcm_approval']).dropna()
 
-def generate_warehouse_incident_reporting_log():
+def generate_warehouse_incident_reporting_log(backend=None):
+    if use_numpy(backend):
+        return vectorized_generator.generate_warehouse_incident_reporting_log(rng=numpy_rng())
     start_date = datetime.date(2022, 1, 1)
     end_date = datetime.date(2024, 12, 31)
     num_rows = (end_date - start_date).days + 1
@@ -282,50 +334,262 @@ def generate_warehouse_incident_reporting_log():
         data.append([reporting_id, d, operation_shift, no_of_incidents])
     return pd.DataFrame(data, columns=['reporting_id', 'reporting_date', 'operation_shift', 'no_of_incidents']).dropna()
 
+def generate_warehouse_temperature_monitoring_log(num_rows=28800):
+    # Per-minute sensor readings: vectorized only, a row-by-row version would not
+    # keep up, so there is no backend to choose (and the build key ignores it)
+    return vectorized_generator.generate_warehouse_temperature_monitoring_log(num_rows, rng=numpy_rng())
+
+# ------------------------------
+# Streaming Generation
+# ------------------------------
+# Large runs write each log table in fixed-size chunks straight to its CSV, so
+# peak memory depends on WIAP_CHUNK_SIZE rather than on the requested row count.
+# Streaming always uses the NumPy generators (they take a start_index for ids).
+# Derived tables are produced from the same chunks as their parent:
+#   outbound_log -> vehicle_hygiene_log, and a fixed-size order sample for returns
+#   inbound_log  -> inbound_inspection_log
+
+CHUNK_SIZE = int(os.environ.get("WIAP_CHUNK_SIZE", 100000))
+STREAMING = os.environ.get("WIAP_STREAMING", "0") == "1"
+ROW_SCALE = float(os.environ.get("WIAP_ROW_SCALE", 1))
+# WIAP_WORKERS > 0 hands the run to generation_scheduler (sharded, multi-process)
+WORKERS = int(os.environ.get("WIAP_WORKERS", 0))
+# csv, or parquet (month-partitioned datasets with typed columns, see columnar.py)
+OUTPUT_FORMAT = os.environ.get("WIAP_OUTPUT_FORMAT", "csv")
+
+LOG_ROW_COUNTS = {
+    'inbound_log': 25000,
+    'outbound_log': 25000,
+    'return_handling_log': 1000,
+    'vehicle_ncr_log': 200,
+    'complaint_handling_log': 125,
+    'cycle_count_log': 2500,
+    'product_disposal_log': 700,
+    # 200 rooms x 144 minutes; WIAP_ROW_SCALE=10 is one day of readings
+    'warehouse_temperature_monitoring_log': 28800,
+}
+
+
+def scaled_row_counts(scale=ROW_SCALE):
+    return {table: max(1, int(rows * scale)) for table, rows in LOG_ROW_COUNTS.items()}
+
+
+def timed_generate(table_name, generate, *args, **kwargs):
+    with metrics.span("generate", table_name) as generate_span:
+        df = generate(*args, **kwargs)
+        generate_span.rows = len(df)
+    return df
+
+
+def iter_chunks(generate, num_rows, chunk_size=CHUNK_SIZE, **kwargs):
+    table_name = generate.__name__.replace("generate_", "", 1)
+    for start in range(0, num_rows, chunk_size):
+        yield timed_generate(table_name, generate, num_rows=min(chunk_size, num_rows - start), start_index=start, **kwargs)
+
+
+class ChunkWriter:
+    # Appends DataFrame chunks to one CSV, writing the header only once.
+    # For parquet each chunk becomes its own part file in the table's dataset.
+    def __init__(self, table_name, output_dir=".", output_format=None):
+        self.table_name = table_name
+        self.output_format = output_format or OUTPUT_FORMAT
+        self.output_dir = output_dir
+        self.rows = 0
+        self.parts = 0
+        if self.output_format == "parquet":
+            import columnar
+            columnar.clear_table(table_name, output_dir)
+            self.file_path = columnar.dataset_path(table_name, output_dir)
+            self._file = None
+        else:
+            self.file_path = os.path.join(output_dir, f"{table_name}.csv")
+            self._file = open(self.file_path, "w", newline="")
+
+    def write(self, df):
+        with metrics.span("write", self.table_name, rows=len(df)) as write_span:
+            if self._file is None:
+                import columnar
+                before = output_size(self.file_path)
+                columnar.write_table(self.table_name, df, self.output_dir, part=self.parts)
+                write_span.bytes = output_size(self.file_path) - before
+            else:
+                before = self._file.tell()
+                df.to_csv(self._file, header=before == 0, index=False)
+                write_span.bytes = self._file.tell() - before
+        self.parts += 1
+        self.rows += len(df)
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+        logger.info("Saved %s to %s (%d rows)", self.table_name, self.file_path, self.rows)
+
+
+def stream_table(table_name, chunks, output_dir="."):
+    writer = ChunkWriter(table_name, output_dir)
+    try:
+        for chunk in chunks:
+            writer.write(chunk)
+    finally:
+        writer.close()
+    return writer.rows
+
+
+def stream_all_tables(output_dir=".", row_counts=None, chunk_size=CHUNK_SIZE):
+    row_counts = row_counts or scaled_row_counts()
+    rng = numpy_rng()
+
+    vehicle_df, supplier_df, customer_df, employee_df, product_df = generate_dimension_tables()
+    for table_name, df in [('vehicle_details', vehicle_df), ('supplier_details', supplier_df),
+                           ('customer_details', customer_df), ('employee_details', employee_df),
+                           ('product_details', product_df)]:
+        stream_table(table_name, [df], output_dir)
+
+    # inbound_log and inbound_inspection_log in one pass
+    inbound_writer = ChunkWriter('inbound_log', output_dir)
+    inspection_writer = ChunkWriter('inbound_inspection_log', output_dir)
+    try:
+        for chunk in iter_chunks(vectorized_generator.generate_inbound_log, row_counts['inbound_log'], chunk_size,
+                                 supplier_df=supplier_df, product_df=product_df, rng=rng):
+            inbound_writer.write(chunk)
+            inspection_writer.write(timed_generate('inbound_inspection_log', generate_inbound_inspection_log, chunk))
+    finally:
+        inbound_writer.close()
+        inspection_writer.close()
+
+    # outbound_log, vehicle_hygiene_log and the order sample used by returns in one pass
+    order_sample = vectorized_generator.OrderReservoir(rng=rng)
+    outbound_writer = ChunkWriter('outbound_log', output_dir)
+    hygiene_writer = ChunkWriter('vehicle_hygiene_log', output_dir)
+    try:
+        for chunk in iter_chunks(vectorized_generator.generate_outbound_log, row_counts['outbound_log'], chunk_size,
+                                 customer_df=customer_df, product_df=product_df, vehicle_df=vehicle_df, rng=rng):
+            outbound_writer.write(chunk)
+            hygiene_writer.write(timed_generate('vehicle_hygiene_log', vectorized_generator.generate_vehicle_hygiene_log,
+                                                chunk, rng=rng))
+            order_sample.add(chunk)
+    finally:
+        outbound_writer.close()
+        hygiene_writer.close()
+
+    stream_table('return_handling_log', iter_chunks(
+        vectorized_generator.generate_return_handling_log, row_counts['return_handling_log'], chunk_size,
+        customer_df=customer_df, product_df=product_df, outbound_log_df=order_sample.to_frame(), rng=rng), output_dir)
+    stream_table('vehicle_ncr_log', iter_chunks(
+        vectorized_generator.generate_vehicle_ncr_log, row_counts['vehicle_ncr_log'], chunk_size,
+        vehicle_df=vehicle_df, rng=rng), output_dir)
+    stream_table('complaint_handling_log', iter_chunks(
+        vectorized_generator.generate_complaint_handling_log, row_counts['complaint_handling_log'], chunk_size,
+        customer_df=customer_df, product_df=product_df, rng=rng), output_dir)
+    stream_table('cycle_count_log', iter_chunks(
+        vectorized_generator.generate_cycle_count_log, row_counts['cycle_count_log'], chunk_size,
+        product_df=product_df, rng=rng), output_dir)
+    stream_table('product_disposal_log', iter_chunks(
+        vectorized_generator.generate_product_disposal_log, row_counts['product_disposal_log'], chunk_size,
+        product_df=product_df, rng=rng), output_dir)
+    stream_table('warehouse_incident_reporting_log', iter_chunks(
+        vectorized_generator.generate_warehouse_incident_reporting_log, vectorized_generator.DATE_RANGE + 1, chunk_size,
+        rng=rng), output_dir)
+    stream_table('warehouse_temperature_monitoring_log', iter_chunks(
+        vectorized_generator.generate_warehouse_temperature_monitoring_log,
+        row_counts['warehouse_temperature_monitoring_log'], chunk_size, rng=rng,
+        seed=int(rng.integers(2 ** 63))), output_dir)
+
+
 # ------------------------------
 # Generate All Tables
 # ------------------------------
 
-vehicle_df = generate_vehicle_details()
-supplier_df = generate_supplier_details()
-customer_df = generate_customer_details()
-employee_df = generate_employee_details()
-product_df = generate_product_details(supplier_df)
-inbound_log_df = generate_inbound_log(supplier_df, product_df)
-outbound_log_df = generate_outbound_log(customer_df, product_df, vehicle_df)
-return_handling_log_df = generate_return_handling_log(customer_df, product_df, outbound_log_df)
-vehicle_ncr_log_df = generate_vehicle_ncr_log(vehicle_df)
-vehicle_hygiene_log_df = generate_vehicle_hygiene_log(outbound_log_df)
-inbound_inspection_log_df = generate_inbound_inspection_log(inbound_log_df)
-complaint_handling_log_df = generate_complaint_handling_log(customer_df, product_df)
-cycle_count_log_df = generate_cycle_count_log(product_df)
-product_disposal_log_df = generate_product_disposal_log(product_df)
-warehouse_incident_reporting_log_df = generate_warehouse_incident_reporting_log()
+def generate_dimension_tables():
+    vehicle_df = timed_generate('vehicle_details', generate_vehicle_details)
+    supplier_df = timed_generate('supplier_details', generate_supplier_details)
+    customer_df = timed_generate('customer_details', generate_customer_details)
+    employee_df = timed_generate('employee_details', generate_employee_details)
+    product_df = timed_generate('product_details', generate_product_details, supplier_df)
+    return vehicle_df, supplier_df, customer_df, employee_df, product_df
+
+
+def generate_all_tables(row_counts=None):
+    row_counts = row_counts or scaled_row_counts()
+    vehicle_df, supplier_df, customer_df, employee_df, product_df = generate_dimension_tables()
+    inbound_log_df = timed_generate('inbound_log', generate_inbound_log, supplier_df, product_df, row_counts['inbound_log'])
+    outbound_log_df = timed_generate('outbound_log', generate_outbound_log, customer_df, product_df, vehicle_df, row_counts['outbound_log'])
+    return_handling_log_df = timed_generate('return_handling_log', generate_return_handling_log, customer_df, product_df, outbound_log_df, row_counts['return_handling_log'])
+    vehicle_ncr_log_df = timed_generate('vehicle_ncr_log', generate_vehicle_ncr_log, vehicle_df, row_counts['vehicle_ncr_log'])
+    vehicle_hygiene_log_df = timed_generate('vehicle_hygiene_log', generate_vehicle_hygiene_log, outbound_log_df)
+    inbound_inspection_log_df = timed_generate('inbound_inspection_log', generate_inbound_inspection_log, inbound_log_df)
+    complaint_handling_log_df = timed_generate('complaint_handling_log', generate_complaint_handling_log, customer_df, product_df, row_counts['complaint_handling_log'])
+    cycle_count_log_df = timed_generate('cycle_count_log', generate_cycle_count_log, product_df, row_counts['cycle_count_log'])
+    product_disposal_log_df = timed_generate('product_disposal_log', generate_product_disposal_log, product_df, row_counts['product_disposal_log'])
+    warehouse_incident_reporting_log_df = timed_generate('warehouse_incident_reporting_log', generate_warehouse_incident_reporting_log)
+    warehouse_temperature_monitoring_log_df = timed_generate('warehouse_temperature_monitoring_log', generate_warehouse_temperature_monitoring_log, row_counts['warehouse_temperature_monitoring_log'])
+
+    return [
+        ('vehicle_details', vehicle_df),
+        ('supplier_details', supplier_df),
+        ('customer_details', customer_df),
+        ('employee_details', employee_df),
+        ('product_details', product_df),
+        ('inbound_log', inbound_log_df),
+        ('outbound_log', outbound_log_df),
+        ('return_handling_log', return_handling_log_df),
+        ('vehicle_ncr_log', vehicle_ncr_log_df),
+        ('vehicle_hygiene_log', vehicle_hygiene_log_df),
+        ('inbound_inspection_log', inbound_inspection_log_df),
+        ('complaint_handling_log', complaint_handling_log_df),
+        ('cycle_count_log', cycle_count_log_df),
+        ('product_disposal_log', product_disposal_log_df),
+        ('warehouse_incident_reporting_log', warehouse_incident_reporting_log_df),
+        ('warehouse_temperature_monitoring_log', warehouse_temperature_monitoring_log_df)
+    ]
 
 # ------------------------------
-# Save CSV Files
+# Save Output Files
 # ------------------------------
 
-tables = [
-    ('vehicle_details', vehicle_df),
-    ('supplier_details', supplier_df),
-    ('customer_details', customer_df),
-    ('employee_details', employee_df),
-    ('product_details', product_df),
-    ('inbound_log', inbound_log_df),
-    ('outbound_log', outbound_log_df),
-    ('return_handling_log', return_handling_log_df),
-    ('vehicle_ncr_log', vehicle_ncr_log_df),
-    ('vehicle_hygiene_log', vehicle_hygiene_log_df),
-    ('inbound_inspection_log', inbound_inspection_log_df),
-    ('complaint_handling_log', complaint_handling_log_df),
-    ('cycle_count_log', cycle_count_log_df),
-    ('product_disposal_log', product_disposal_log_df),
-    ('warehouse_incident_reporting_log', warehouse_incident_reporting_log_df)
-]
-
-for table_name, df in tables:
-    file_path = f"{table_name}.csv"
-    df.to_csv(file_path, index=False)
-    logger.info(f"Saved {table_name} to {file_path} ({len(df)} rows)")
+def save_tables(tables, output_dir=".", output_format=None):
+    output_format = output_format or OUTPUT_FORMAT
+    for table_name, df in tables:
+        with metrics.span("write", table_name, rows=len(df)) as write_span:
+            if output_format == "parquet":
+                import columnar
+                columnar.clear_table(table_name, output_dir)
+                columnar.write_table(table_name, df, output_dir)
+                file_path = columnar.dataset_path(table_name, output_dir)
+            else:
+                file_path = os.path.join(output_dir, f"{table_name}.csv")
+                df.to_csv(file_path, index=False)
+            write_span.bytes = output_size(file_path)
+        logger.info("Saved %s to %s (%d rows)", table_name, file_path, len(df))
+
+
+def output_size(path):
+    if os.path.isdir(path):
+        return sum(os.path.getsize(os.path.join(root, name)) for root, _, names in os.walk(path) for name in names)
+    return os.path.getsize(path) if os.path.exists(path) else 0
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if argv:
+        # Table names or build options: rebuild only what changed
+        import build_tables
+        return build_tables.main(argv)
+    # Queued logging, written by a background thread (see metrics.py)
+    metrics.configure_logging()
+    if WORKERS:
+        import generation_scheduler
+        generation_scheduler.run_parallel(seed=GENERATOR_SEED, workers=WORKERS)
+    elif STREAMING:
+        stream_all_tables()
+    else:
+        save_tables(generate_all_tables())
+
+    for line in metrics.summary():
+        logger.info(line)
+    json_path, prom_path = metrics.export("generator")
+    logger.info("Metrics written to %s and %s", json_path, prom_path)
+
 
+if __name__ == "__main__":
+    sys.exit(main())
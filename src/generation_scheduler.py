@@ -0,0 +1,217 @@
+import os
+import random
+import inspect
+import logging
+import zlib
+import time
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+import numpy as np
+import pandas as pd
+import vectorized_generator
+import build_tables
+import metrics
+
+logger = logging.getLogger(__name__)
+
+# ------------------------------
+# Parallel Table Generation
+# ------------------------------
+# Log tables are split into fixed-size shards and generated in worker processes
+# as soon as the tables they read from are done. Each shard draws from its own
+# generator seeded with (seed, table, shard), and shards are concatenated in
+# shard order, so a given seed gives byte-identical CSVs for any worker count.
+
+SHARD_ROWS = int(os.environ.get("WIAP_SHARD_ROWS", 250000))
+ORDER_SAMPLE_PER_SHARD = 10000
+
+DIMENSION_TABLES = ['vehicle_details', 'supplier_details', 'customer_details', 'employee_details', 'product_details']
+
+# Generator argument name -> table it reads
+INPUT_TABLES = build_tables.INPUT_TABLES
+
+LOG_GENERATORS = {
+    'inbound_log': vectorized_generator.generate_inbound_log,
+    'outbound_log': vectorized_generator.generate_outbound_log,
+    'return_handling_log': vectorized_generator.generate_return_handling_log,
+    'vehicle_ncr_log': vectorized_generator.generate_vehicle_ncr_log,
+    'complaint_handling_log': vectorized_generator.generate_complaint_handling_log,
+    'cycle_count_log': vectorized_generator.generate_cycle_count_log,
+    'product_disposal_log': vectorized_generator.generate_product_disposal_log,
+    'warehouse_incident_reporting_log': vectorized_generator.generate_warehouse_incident_reporting_log,
+    'warehouse_temperature_monitoring_log': vectorized_generator.generate_warehouse_temperature_monitoring_log,
+}
+
+# Row-aligned tables written by the same shard as their parent
+DERIVED_TABLES = {
+    'inbound_log': ['inbound_inspection_log'],
+    'outbound_log': ['vehicle_hygiene_log'],
+}
+
+
+def table_dependencies():
+    # Read each log table's inputs from the generator's signature
+    deps = {}
+    for table, generate in LOG_GENERATORS.items():
+        params = inspect.signature(generate).parameters
+        deps[table] = sorted({INPUT_TABLES[name] for name in params if name in INPUT_TABLES})
+    return deps
+
+
+def shard_seed(seed, table, shard_index):
+    return np.random.SeedSequence([seed, zlib.crc32(table.encode()), shard_index])
+
+
+def shard_ranges(num_rows, shard_rows=SHARD_ROWS):
+    return [(start, min(shard_rows, num_rows - start)) for start in range(0, num_rows, shard_rows)]
+
+
+def part_path(output_dir, table, shard_index):
+    return os.path.join(output_dir, f"{table}.part{shard_index:05d}.csv")
+
+
+def write_part(table, df, shard_index, output_dir, output_format):
+    with metrics.span("write", table, rows=len(df)) as write_span:
+        if output_format == "parquet":
+            # Shards are written straight into the table's partitioned dataset
+            import columnar
+            columnar.write_table(table, df, output_dir, part=shard_index)
+        else:
+            path = part_path(output_dir, table, shard_index)
+            df.to_csv(path, index=False)
+            write_span.bytes = os.path.getsize(path)
+
+
+def generate_part(table, generate, *args, **kwargs):
+    with metrics.span("generate", table) as generate_span:
+        df = generate(*args, **kwargs)
+        generate_span.rows = len(df)
+    return df
+
+
+# Returns (order sample or None, metrics snapshot of this shard)
+def generate_shard(table, shard_index, start_index, num_rows, seed, inputs, output_dir, output_format="csv"):
+    # Runs in a worker process; workers are reused, so start from an empty registry
+    metrics.registry.reset()
+    rng = np.random.default_rng(shard_seed(seed, table, shard_index))
+    if "seed" in inspect.signature(LOG_GENERATORS[table]).parameters:
+        # Values that must not change at shard boundaries come from the run seed
+        inputs = {**inputs, "seed": seed}
+    df = generate_part(table, LOG_GENERATORS[table], num_rows=num_rows, start_index=start_index, rng=rng, **inputs)
+    write_part(table, df, shard_index, output_dir, output_format)
+
+    for derived in DERIVED_TABLES.get(table, []):
+        if derived == 'inbound_inspection_log':
+            derived_df = generate_part(derived, lambda: df[['inbound_date', 'delivery_note_id', 'product_id', 'received_qty',
+                                                            'rejected_qty', 'rejected_reason']].dropna())
+        else:
+            derived_df = generate_part(derived, vectorized_generator.generate_vehicle_hygiene_log, df, rng=rng)
+        write_part(derived, derived_df, shard_index, output_dir, output_format)
+
+    sample = None
+    if table == 'outbound_log':
+        # Small per-shard order sample for return_handling_log
+        reservoir = vectorized_generator.OrderReservoir(capacity=ORDER_SAMPLE_PER_SHARD, rng=rng)
+        reservoir.add(df)
+        sample = reservoir.to_frame()
+    return sample, metrics.registry.snapshot()
+
+
+def merge_parts(table, num_shards, output_dir):
+    file_path = os.path.join(output_dir, f"{table}.csv")
+    rows = 0
+    with metrics.span("merge", table) as merge_span, open(file_path, "w", newline="") as out:
+        for shard_index in range(num_shards):
+            path = part_path(output_dir, table, shard_index)
+            with open(path, newline="") as part:
+                header = part.readline()
+                if shard_index == 0:
+                    out.write(header)
+                for line in part:
+                    out.write(line)
+                    rows += 1
+            os.remove(path)
+        merge_span.rows, merge_span.bytes = rows, out.tell()
+    logger.info("Saved %s to %s (%d rows, %d shards)", table, file_path, rows, num_shards)
+
+
+def generate_dimensions(seed, output_dir):
+    # Dimension tables are small and call the LLM, so they run in the parent.
+    # The random module is reseeded per table to keep them reproducible.
+    import data_generator
+
+    def seeded(table, generate, *args):
+        random.seed(f"{seed}:{table}")
+        return data_generator.timed_generate(table, generate, *args)
+
+    dims = {
+        'vehicle_details': seeded('vehicle_details', data_generator.generate_vehicle_details),
+        'supplier_details': seeded('supplier_details', data_generator.generate_supplier_details),
+        'customer_details': seeded('customer_details', data_generator.generate_customer_details),
+        'employee_details': seeded('employee_details', data_generator.generate_employee_details),
+    }
+    dims['product_details'] = seeded('product_details', data_generator.generate_product_details, dims['supplier_details'])
+    data_generator.save_tables(dims.items(), output_dir)
+    return dims
+
+
+def run_parallel(output_dir=".", row_counts=None, seed=None, workers=None, shard_rows=SHARD_ROWS):
+    import data_generator
+
+    if seed is None:
+        seed = np.random.SeedSequence().entropy
+        logger.info("No seed given, using %s", seed)
+    seed = int(seed)
+    row_counts = dict(row_counts or data_generator.scaled_row_counts())
+    row_counts['warehouse_incident_reporting_log'] = vectorized_generator.DATE_RANGE + 1
+    workers = workers or os.cpu_count()
+    output_format = data_generator.OUTPUT_FORMAT
+    start_time = time.time()
+
+    inputs = generate_dimensions(seed, output_dir)
+    if output_format == "parquet":
+        import columnar
+        for table in list(LOG_GENERATORS) + [t for derived in DERIVED_TABLES.values() for t in derived]:
+            columnar.clear_table(table, output_dir)
+    deps = table_dependencies()
+    pending = set(LOG_GENERATORS)
+    shards_left = {}
+    order_samples = {}
+    futures = {}
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        while pending or futures:
+            ready = [t for t in sorted(pending) if all(d in inputs for d in deps[t])]
+            for table in ready:
+                pending.remove(table)
+                params = inspect.signature(LOG_GENERATORS[table]).parameters
+                table_inputs = {name: inputs[INPUT_TABLES[name]] for name in params if name in INPUT_TABLES}
+                shards = shard_ranges(row_counts[table], shard_rows)
+                shards_left[table] = len(shards)
+                for shard_index, (start_index, num_rows) in enumerate(shards):
+                    future = pool.submit(generate_shard, table, shard_index, start_index, num_rows, seed, table_inputs,
+                                         output_dir, output_format)
+                    futures[future] = (table, shard_index)
+
+            if not futures:
+                raise RuntimeError(f"Unresolvable table dependencies: {sorted(pending)}")
+
+            done, _ = wait(futures, return_when=FIRST_COMPLETED)
+            for future in done:
+                table, shard_index = futures.pop(future)
+                result, shard_metrics = future.result()
+                metrics.registry.merge(shard_metrics)
+                if result is not None:
+                    order_samples.setdefault(table, {})[shard_index] = result
+                shards_left[table] -= 1
+                if shards_left[table] == 0:
+                    num_shards = len(shard_ranges(row_counts[table], shard_rows))
+                    if output_format != "parquet":
+                        for merged in [table] + DERIVED_TABLES.get(table, []):
+                            merge_parts(merged, num_shards, output_dir)
+                    if table in order_samples:
+                        samples = order_samples.pop(table)
+                        inputs[table] = pd.concat([samples[i] for i in sorted(samples)], ignore_index=True)
+                    else:
+                        inputs[table] = None
+
+    logger.info("Generated all tables with %d workers in %.2f seconds (seed %s)", workers, time.time() - start_time, seed)
@@ -0,0 +1,169 @@
+import os
+import re
+import sys
+import time
+import threading
+import pandas as pd
+from sqlalchemy import text
+
+# ------------------------------
+# Referential Integrity (pre-load)
+# ------------------------------
+# Every FOREIGN KEY in sql/schema.sql is checked in memory before a file is
+# sent: each referenced key column gets a hashed index (a pandas Index) built
+# from the database once and extended with the keys of every batch loaded
+# afterwards, and child columns are checked against it with one vectorized
+# isin() per FK. Rows that fail are written to <WIAP_QUARANTINE_DIR>/<table>.csv
+# with the reason, and only the valid rows are loaded.
+#
+# Standalone, `python integrity.py [csv_dir]` checks the CSVs against each
+# other without a database and quarantines the orphans it finds.
+
+SCHEMA_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "sql", "schema.sql")
+QUARANTINE_DIR = os.environ.get("WIAP_QUARANTINE_DIR", "quarantine")
+
+# Used when schema.sql is not available: table -> [(column, parent, parent column)]
+FOREIGN_KEYS = {
+    "product_details": [("supplier_id", "supplier_details", "supplier_id")],
+    "inbound_log": [("supplier_id", "supplier_details", "supplier_id"), ("product_id", "product_details", "product_id")],
+    "outbound_log": [("customer_id", "customer_details", "customer_id"), ("product_id", "product_details", "product_id"),
+                     ("vehicle_no", "vehicle_details", "vehicle_no")],
+    "return_handling_log": [("customer_id", "customer_details", "customer_id"), ("order_id", "outbound_log", "order_id"),
+                            ("product_id", "product_details", "product_id")],
+    "vehicle_ncr_log": [("vehicle_no", "vehicle_details", "vehicle_no")],
+    "vehicle_hygiene_inspection_log": [("vehicle_no", "vehicle_details", "vehicle_no")],
+    "complaint_handling_log": [("customer_id", "customer_details", "customer_id"),
+                               ("product_id", "product_details", "product_id")],
+    "cycle_count_log": [("product_id", "product_details", "product_id")],
+    "product_disposal_log": [("product_id", "product_details", "product_id")],
+}
+
+# Keys the database cannot enforce: outbound_log is partitioned by month, so
+# order_id has no unique constraint for return_handling_log to reference.
+SOFT_FOREIGN_KEYS = {
+    "return_handling_log": [("order_id", "outbound_log", "order_id")],
+}
+
+
+def foreign_keys(schema_file=SCHEMA_FILE):
+    if not os.path.exists(schema_file):
+        return FOREIGN_KEYS
+    with open(schema_file) as f:
+        schema = f.read()
+    fks = {}
+    for table, body in re.findall(r"CREATE TABLE IF NOT EXISTS (\w+)\s*\((.*?)\);", schema, re.S | re.I):
+        for column, parent, parent_column in re.findall(r"^\s*(\w+)\s[^,\n]*?REFERENCES\s+(\w+)\s*\((\w+)\)", body, re.M | re.I):
+            fks.setdefault(table, []).append((column, parent, parent_column))
+    for table, soft in SOFT_FOREIGN_KEYS.items():
+        fks.setdefault(table, []).extend(fk for fk in soft if fk not in fks[table])
+    return fks
+
+
+# ------------------------------
+# Key Indexes
+# ------------------------------
+class KeyIndexes:
+    # `engine=None` checks files against each other only (no database keys)
+    def __init__(self, engine=None, fks=None):
+        self.engine = engine
+        self.fks = foreign_keys() if fks is None else fks
+        self.indexes = {}
+        # Reentrant: add() holds it across keys() for one read-modify-write
+        self._lock = threading.RLock()
+
+    def referenced_columns(self, table_name):
+        return sorted({parent_column for fks in self.fks.values()
+                       for _, parent, parent_column in fks if parent == table_name})
+
+    def keys(self, parent, column):
+        with self._lock:
+            index = self.indexes.get((parent, column))
+            if index is None:
+                values = []
+                if self.engine is not None:
+                    with self.engine.connect() as conn:
+                        values = conn.execute(text(f"SELECT DISTINCT {column} FROM {parent}")).scalars().all()
+                index = self.indexes[(parent, column)] = pd.Index(values, dtype=object).unique()
+            return index
+
+    def invalidate(self, table_name):
+        # Rows were loaded without passing through add(): read the keys again when needed
+        with self._lock:
+            for key in [key for key in self.indexes if key[0] == table_name]:
+                del self.indexes[key]
+
+    def add(self, table_name, df):
+        # Keys of rows that are now in `table_name`
+        for column in self.referenced_columns(table_name):
+            if column in df:
+                # Concurrent chunk loads of one parent must not drop each other's keys
+                with self._lock:
+                    index = self.keys(table_name, column)
+                    self.indexes[(table_name, column)] = index.append(pd.Index(df[column].dropna().unique())).unique()
+
+    def validate(self, table_name, df):
+        # -> (valid rows, rejected rows with a _reason column)
+        reasons = pd.Series("", index=df.index)
+        for column, parent, parent_column in self.fks.get(table_name, []):
+            if column not in df:
+                continue
+            values = df[column]
+            orphan = values.notna() & ~values.isin(self.keys(parent, parent_column))
+            if orphan.any():
+                reasons[orphan] += f"{column} not in {parent}.{parent_column}; "
+        bad = reasons != ""
+        rejects = df[bad].assign(_reason=reasons[bad].str.rstrip("; "))
+        return df[~bad], rejects
+
+
+# ------------------------------
+# Quarantine
+# ------------------------------
+_quarantine_lock = threading.Lock()
+
+
+def quarantine(table_name, rejects, output_dir=None):
+    if rejects.empty:
+        return None
+    output_dir = output_dir or QUARANTINE_DIR
+    os.makedirs(output_dir, exist_ok=True)
+    path = os.path.join(output_dir, f"{table_name}.csv")
+    rejects = rejects.assign(_quarantined_at=time.strftime("%Y-%m-%d %H:%M:%S"))
+    with _quarantine_lock:
+        rejects.to_csv(path, mode="a", index=False, header=not os.path.exists(path))
+    return path
+
+
+# SQLSTATE classes 22 (data exception) and 23 (integrity constraint violation)
+# are caused by row contents; anything else fails the whole load as before.
+def is_row_error(error):
+    for candidate in (error, getattr(error, "orig", None)):
+        code = getattr(candidate, "pgcode", None) or getattr(candidate, "sqlstate", None)
+        if code:
+            return code[:2] in ("22", "23")
+    return False
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    csv_dir = argv[0] if argv else os.environ.get("WIAP_CSV_DIR", "../data_generator/")
+    from data_loader import LOAD_SEQUENCE
+
+    indexes = KeyIndexes()
+    total = 0
+    for csv_name, table_name, _ in LOAD_SEQUENCE:
+        path = os.path.join(csv_dir, csv_name)
+        if not os.path.exists(path):
+            continue
+        df = pd.read_csv(path, dtype=str, keep_default_na=False, na_values=[""])
+        valid, rejects = indexes.validate(table_name, df)
+        indexes.add(table_name, valid)
+        if len(rejects):
+            total += len(rejects)
+            print(f"{table_name}: {len(rejects)} of {len(df)} rows rejected -> {quarantine(table_name, rejects)}")
+    print(f"{total} rows quarantined" if total else "All foreign keys resolve")
+    return 1 if total else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,180 @@
+import os
+import json
+import time
+import random
+import sqlite3
+import hashlib
+import logging
+import threading
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+# ------------------------------
+# LLM Name Generation (cached, batched)
+# ------------------------------
+# Item lists from the LLM are kept in a SQLite file keyed by
+# (backend, model, prompt, num_items), so repeated runs skip the model calls.
+# Large lists are requested in batches on a small thread pool, and short or
+# duplicate answers are topped up with follow-up requests. Fallback_i
+# placeholders are used only when the top-ups run out.
+# WIAP_LLM_BACKEND=stub returns deterministic names without a model server.
+
+LLM_BACKEND = os.environ.get("WIAP_LLM_BACKEND", "ollama")
+CACHE_PATH = os.environ.get("WIAP_LLM_CACHE", "llm_cache.sqlite")
+CACHE_MAX_BYTES = int(os.environ.get("WIAP_LLM_CACHE_MAX_BYTES", 50 * 1024 * 1024))
+BATCH_SIZE = int(os.environ.get("WIAP_LLM_BATCH_SIZE", 25))
+MAX_CONCURRENCY = int(os.environ.get("WIAP_LLM_CONCURRENCY", 4))
+MAX_TOP_UPS = 3
+
+SYSTEM_PROMPT = 'Provide realistic names/data as a comma-separated list without extra text.'
+
+_cache_lock = threading.Lock()
+
+
+# ------------------------------
+# Backends
+# ------------------------------
+# Backends take the number of items asked for before this call (`offset`),
+# so batches can be told apart; Ollama ignores it.
+def ollama_backend(prompt, model, num_items, offset=0):
+    import ollama
+    response = ollama.chat(
+        model=model,
+        messages=[
+            {'role': 'system', 'content': SYSTEM_PROMPT},
+            {'role': 'user', 'content': f'{prompt}. Provide {num_items} items in a comma-separated list.'},
+        ],
+    )
+    return response['message']['content']
+
+
+STUB_WORDS = {
+    "supplier": (["Golden", "Prime", "Fresh", "Global", "Royal", "Green", "Blue Ridge", "Sunrise", "Evergreen", "Harbor",
+                  "Summit", "Valley", "Pioneer", "Crown", "Silver", "Northern", "Pacific", "Heritage", "Orchard", "Unity"],
+                 ["Foods", "Beverages", "Dairy", "Distributors", "Brands", "Consumer Goods", "Trading", "Farms",
+                  "Industries", "Provisions", "Packaging", "Snacks", "Naturals", "Holdings", "Supplies"]),
+    "customer": (["Sunrise", "Cherry Tree", "Strawberry", "Harbor View", "Green Leaf", "Grand", "City", "Oasis",
+                  "Palm", "Lakeside", "Metro", "Royal", "Corner", "Family", "Fresh Mart", "Golden Gate", "Maple", "Ocean"],
+                 ["Supermarket", "Hotel", "Superstore", "Mini Mart", "Restaurant", "Resort", "Grocers", "Cafe",
+                  "Hypermarket", "Market", "Inn", "Bistro", "Foods", "Store"]),
+    "names": (["Liam", "Emma", "Noah", "Olivia", "James", "Ava", "Lucas", "Mia", "Ethan", "Sophia", "Mason", "Isabella",
+               "Logan", "Amelia", "Elijah", "Harper", "Aiden", "Ella", "Jack", "Chloe", "Ryan", "Grace", "Owen", "Zoe"],
+              ["Perera", "Silva", "Fernando", "Smith", "Brown", "Wilson", "Taylor", "Clark", "Lewis", "Walker", "Young",
+               "King", "Wright", "Hill", "Green", "Adams", "Baker", "Nelson", "Carter", "Mitchell"]),
+    "countries": (["Italy", "Australia", "Germany", "Norway", "Nepal", "Iran", "Brazil", "Oman", "Qatar", "India",
+                   "Japan", "Canada", "China", "Vietnam", "UAE", "Sri Lanka", "Maldives", "Indonesia", "France", "Chile"], [""]),
+}
+
+
+def stub_backend(prompt, model, num_items, offset=0):
+    # Deterministic per prompt; each offset maps to a different slice of the pool
+    lowered = prompt.lower()
+    kind = next((k for k in ("countr", "supplier", "supermarket", "names") if k in lowered), "names")
+    heads, tails = STUB_WORDS[{"countr": "countries", "supermarket": "customer"}.get(kind, kind)]
+    combos = [f"{h} {t}".strip() for h in heads for t in tails]
+    rng = random.Random(hashlib.sha256(prompt.encode()).hexdigest())
+    rng.shuffle(combos)
+    items = [combos[(offset + i) % len(combos)] for i in range(num_items)]
+    return ", ".join(items)
+
+
+BACKENDS = {"ollama": ollama_backend, "stub": stub_backend}
+
+
+# ------------------------------
+# Disk Cache
+# ------------------------------
+@contextmanager
+def _connect():
+    conn = sqlite3.connect(CACHE_PATH, timeout=30)
+    try:
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS llm_cache (
+                cache_key TEXT PRIMARY KEY,
+                items TEXT NOT NULL,
+                size_bytes INTEGER NOT NULL,
+                last_used REAL NOT NULL
+            )
+        """)
+        yield conn
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def cache_key(prompt, model, num_items, backend):
+    return hashlib.sha256(json.dumps([backend, model, prompt, num_items]).encode()).hexdigest()
+
+
+def cache_get(key):
+    with _cache_lock, _connect() as conn:
+        row = conn.execute("SELECT items FROM llm_cache WHERE cache_key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        conn.execute("UPDATE llm_cache SET last_used = ? WHERE cache_key = ?", (time.time(), key))
+        return json.loads(row[0])
+
+
+def cache_put(key, items, max_bytes=None):
+    max_bytes = CACHE_MAX_BYTES if max_bytes is None else max_bytes
+    payload = json.dumps(items)
+    with _cache_lock, _connect() as conn:
+        conn.execute("INSERT OR REPLACE INTO llm_cache VALUES (?, ?, ?, ?)", (key, payload, len(payload), time.time()))
+        # Size-based eviction, least recently used first
+        total = conn.execute("SELECT COALESCE(SUM(size_bytes), 0) FROM llm_cache").fetchone()[0]
+        if total > max_bytes:
+            for old_key, size in conn.execute("SELECT cache_key, size_bytes FROM llm_cache ORDER BY last_used").fetchall():
+                if total <= max_bytes or old_key == key:
+                    break
+                conn.execute("DELETE FROM llm_cache WHERE cache_key = ?", (old_key,))
+                total -= size
+
+
+# ------------------------------
+# Batched Generation
+# ------------------------------
+def request_items(prompt, model, num_items, backend, offset=0):
+    try:
+        text = BACKENDS[backend](prompt, model, num_items, offset)
+    except Exception as e:
+        logger.error(f"LLM error for {prompt}: {e}")
+        return []
+    return [item.strip() for item in text.strip().split(',') if item.strip()]
+
+
+def generate_items(prompt, model="mistral", num_items=1, backend=None):
+    backend = backend or LLM_BACKEND
+    key = cache_key(prompt, model, num_items, backend)
+    cached = cache_get(key)
+    if cached is not None:
+        logger.info(f"LLM cache hit for {prompt} ({len(cached)} items)")
+        return cached
+
+    start_time = time.time()
+    batches = [(start, min(BATCH_SIZE, num_items - start)) for start in range(0, num_items, BATCH_SIZE)]
+    with ThreadPoolExecutor(max_workers=max(1, min(MAX_CONCURRENCY, len(batches)))) as pool:
+        results = list(pool.map(lambda batch: request_items(prompt, model, batch[1], backend, batch[0]), batches))
+
+    # Keep order, drop duplicates across batches, then top up what is missing
+    items = list(dict.fromkeys(item for batch in results for item in batch))[:num_items]
+    offset = num_items
+    for _ in range(MAX_TOP_UPS):
+        if len(items) >= num_items:
+            break
+        missing = num_items - len(items)
+        logger.warning(f"LLM returned {len(items)} items, expected {num_items}. Requesting {missing} more.")
+        extra = request_items(prompt, model, missing, backend, offset)
+        offset += missing
+        items = list(dict.fromkeys(items + extra))[:num_items]
+
+    elapsed = time.time() - start_time
+    logger.info(f"LLM calls for {prompt} returned {len(items)} items in {elapsed:.2f} seconds ({len(batches)} batches)")
+    if len(items) < num_items:
+        logger.warning(f"Still {num_items - len(items)} items short after top-ups. Using fallback.")
+        items.extend([f"Fallback_{i}" for i in range(len(items) + 1, num_items + 1)])
+        # Do not persist placeholder-padded answers
+        return items
+    cache_put(key, items)
+    return items
@@ -0,0 +1,169 @@
+import os
+import io
+import re
+import csv
+import time
+import zlib
+import tempfile
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+import data_loader
+import integrity
+import metrics
+from data_loader import log
+
+# ----------------------------
+# CONFIG
+# ----------------------------
+SCHEMA_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "sql", "schema.sql")
+
+# Files with more data rows than this are split into parallel COPY chunks
+SPLIT_ROWS = int(os.environ.get("WIAP_SPLIT_ROWS", 500000))
+
+# Used when schema.sql is not available
+FK_DEPENDENCIES = {
+    "product_details": {"supplier_details"},
+    "inbound_log": {"supplier_details", "product_details"},
+    "outbound_log": {"customer_details", "product_details", "vehicle_details"},
+    "return_handling_log": {"customer_details", "outbound_log", "product_details"},
+    "vehicle_ncr_log": {"vehicle_details"},
+    "vehicle_hygiene_inspection_log": {"vehicle_details"},
+    "complaint_handling_log": {"customer_details", "product_details"},
+    "cycle_count_log": {"product_details"},
+    "product_disposal_log": {"product_details"},
+}
+
+
+# ----------------------------
+# DEPENDENCY GRAPH
+# ----------------------------
+def schema_dependencies(schema_file=SCHEMA_FILE):
+    if not os.path.exists(schema_file):
+        return FK_DEPENDENCIES
+    with open(schema_file) as f:
+        schema = f.read()
+    deps = {}
+    for table, body in re.findall(r"CREATE TABLE IF NOT EXISTS (\w+)\s*\((.*?)\);", schema, re.S | re.I):
+        parents = set(re.findall(r"REFERENCES\s+(\w+)", body, re.I)) - {table}
+        if parents:
+            deps[table] = parents
+    for table, fks in integrity.SOFT_FOREIGN_KEYS.items():
+        deps.setdefault(table, set()).update(parent for _, parent, _ in fks)
+    return deps
+
+
+# ----------------------------
+# CHUNK SPLITTING
+# ----------------------------
+def count_rows(csv_path):
+    rows = 0
+    with open(csv_path, "rb") as f:
+        while block := f.read(data_loader.COPY_BUFFER_SIZE):
+            rows += block.count(b"\n")
+    return max(rows - 1, 0)
+
+
+def split_csv(csv_path, cols, conflict_key, num_chunks):
+    # Upsert tables are split by a hash of the conflict key so every key stays
+    # in one chunk (last row still wins); append-only tables are dealt round-robin.
+    key_index = cols.index(conflict_key) if conflict_key in cols else None
+    chunks = [io.TextIOWrapper(tempfile.TemporaryFile(), encoding="utf-8", newline="") for _ in range(num_chunks)]
+    writers = [csv.writer(chunk) for chunk in chunks]
+    for writer in writers:
+        writer.writerow(cols)
+    with open(csv_path, newline="") as f:
+        reader = csv.reader(f)
+        next(reader)
+        for i, row in enumerate(reader):
+            if key_index is None:
+                target = i % num_chunks
+            else:
+                target = zlib.crc32(row[key_index].encode()) % num_chunks
+            writers[target].writerow(row)
+    for chunk in chunks:
+        chunk.flush()
+        chunk.buffer.seek(0)
+    return chunks
+
+
+def load_chunk(chunk, table_name, conflict_key):
+    return data_loader.load_source(chunk.buffer, table_name, conflict_key, "copy")
+
+
+def timed(fn, *args):
+    start_time = time.time()
+    return fn(*args), time.time() - start_time
+
+
+# ----------------------------
+# SCHEDULER
+# ----------------------------
+def run_concurrent(load_sequence, workers=None, deps=None):
+    workers = workers or data_loader.LOAD_WORKERS
+    deps = deps or schema_dependencies()
+    tables = {table: (csv_name, key) for csv_name, table, key in load_sequence}
+    pending = [table for _, table, _ in load_sequence]
+    done = set()
+    timings = {}
+    futures = {}
+    chunk_jobs = {}
+    run_start = time.time()
+
+    def submit_table(pool, table):
+        csv_name, key = tables[table]
+        csv_path = os.path.join(data_loader.CSV_DIR, csv_name)
+        start_time = time.time()
+        rows = count_rows(csv_path) if os.path.exists(csv_path) else 0
+        # Incremental runs send small deltas through load_table, which handles the control tables
+        if data_loader.LOAD_METHOD == "copy" and not data_loader.INCREMENTAL and rows > SPLIT_ROWS and workers > 1:
+            cols = data_loader.read_csv_header(csv_path)
+            num_chunks = min(workers, -(-rows // SPLIT_ROWS))
+            log(f"➡️ Splitting {table} ({rows} rows) into {num_chunks} parallel chunks")
+            chunk_jobs[table] = {"left": num_chunks, "rows": 0, "failed": False, "start": start_time}
+            with metrics.span("read_csv", table, rows=rows, nbytes=os.path.getsize(csv_path)):
+                chunks = split_csv(csv_path, cols, key, num_chunks)
+            for chunk in chunks:
+                futures[pool.submit(load_chunk, chunk, table, key)] = (table, chunk)
+        else:
+            futures[pool.submit(timed, data_loader.load_table, csv_name, table, key)] = (table, None)
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        while pending or futures:
+            # Tables outside the load sequence (e.g. not loaded this run) do not block
+            ready = [t for t in pending if all(p in done or p not in tables for p in deps.get(t, ()))]
+            for table in ready:
+                pending.remove(table)
+                submit_table(pool, table)
+
+            if not futures:
+                raise RuntimeError(f"Circular FK dependencies between: {pending}")
+
+            finished, _ = wait(futures, return_when=FIRST_COMPLETED)
+            for future in finished:
+                table, extra = futures.pop(future)
+                if table in chunk_jobs:
+                    job = chunk_jobs[table]
+                    extra.close()
+                    try:
+                        job["rows"] += future.result()
+                    except Exception as e:
+                        job["failed"] = True
+                        log(f"❌ FAILED loading a chunk of {table}: {e}")
+                    job["left"] -= 1
+                    if job["left"]:
+                        continue
+                    del chunk_jobs[table]
+                    elapsed = time.time() - job["start"]
+                    timings[table] = (None if job["failed"] else job["rows"], elapsed)
+                    if not job["failed"]:
+                        log(f"✅ Loaded: {table} ({job['rows']} rows in {elapsed:.2f}s)")
+                else:
+                    timings[table] = future.result()
+                # Dependents still run after a failure, as in the serial loop
+                done.add(table)
+
+    wall = time.time() - run_start
+    log("⏱️ Load timings (table, rows, seconds):")
+    for table, (rows, elapsed) in sorted(timings.items(), key=lambda item: -item[1][1]):
+        log(f"   {table:<40} {'FAILED' if rows is None else rows:>10} {elapsed:>8.2f}")
+    log(f"⏱️ Wall clock: {wall:.2f}s with {workers} connections (sum of table times {sum(t for _, t in timings.values()):.2f}s)")
+    return timings
@@ -0,0 +1,197 @@
+import os
+import json
+import time
+import queue
+import atexit
+import logging
+import threading
+import logging.handlers
+from bisect import bisect_left
+from contextlib import contextmanager
+
+# ------------------------------
+# Pipeline Metrics
+# ------------------------------
+# Stage spans (read_csv, transform, send, merge, commit, generate, write) are
+# recorded per table with their duration, rows and bytes. Each (stage, table)
+# pair also gets a latency histogram. At the end of a run the registry is
+# written as JSON and in the Prometheus text format:
+#
+#   with metrics.span("send", "outbound_log") as s:
+#       ...
+#       s.rows, s.bytes = rows, nbytes
+#
+# Log records go through a queue to a background thread, so callers never
+# wait on the console or the log file (see configure_logging).
+
+METRICS_DIR = os.environ.get("WIAP_METRICS_DIR", ".")
+
+# Upper bounds in seconds, Prometheus style (+Inf is implicit)
+LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300)
+
+
+class Span:
+    __slots__ = ("stage", "table", "rows", "bytes", "seconds", "ok")
+
+    def __init__(self, stage, table, rows=0, nbytes=0):
+        self.stage = stage
+        self.table = table
+        self.rows = rows
+        self.bytes = nbytes
+        self.seconds = 0.0
+        self.ok = True
+
+
+class Registry:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.stages = {}
+
+    def _entry(self, key):
+        entry = self.stages.get(key)
+        if entry is None:
+            entry = self.stages[key] = {
+                "count": 0, "errors": 0, "seconds": 0.0, "max_seconds": 0.0, "rows": 0, "bytes": 0,
+                "buckets": [0] * (len(LATENCY_BUCKETS) + 1),
+            }
+        return entry
+
+    def record(self, span):
+        with self._lock:
+            entry = self._entry((span.stage, span.table or ""))
+            entry["count"] += 1
+            entry["errors"] += 0 if span.ok else 1
+            entry["seconds"] += span.seconds
+            entry["max_seconds"] = max(entry["max_seconds"], span.seconds)
+            entry["rows"] += span.rows or 0
+            entry["bytes"] += span.bytes or 0
+            entry["buckets"][bisect_left(LATENCY_BUCKETS, span.seconds)] += 1
+
+    # Snapshots are plain dicts, so worker processes can send theirs back to be merged
+    def snapshot(self):
+        with self._lock:
+            return [{"stage": stage, "table": table, **dict(entry, buckets=list(entry["buckets"]))}
+                    for (stage, table), entry in sorted(self.stages.items())]
+
+    def merge(self, snapshot):
+        with self._lock:
+            for item in snapshot:
+                entry = self._entry((item["stage"], item["table"]))
+                for field in ("count", "errors", "seconds", "rows", "bytes"):
+                    entry[field] += item[field]
+                entry["max_seconds"] = max(entry["max_seconds"], item["max_seconds"])
+                entry["buckets"] = [a + b for a, b in zip(entry["buckets"], item["buckets"])]
+
+
+registry = Registry()
+
+
+@contextmanager
+def span(stage, table=None, rows=0, nbytes=0):
+    current = Span(stage, table, rows, nbytes)
+    start_time = time.perf_counter()
+    try:
+        yield current
+    except BaseException:
+        current.ok = False
+        raise
+    finally:
+        current.seconds = time.perf_counter() - start_time
+        registry.record(current)
+
+
+# ------------------------------
+# Export
+# ------------------------------
+def to_json(run=None):
+    return {"run": run, "generated_at": time.time(), "buckets": list(LATENCY_BUCKETS), "stages": registry.snapshot()}
+
+
+def _labels(stage, table):
+    return f'stage="{stage}",table="{table}"'
+
+
+def to_prometheus(prefix="wiap"):
+    lines = []
+    entries = registry.snapshot()
+    for name, field, kind, help_text in (
+        ("stage_rows_total", "rows", "counter", "Rows handled by a pipeline stage"),
+        ("stage_bytes_total", "bytes", "counter", "Bytes handled by a pipeline stage"),
+        ("stage_errors_total", "errors", "counter", "Failed pipeline stage runs"),
+    ):
+        lines += [f"# HELP {prefix}_{name} {help_text}", f"# TYPE {prefix}_{name} {kind}"]
+        lines += [f"{prefix}_{name}{{{_labels(e['stage'], e['table'])}}} {e[field]}" for e in entries]
+
+    name = f"{prefix}_stage_duration_seconds"
+    lines += [f"# HELP {name} Duration of pipeline stage runs", f"# TYPE {name} histogram"]
+    for e in entries:
+        labels = _labels(e["stage"], e["table"])
+        cumulative = 0
+        for bound, count in zip(LATENCY_BUCKETS + ("+Inf",), e["buckets"]):
+            cumulative += count
+            lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {cumulative}')
+        lines.append(f"{name}_sum{{{labels}}} {e['seconds']:.6f}")
+        lines.append(f"{name}_count{{{labels}}} {e['count']}")
+    return "\n".join(lines) + "\n"
+
+
+def export(run, output_dir=None):
+    output_dir = output_dir or METRICS_DIR
+    json_path = os.path.join(output_dir, f"{run}_metrics.json")
+    prom_path = os.path.join(output_dir, f"{run}_metrics.prom")
+    with open(json_path, "w") as f:
+        json.dump(to_json(run), f, indent=2)
+    with open(prom_path, "w") as f:
+        f.write(to_prometheus())
+    return json_path, prom_path
+
+
+def summary(limit=15):
+    # Slowest (stage, table) pairs first
+    entries = sorted(registry.snapshot(), key=lambda e: -e["seconds"])[:limit]
+    lines = [f"{'stage':<10} {'table':<34} {'runs':>5} {'rows':>10} {'MB':>9} {'seconds':>9} {'max':>8}"]
+    lines += [f"{e['stage']:<10} {e['table']:<34} {e['count']:>5} {e['rows']:>10} {e['bytes'] / 1e6:>9.2f} "
+              f"{e['seconds']:>9.2f} {e['max_seconds']:>8.2f}" for e in entries]
+    return lines
+
+
+# ------------------------------
+# Non-blocking Logging
+# ------------------------------
+_listeners = []
+
+
+def configure_logging(logger=None, log_file=None, stream=None, console_format="%(levelname)s:%(name)s:%(message)s",
+                      file_format="[%(asctime)s] %(message)s", level=logging.INFO):
+    # The logger only enqueues records; a QueueListener thread formats them and
+    # writes to the console and to a log file that stays open for the whole run.
+    logger = logger if isinstance(logger, logging.Logger) else logging.getLogger(logger)
+    handlers = [logging.StreamHandler(stream)]
+    handlers[0].setFormatter(logging.Formatter(console_format))
+    if log_file:
+        file_handler = logging.FileHandler(log_file, encoding="utf-8")
+        file_handler.setFormatter(logging.Formatter(file_format, datefmt="%Y-%m-%d %H:%M:%S"))
+        handlers.append(file_handler)
+
+    records = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(records, *handlers, respect_handler_level=False)
+    listener.start()
+    _listeners.append(listener)
+
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+    logger.addHandler(logging.handlers.QueueHandler(records))
+    logger.setLevel(level)
+    if logger.name != "root":
+        logger.propagate = False
+    return logger
+
+
+@atexit.register
+def flush_logging():
+    while _listeners:
+        _listeners.pop().stop()
@@ -0,0 +1,37 @@
+import os
+import re
+
+# ------------------------------
+# Table DDL (sql/schema.sql)
+# ------------------------------
+# sql/schema.sql is the only copy of the table definitions. Modules that create
+# their own tables on demand (the control, clean, rollup and telemetry tables)
+# or rebuild one (partitions.migrate) run the statements read from it here:
+# a table's CREATE TABLE and every CREATE INDEX on it, in file order.
+
+SCHEMA_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "sql", "schema.sql")
+
+_STATEMENT_TABLE = re.compile(r"CREATE\s+(?:TABLE\s+IF\s+NOT\s+EXISTS\s+(\w+)"
+                              r"|(?:UNIQUE\s+)?INDEX\s+(?:IF\s+NOT\s+EXISTS\s+)?\w+\s+ON\s+(\w+))", re.I)
+
+
+def statements(schema_file=SCHEMA_FILE):
+    # -> [(table, statement)] for the CREATE TABLE/INDEX statements in the file
+    with open(schema_file) as f:
+        schema = re.sub(r"--[^\n]*", "", f.read())
+    found = []
+    for statement in schema.split(";"):
+        statement = statement.strip()
+        match = _STATEMENT_TABLE.match(statement)
+        if match:
+            found.append((match.group(1) or match.group(2), statement))
+    return found
+
+
+def table_ddl(tables, schema_file=SCHEMA_FILE):
+    # Statements creating `tables` and their indexes, as one script
+    tables, found = set(tables), statements(schema_file)
+    missing = tables - {table for table, _ in found}
+    if missing:
+        raise KeyError(f"Not defined in {schema_file}: {', '.join(sorted(missing))}")
+    return "".join(f"{statement};\n" for table, statement in found if table in tables)
@@ -0,0 +1,434 @@
+import os
+import io
+import sys
+import time
+import threading
+import numpy as np
+import pandas as pd
+from sqlalchemy import text
+import cleansing
+import metrics
+import schema
+import vectorized_generator
+
+# ------------------------------
+# Temperature Telemetry (streaming)
+# ------------------------------
+# Sensor readings are ingested in micro-batches, either from the simulator
+# (vectorized_generator, hundreds of rooms reporting every minute) or from a
+# warehouse_temperature_monitoring_log CSV read in chunks. For each batch:
+#   - every room's last WIAP_ROLLING_WINDOW readings sit in a fixed-size ring
+#     buffer with running sums, so rolling mean/std cost O(1) per reading;
+#   - readings outside the room's band are flagged as excursions, and an alert
+#     is raised once WIAP_ALERT_READINGS of them come in a row (and cleared when
+#     the room is back in band);
+#   - readings are kept only until their hour is complete, then downsampled to
+#     one warehouse_temperature_hourly row per room and hour and loaded.
+# Memory is bounded by rooms x window plus about one hour of readings, however
+# long the stream runs.
+#
+#   python telemetry.py --simulate --days 3 [--rooms 200] [--no-load]
+#   python telemetry.py readings.csv [--no-load]
+
+TABLE = "warehouse_temperature_monitoring_log"
+HOURLY_TABLE = "warehouse_temperature_hourly"
+
+ROOMS = int(os.environ.get("WIAP_TELEMETRY_ROOMS", vectorized_generator.TEMPERATURE_ROOMS))
+# Ring buffers are allocated once for this many rooms
+MAX_ROOMS = int(os.environ.get("WIAP_TELEMETRY_MAX_ROOMS", 4096))
+BATCH_MINUTES = int(os.environ.get("WIAP_STREAM_BATCH_MINUTES", 15))
+BATCH_ROWS = int(os.environ.get("WIAP_STREAM_BATCH_ROWS", 50000))
+ROLLING_WINDOW = int(os.environ.get("WIAP_ROLLING_WINDOW", 30))
+ALERT_READINGS = int(os.environ.get("WIAP_ALERT_READINGS", 5))
+# Hourly rows are sent once this many hours are complete
+FLUSH_HOURS = int(os.environ.get("WIAP_FLUSH_HOURS", 6))
+# Also load every raw reading into warehouse_temperature_monitoring_log
+LOAD_RAW = os.environ.get("WIAP_TELEMETRY_RAW", "0") == "1"
+ALERTS_FILE = os.environ.get("WIAP_ALERTS_FILE", "temperature_alerts.csv")
+
+# Allowed range (°C) by the last word of location_code
+TEMPERATURE_BANDS = {"Bay": (7.0, 13.0), "Room": (-21.0, -15.0)}
+DEFAULT_BAND = (-21.0, -15.0)
+
+TELEMETRY_TABLES_DDL = schema.table_ddl([HOURLY_TABLE])
+
+HOURLY_COLUMNS = ["location_code", "reading_hour", "reading_count", "min_temperature", "max_temperature",
+                  "sum_temperature", "excursion_readings"]
+
+# Readings of an hour that arrive after it was loaded are added to its row
+HOURLY_MERGE = """
+    ON CONFLICT (location_code, reading_hour) DO UPDATE SET
+        reading_count = t.reading_count + EXCLUDED.reading_count,
+        min_temperature = LEAST(t.min_temperature, EXCLUDED.min_temperature),
+        max_temperature = GREATEST(t.max_temperature, EXCLUDED.max_temperature),
+        sum_temperature = t.sum_temperature + EXCLUDED.sum_temperature,
+        excursion_readings = t.excursion_readings + EXCLUDED.excursion_readings
+"""
+
+logger = metrics.configure_logging("telemetry", "telemetry.log", sys.stdout, console_format="%(message)s")
+
+
+def log(msg):
+    logger.info(msg)
+
+
+# ------------------------------
+# Sources
+# ------------------------------
+def simulate(minutes, rooms=ROOMS, batch_minutes=BATCH_MINUTES, rng=None):
+    # Micro-batches of `batch_minutes` minutes of readings from every room
+    rng = rng if rng is not None else np.random.default_rng()
+    seed = int(rng.integers(2 ** 63))
+    for start in range(0, minutes, batch_minutes):
+        num_rows = min(batch_minutes, minutes - start) * rooms
+        with metrics.span("generate", TABLE, rows=num_rows):
+            batch = vectorized_generator.generate_warehouse_temperature_monitoring_log(
+                num_rows, rng=rng, start_index=start * rooms, rooms=rooms, seed=seed)
+        yield batch
+
+
+def read_batches(source, batch_rows=BATCH_ROWS):
+    with pd.read_csv(source, dtype=str, keep_default_na=False, na_values=[""], chunksize=batch_rows) as reader:
+        while True:
+            with metrics.span("read_csv", TABLE) as read_span:
+                batch = next(reader, None)
+                read_span.rows = 0 if batch is None else len(batch)
+            if batch is None:
+                return
+            yield batch
+
+
+# '12.05AM' -> seconds after midnight; a sensor stream only ever has these 1440 labels
+_time_offsets = dict(zip(vectorized_generator.AM_PM_LABELS, np.arange(1440) * 60.0))
+
+
+def parse_readings(batch):
+    # Table-shaped rows -> location_code, reading_at, temperature (unparseable rows dropped)
+    times = batch['inspection_time']
+    new = pd.Series([t for t in times.dropna().unique() if t not in _time_offsets], dtype=object)
+    if len(new):
+        parsed = pd.to_timedelta(cleansing.am_pm_to_time(new)).dt.total_seconds()
+        _time_offsets.update(zip(new, parsed))
+    dates = batch['monitoring_date']
+    if not pd.api.types.is_datetime64_any_dtype(dates):
+        dates = pd.to_datetime(dates, format="%Y-%m-%d", errors="coerce")
+    readings = pd.DataFrame({
+        'location_code': cleansing.clean_text(batch['location_code']),
+        'reading_at': dates + pd.to_timedelta(times.map(_time_offsets), unit="s"),
+        'temperature': pd.to_numeric(batch['temperature'], errors="coerce"),
+    })
+    return readings.dropna().reset_index(drop=True)
+
+
+# ------------------------------
+# Rolling Statistics
+# ------------------------------
+class RollingStats:
+    # One ring buffer of the last `window` readings per room, plus running
+    # sums of the buffered values, all preallocated for `capacity` rooms.
+    def __init__(self, window=ROLLING_WINDOW, capacity=MAX_ROOMS):
+        self.window = window
+        self.capacity = capacity
+        self.codes = []
+        self._index = pd.Index([], dtype=object)
+        self.values = np.full((capacity, window), np.nan)
+        self.position = np.zeros(capacity, dtype=np.int64)
+        self.count = np.zeros(capacity, dtype=np.int64)
+        self.total = np.zeros(capacity)
+        self.total_sq = np.zeros(capacity)
+
+    def rooms(self, codes):
+        # location_code -> buffer row, adding rooms seen for the first time
+        rows = self._index.get_indexer(codes)
+        if (rows < 0).any():
+            new = pd.unique(codes[rows < 0])
+            if len(self.codes) + len(new) > self.capacity:
+                raise ValueError(f"More than {self.capacity} rooms (raise WIAP_TELEMETRY_MAX_ROOMS)")
+            self.codes.extend(new)
+            self._index = pd.Index(self.codes, dtype=object)
+            rows = self._index.get_indexer(codes)
+        return rows
+
+    def push(self, rows, values):
+        # `rows` must be unique: one new reading per room. Returns rolling mean and std.
+        slot = self.position[rows]
+        old = np.where(self.count[rows] == self.window, self.values[rows, slot], 0.0)
+        self.values[rows, slot] = values
+        self.total[rows] += values - old
+        self.total_sq[rows] += values * values - old * old
+        self.position[rows] = (slot + 1) % self.window
+        self.count[rows] = np.minimum(self.count[rows] + 1, self.window)
+        # Once per lap, recompute the sums from the buffer so float error cannot build up
+        lapped = rows[self.position[rows] == 0]
+        if len(lapped):
+            self.total[lapped] = self.values[lapped].sum(axis=1)
+            self.total_sq[lapped] = (self.values[lapped] ** 2).sum(axis=1)
+        count = self.count[rows]
+        mean = self.total[rows] / count
+        std = np.sqrt(np.maximum(self.total_sq[rows] / count - mean * mean, 0.0))
+        return mean, std
+
+
+# ------------------------------
+# Excursion Alerts
+# ------------------------------
+class TemperatureMonitor:
+    def __init__(self, window=ROLLING_WINDOW, alert_readings=ALERT_READINGS, capacity=MAX_ROOMS, bands=None):
+        self.stats = RollingStats(window, capacity)
+        self.alert_readings = alert_readings
+        self.bands = TEMPERATURE_BANDS if bands is None else bands
+        self.low = np.full(capacity, np.nan)
+        self.high = np.full(capacity, np.nan)
+        self.breach_run = np.zeros(capacity, dtype=np.int64)
+        self.breach_start = np.zeros(capacity, dtype="datetime64[ns]")
+        self.alerting = np.zeros(capacity, dtype=bool)
+
+    def band(self, code):
+        return self.bands.get(str(code).rsplit(" ", 1)[-1], DEFAULT_BAND)
+
+    def process(self, readings):
+        # -> (readings with their room row, rolling_mean, rolling_std and excursion; alert events)
+        readings = readings.sort_values('reading_at', kind="stable", ignore_index=True)
+        rows = self.stats.rooms(readings['location_code'].to_numpy(dtype=object))
+        new = np.flatnonzero(np.isnan(self.low[:len(self.stats.codes)]))
+        for row in new:
+            self.low[row], self.high[row] = self.band(self.stats.codes[row])
+
+        temperature = readings['temperature'].to_numpy(dtype=float)
+        reading_at = readings['reading_at'].to_numpy(dtype="datetime64[ns]")
+        mean = np.empty(len(readings))
+        std = np.empty(len(readings))
+        excursion = np.zeros(len(readings), dtype=bool)
+        # Alert events as (reading position, event, breach start)
+        event_rows, event_kinds, event_starts = [], [], []
+
+        # The k-th reading of every room in the batch is applied in step k,
+        # so each step is one vectorized update over distinct rooms.
+        rank = pd.Series(rows).groupby(rows).cumcount().to_numpy()
+        order = np.argsort(rank, kind="stable")
+        bounds = np.searchsorted(rank[order], np.arange(rank.max() + 2 if len(rank) else 1))
+        for k in range(len(bounds) - 1):
+            sel = order[bounds[k]:bounds[k + 1]]
+            room, value = rows[sel], temperature[sel]
+            mean[sel], std[sel] = self.stats.push(room, value)
+            out = (value < self.low[room]) | (value > self.high[room])
+            excursion[sel] = out
+            starts = out & (self.breach_run[room] == 0)
+            self.breach_start[room[starts]] = reading_at[sel[starts]]
+            self.breach_run[room] = np.where(out, self.breach_run[room] + 1, 0)
+            raised = out & ~self.alerting[room] & (self.breach_run[room] >= self.alert_readings)
+            cleared = ~out & self.alerting[room]
+            for event, hit in (("raised", raised), ("cleared", cleared)):
+                if hit.any():
+                    event_rows.append(sel[hit])
+                    event_kinds.append(np.full(hit.sum(), event, dtype=object))
+                    event_starts.append(self.breach_start[room[hit]])
+            self.alerting[room] = (self.alerting[room] | raised) & ~cleared
+
+        readings = readings.assign(room=rows, rolling_mean=mean, rolling_std=std, excursion=excursion)
+        alerts = pd.DataFrame()
+        if event_rows:
+            at = np.concatenate(event_rows)
+            alerts = pd.DataFrame({
+                'event': np.concatenate(event_kinds),
+                'location_code': readings['location_code'].to_numpy(dtype=object)[at],
+                'started_at': np.concatenate(event_starts),
+                'reading_at': reading_at[at],
+                'temperature': temperature[at],
+                'rolling_mean': mean[at],
+                'low': self.low[rows[at]],
+                'high': self.high[rows[at]],
+            })
+        return readings, alerts
+
+
+# ------------------------------
+# Hourly Downsampling
+# ------------------------------
+class HourlyDownsampler:
+    # Readings are folded into (room, hour) partial aggregates as they arrive;
+    # an hour's partials are emitted once a later hour has been seen, so about
+    # one hour of partials per room is held. `codes` maps room rows to
+    # location_code (RollingStats.codes).
+    def __init__(self, codes, capacity=MAX_ROOMS):
+        self.codes = codes
+        self.capacity = capacity
+        self.pending = [np.empty(0, dtype=np.int64)] * 2 + [np.empty(0)] * 5
+
+    def add(self, readings):
+        # -> hourly rows of the hours completed by this batch
+        temperature = readings['temperature'].to_numpy(dtype=float)
+        batch = [readings['reading_at'].to_numpy(dtype="datetime64[h]").astype(np.int64),
+                 readings['room'].to_numpy(dtype=np.int64), np.ones(len(readings)),
+                 temperature, temperature, temperature, readings['excursion'].to_numpy(dtype=float)]
+        hour, room, count, low, high, total, excursions = self.combine(
+            *(np.concatenate([pending, new]) for pending, new in zip(self.pending, batch)))
+        done = hour < hour.max() if len(hour) else np.zeros(0, dtype=bool)
+        self.pending = [column[~done] for column in (hour, room, count, low, high, total, excursions)]
+        return self.to_frame(*(column[done] for column in (hour, room, count, low, high, total, excursions)))
+
+    def flush(self):
+        done, self.pending = self.pending, [column[:0] for column in self.pending]
+        return self.to_frame(*done)
+
+    def combine(self, hour, room, count, low, high, total, excursions):
+        keys, inverse = np.unique(hour * self.capacity + room, return_inverse=True)
+        n = len(keys)
+        minimum, maximum = np.full(n, np.inf), np.full(n, -np.inf)
+        np.minimum.at(minimum, inverse, low)
+        np.maximum.at(maximum, inverse, high)
+        return (keys // self.capacity, keys % self.capacity, np.bincount(inverse, count, n),
+                minimum, maximum, np.bincount(inverse, total, n), np.bincount(inverse, excursions, n))
+
+    def to_frame(self, hour, room, count, low, high, total, excursions):
+        return pd.DataFrame({
+            'location_code': np.asarray(self.codes, dtype=object)[room] if len(room) else np.empty(0, dtype=object),
+            'reading_hour': hour.astype("datetime64[h]").astype("datetime64[s]"),
+            'reading_count': count.astype(np.int64),
+            'min_temperature': low,
+            'max_temperature': high,
+            'sum_temperature': total,
+            'excursion_readings': excursions.astype(np.int64),
+        })
+
+
+# ------------------------------
+# Loading
+# ------------------------------
+def ensure_tables(engine):
+    with engine.begin() as conn:
+        conn.exec_driver_sql(TELEMETRY_TABLES_DDL)
+
+
+def load_hourly(hourly):
+    import data_loader
+    cols = HOURLY_COLUMNS
+    with data_loader.transaction(HOURLY_TABLE) as conn:
+        cur = conn.connection.dbapi_connection.cursor()
+        with metrics.span("send", HOURLY_TABLE, rows=len(hourly)) as send_span:
+            if hasattr(cur, "copy_expert") or hasattr(cur, "copy"):
+                source = io.BytesIO(hourly.to_csv(index=False).encode("utf-8"))
+                staging_table, _ = data_loader.copy_into_staging(cur, source, HOURLY_TABLE, cols)
+                send_span.bytes = source.tell()
+                conn.exec_driver_sql(f"""
+                    INSERT INTO {HOURLY_TABLE} AS t ({", ".join(cols)})
+                    SELECT {", ".join(cols)} FROM {staging_table}
+                    {HOURLY_MERGE}
+                """)
+            else:
+                conn.execute(text(f"""
+                    INSERT INTO {HOURLY_TABLE} AS t ({", ".join(cols)})
+                    VALUES ({", ".join(f":{c}" for c in cols)})
+                    {HOURLY_MERGE}
+                """), hourly.astype(object).to_dict(orient="records"))
+    return len(hourly)
+
+
+def load_raw(batch):
+    import data_loader
+    return data_loader.load_source(data_loader.frame_source(batch), TABLE, "monitoring_id", "copy")
+
+
+_alerts_lock = threading.Lock()
+
+
+def write_alerts(alerts, path=None):
+    path = path or ALERTS_FILE
+    with _alerts_lock:
+        alerts.to_csv(path, mode="a", index=False, header=not os.path.exists(path))
+    return path
+
+
+# ------------------------------
+# Stream
+# ------------------------------
+def run(batches, load=True, load_raw_readings=LOAD_RAW, flush_hours=FLUSH_HOURS, monitor=None):
+    monitor = monitor or TemperatureMonitor()
+    downsampler = HourlyDownsampler(monitor.stats.codes, monitor.stats.capacity)
+    hourly_parts, hours_buffered = [], 0
+    totals = {"readings": 0, "hourly_rows": 0, "alerts": 0}
+    start_time = last_report = time.time()
+    since_report = 0
+
+    def flush():
+        nonlocal hourly_parts, hours_buffered
+        hourly = pd.concat(hourly_parts, ignore_index=True) if hourly_parts else pd.DataFrame(columns=HOURLY_COLUMNS)
+        hourly_parts, hours_buffered = [], 0
+        if hourly.empty:
+            return
+        if load:
+            load_hourly(hourly)
+        totals["hourly_rows"] += len(hourly)
+
+    for batch in batches:
+        with metrics.span("monitor", TABLE, rows=len(batch)):
+            readings, alerts = monitor.process(parse_readings(batch))
+        if len(alerts):
+            totals["alerts"] += int((alerts['event'] == "raised").sum())
+            path = write_alerts(alerts)
+            for alert in alerts[alerts['event'] == "raised"].itertuples():
+                log(f"🌡️ {alert.location_code}: {alert.temperature:g} °C outside {alert.low:g}..{alert.high:g} "
+                    f"since {alert.started_at} (rolling mean {alert.rolling_mean:.1f}) -> {path}")
+        if load and load_raw_readings:
+            load_raw(batch)
+        with metrics.span("downsample", TABLE, rows=len(readings)):
+            hourly = downsampler.add(readings)
+        if len(hourly):
+            hourly_parts.append(hourly)
+            hours_buffered += hourly['reading_hour'].nunique()
+        totals["readings"] += len(readings)
+        since_report += len(readings)
+        if hours_buffered >= flush_hours:
+            flush()
+            # Rate per flush, to see that throughput holds over a long stream
+            elapsed, last_report = time.time() - last_report, time.time()
+            log(f"➡️ {since_report:,} readings up to {readings['reading_at'].max()} "
+                f"({since_report / max(elapsed, 1e-9):,.0f} readings/s)")
+            since_report = 0
+
+    hourly = downsampler.flush()
+    if len(hourly):
+        hourly_parts.append(hourly)
+    flush()
+    totals["seconds"] = round(time.time() - start_time, 2)
+    return totals
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+
+    def option(name, default):
+        return type(default)(argv[argv.index(name) + 1]) if name in argv else default
+
+    load = "--no-load" not in argv
+    if load:
+        import data_loader
+        ensure_tables(data_loader.engine)
+        if LOAD_RAW and data_loader.CLEANSE:
+            data_loader.ensure_clean_tables()
+
+    if "--simulate" in argv:
+        rooms = option("--rooms", ROOMS)
+        seed = os.environ.get("WIAP_SEED")
+        batches = simulate(int(option("--days", 1.0) * 1440), rooms, option("--batch-minutes", BATCH_MINUTES),
+                           np.random.default_rng(None if seed is None else int(seed)))
+        capacity = max(MAX_ROOMS, rooms)
+    else:
+        paths = [arg for arg in argv if not arg.startswith("--")]
+        source = paths[0] if paths else os.path.join(os.environ.get("WIAP_CSV_DIR", "../data_generator/"), f"{TABLE}.csv")
+        batches = read_batches(source, option("--batch-rows", BATCH_ROWS))
+        capacity = MAX_ROOMS
+
+    monitor = TemperatureMonitor(capacity=capacity)
+    totals = run(batches, load=load, monitor=monitor)
+    log(f"✅ {totals['readings']:,} readings in {totals['seconds']}s "
+        f"({totals['readings'] / max(totals['seconds'], 1e-9):,.0f} readings/s): "
+        f"{totals['hourly_rows']:,} hourly rows{' loaded' if load else ''}, {totals['alerts']} alerts raised")
+    for line in metrics.summary():
+        log(f"   {line}")
+    metrics.export("telemetry")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
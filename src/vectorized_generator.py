@@ -0,0 +1,365 @@
+import numpy as np
+import pandas as pd
+
+# ------------------------------
+# Vectorized (NumPy) Log Generators
+# ------------------------------
+# Column-at-a-time versions of the log generators in data_generator.py.
+# Each function keeps the same columns, value ranges and status mixes as its
+# row-by-row counterpart, but draws whole columns from a seeded
+# numpy.random.Generator. `start_index` offsets the running ids (ORD00001,
+# NCR00001, ...) so a table can be produced in several calls.
+
+START_DATE = np.datetime64("2022-01-01", "D")
+END_DATE = np.datetime64("2024-12-31", "D")
+DATE_RANGE = int((END_DATE - START_DATE).astype(int))
+
+# "HH:MM:00" label for every minute of the day, shared by all time columns
+TIME_LABELS = np.array([f"{m // 60:02d}:{m % 60:02d}:00" for m in range(1440)], dtype=object)
+# "12.00AM" style label (warehouse_temperature_monitoring_log.inspection_time)
+AM_PM_LABELS = np.array([f"{(m // 60 + 11) % 12 + 1:02d}.{m % 60:02d}{'AM' if m < 720 else 'PM'}"
+                         for m in range(1440)], dtype=object)
+
+
+def _rng(rng):
+    return rng if rng is not None else np.random.default_rng()
+
+
+def _random_dates(rng, n):
+    return START_DATE + rng.integers(0, DATE_RANGE + 1, n).astype("timedelta64[D]")
+
+
+def _random_minutes(rng, n, first_hour, last_hour):
+    return rng.integers(first_hour, last_hour + 1, n) * 60 + rng.integers(0, 60, n)
+
+
+def _time_labels(minutes):
+    # Times wrap past midnight exactly like datetime + timedelta -> .time()
+    return TIME_LABELS[np.asarray(minutes) % 1440]
+
+
+def _choice(rng, values, n):
+    values = np.asarray(values, dtype=object)
+    return values[rng.integers(0, len(values), n)]
+
+
+def _shuffled_mix(rng, n, mix):
+    # Scale a fixed status mix (e.g. 22500/2000/500) to n rows and shuffle it
+    labels = np.array([label for label, _ in mix], dtype=object)
+    weights = np.array([count for _, count in mix], dtype=float)
+    counts = np.floor(n * weights / weights.sum()).astype(np.int64)
+    counts[0] += n - counts.sum()
+    statuses = np.repeat(labels, counts)
+    rng.shuffle(statuses)
+    return statuses
+
+
+def _running_ids(prefix, start_index, n, width=5):
+    numbers = np.arange(start_index + 1, start_index + n + 1).astype(str)
+    return np.char.add(prefix, np.char.zfill(numbers, width)).astype(object)
+
+
+def generate_inbound_log(supplier_df, product_df, num_rows=25000, rng=None, start_index=0):
+    rng = _rng(rng)
+    supplier_ids = supplier_df['supplier_id'].unique()
+    delivery_note_ids = product_df['delivery_note_id'].to_numpy(dtype=object)
+    product_ids = product_df['product_id'].to_numpy(dtype=object)
+    inbound_statuses = _shuffled_mix(rng, num_rows, [('Accepted', 22500), ('Rejected', 2000), ('On-hold', 500)])
+    rejected_reasons = np.array(["Quality Issue", "Regulatory issue"], dtype=object)
+
+    inbound_date = _random_dates(rng, num_rows)
+    unloading_start = _random_minutes(rng, num_rows, 9, 14)
+    supplier_id = _choice(rng, supplier_ids, num_rows)
+    product_idx = rng.integers(0, len(product_ids), num_rows)
+    received_qty = rng.integers(100, 2501, num_rows)
+    flagged = inbound_statuses != 'Accepted'
+    rejected_qty = np.where(flagged, np.rint(received_qty * rng.uniform(0.0, 0.05, num_rows)), 0).astype(np.int64)
+    rejected_reason = np.where(flagged, _choice(rng, rejected_reasons, num_rows), None)
+    unloading_completed = unloading_start + rng.integers(60, 181, num_rows)
+    putaway_completed = unloading_completed + rng.integers(10, 46, num_rows)
+
+    return pd.DataFrame({
+        'inbound_date': inbound_date,
+        'supplier_id': supplier_id,
+        'delivery_note_id': delivery_note_ids[product_idx],
+        'product_id': product_ids[product_idx],
+        'received_qty': received_qty,
+        'rejected_qty': rejected_qty,
+        'inbound_status': inbound_statuses,
+        'rejected_reason': rejected_reason,
+        'unloading_started_time': _time_labels(unloading_start),
+        'unloading_completed_time': _time_labels(unloading_completed),
+        'inbound_putaway_completed_time': _time_labels(putaway_completed),
+    }).dropna()
+
+
+def generate_outbound_log(customer_df, product_df, vehicle_df, num_rows=25000, rng=None, start_index=0):
+    rng = _rng(rng)
+    mismatch_rows = min(num_rows, round(num_rows * 750 / 25000))
+    mismatched = np.zeros(num_rows, dtype=bool)
+    mismatched[rng.choice(num_rows, mismatch_rows, replace=False)] = True
+
+    outbound_date = _random_dates(rng, num_rows)
+    ordered_qty = rng.integers(11, 1001, num_rows)
+    # randint(1, ordered_qty - 1) for the short-picked orders
+    short_pick = 1 + np.floor(rng.random(num_rows) * (ordered_qty - 1)).astype(np.int64)
+    picked_qty = np.where(mismatched, short_pick, ordered_qty)
+    pick_sheet_issued = _random_minutes(rng, num_rows, 21, 23)
+    pick_completed = pick_sheet_issued + rng.integers(30, 91, num_rows)
+    loading_completed = pick_completed + rng.integers(20, 41, num_rows)
+
+    return pd.DataFrame({
+        'outbound_date': outbound_date,
+        'order_id': _running_ids("ORD", start_index, num_rows),
+        'customer_id': _choice(rng, customer_df['customer_id'], num_rows),
+        'product_id': _choice(rng, product_df['product_id'], num_rows),
+        'ordered_qty': ordered_qty,
+        'picked_qty': picked_qty,
+        'pick_sheet_issued_time': _time_labels(pick_sheet_issued),
+        'pick_completed_time': _time_labels(pick_completed),
+        'vehicle_no': _choice(rng, vehicle_df['vehicle_no'], num_rows),
+        'loading_completed_time': _time_labels(loading_completed),
+    }).dropna()
+
+
+def generate_return_handling_log(customer_df, product_df, outbound_log_df, num_rows=1000, rng=None, start_index=0):
+    rng = _rng(rng)
+    order_ids = outbound_log_df['order_id'].to_numpy(dtype=object)
+    ordered_qtys = outbound_log_df['ordered_qty'].to_numpy(dtype=np.int64)
+    return_reasons = ["Low shelf life", "Quality issue", "Incorrect item", "Temperature issue"]
+
+    return_date = _random_dates(rng, num_rows)
+    customer_id = _choice(rng, customer_df['customer_id'], num_rows)
+    order_idx = rng.integers(0, len(order_ids), num_rows)
+    product_id = _choice(rng, product_df['product_id'], num_rows)
+    ordered_qty = ordered_qtys[order_idx]
+    # randint(1, ordered_qty), redrawn from 1..ordered_qty-1 when the whole order came back
+    returned_qty = 1 + np.floor(rng.random(num_rows) * ordered_qty).astype(np.int64)
+    full_return = (returned_qty == ordered_qty) & (ordered_qty > 1)
+    redraw = 1 + np.floor(rng.random(num_rows) * np.maximum(ordered_qty - 1, 1)).astype(np.int64)
+    returned_qty = np.where(full_return, redraw, returned_qty)
+    return_reason = _choice(rng, return_reasons, num_rows)
+    unloading_start = _random_minutes(rng, num_rows, 9, 14)
+    putaway_completed = unloading_start + rng.integers(20, 41, num_rows)
+
+    return pd.DataFrame({
+        'return_date': return_date,
+        'customer_id': customer_id,
+        'order_id': order_ids[order_idx],
+        'product_id': product_id,
+        'returned_qty': returned_qty,
+        'return_reason': return_reason,
+        'return_unloading_started_time': _time_labels(unloading_start),
+        'return_putaway_completed_time': _time_labels(putaway_completed),
+    }).dropna()
+
+
+def generate_vehicle_ncr_log(vehicle_df, num_rows=200, rng=None, start_index=0):
+    rng = _rng(rng)
+    ncr_reasons = ["Defective truck box", "Defective truck floor", "Defective truck door", "Defective cooling unit", "Odor", "Pest"]
+    ncr_statuses = _shuffled_mix(rng, num_rows, [("CA pending", 1), ("CA completed", 1)])
+
+    ncr_raised_date = _random_dates(rng, num_rows)
+    vehicle_no = _choice(rng, vehicle_df['vehicle_no'], num_rows)
+    ncr_reason = _choice(rng, ncr_reasons, num_rows)
+    ca_days = rng.integers(3, 11, num_rows).astype("timedelta64[D]")
+    ca_completed_date = np.where(ncr_statuses == "CA completed", ncr_raised_date + ca_days, np.datetime64("NaT"))
+
+    return pd.DataFrame({
+        'ncr_raised_date': ncr_raised_date,
+        'ncr_id': _running_ids("NCR", start_index, num_rows),
+        'vehicle_no': vehicle_no,
+        'ncr_reason': ncr_reason,
+        'ncr_status': ncr_statuses,
+        'ca_completed_date': ca_completed_date,
+    }).dropna()
+
+
+def generate_vehicle_hygiene_log(outbound_log_df, rng=None):
+    rng = _rng(rng)
+    num_rows = len(outbound_log_df)
+    yes_no = np.array(["Yes", "No"], dtype=object)
+    checks = ['good_truckbox', 'good_truckfloor', 'good_truckdoor', 'good_curtain', 'good_cooling_unit', 'pest_check', 'odor_check']
+    data = {
+        'inspection_date': outbound_log_df['outbound_date'].to_numpy(),
+        'vehicle_no': outbound_log_df['vehicle_no'].to_numpy(dtype=object),
+    }
+    for check in checks:
+        # "No" in 2 of every 100 inspections, as in the 98/2 option list
+        data[check] = yes_no[(rng.random(num_rows) < 0.02).astype(np.int8)]
+    return pd.DataFrame(data).dropna()
+
+
+def generate_complaint_handling_log(customer_df, product_df, num_rows=125, rng=None, start_index=0):
+    rng = _rng(rng)
+    complaint_categories = ["Spoilage/ Contamination", "Damaged", "Off-Taste/ Off-Smell/ Off-Color", "Expired", "Foreign Substance", "Mold Growth", "Defrosted"]
+    complaint_statuses = _shuffled_mix(rng, num_rows, [("Resolved", 100), ("Pending", 25)])
+
+    complaint_date = _random_dates(rng, num_rows)
+    customer_id = _choice(rng, customer_df['customer_id'], num_rows)
+    product_id = _choice(rng, product_df['product_id'], num_rows)
+    complaint_qty = rng.integers(1, 101, num_rows)
+    complaint_category = _choice(rng, complaint_categories, num_rows)
+    resolution_days = rng.integers(2, 5, num_rows).astype("timedelta64[D]")
+    resolution_completed_date = np.where(complaint_statuses == "Resolved", complaint_date + resolution_days, np.datetime64("NaT"))
+
+    return pd.DataFrame({
+        'complaint_date': complaint_date,
+        'complaint_id': _running_ids("CMP", start_index, num_rows),
+        'customer_id': customer_id,
+        'product_id': product_id,
+        'complaint_qty': complaint_qty,
+        'complaint_category': complaint_category,
+        'complaint_status': complaint_statuses,
+        'resolution_completed_date': resolution_completed_date,
+    }).dropna()
+
+
+def generate_cycle_count_log(product_df, num_rows=2500, rng=None, start_index=0):
+    rng = _rng(rng)
+    product_ids = product_df['product_id'].to_numpy(dtype=object)
+    system_qtys = product_df['system_qty'].to_numpy(dtype=np.int64)
+    mismatch_rows = min(num_rows, round(num_rows * 125 / 2500))
+    mismatched = np.zeros(num_rows, dtype=bool)
+    mismatched[rng.choice(num_rows, mismatch_rows, replace=False)] = True
+
+    count_date = _random_dates(rng, num_rows)
+    product_idx = rng.integers(0, len(product_ids), num_rows)
+    system_qty = system_qtys[product_idx]
+    lower_bound = np.maximum(20, (system_qty * 0.95).astype(np.int64))
+    upper_bound = (system_qty * 1.05).astype(np.int64)
+    span = np.maximum(upper_bound - lower_bound + 1, 1)
+    recount = lower_bound + np.floor(rng.random(num_rows) * span).astype(np.int64)
+    counted_qty = np.where(mismatched, recount, system_qty)
+
+    return pd.DataFrame({
+        'count_date': count_date,
+        'product_id': product_ids[product_idx],
+        'system_qty': system_qty,
+        'counted_qty': counted_qty,
+    }).dropna()
+
+
+def generate_product_disposal_log(product_df, num_rows=700, rng=None, start_index=0):
+    rng = _rng(rng)
+    disposal_reasons = ["Expired", "Quality issue", "Physical damage", "Regulatory issue"]
+    qcm_approvals = _shuffled_mix(rng, num_rows, [("Approved", 679), ("Pending", 21)])
+
+    return pd.DataFrame({
+        'disposal_date': _random_dates(rng, num_rows),
+        'product_id': _choice(rng, product_df['product_id'], num_rows),
+        'disposal_reason': _choice(rng, disposal_reasons, num_rows),
+        'disposal_qty': rng.integers(6, 100, num_rows),
+        'qcm_approval': qcm_approvals,
+    }).dropna()
+
+
+def generate_warehouse_incident_reporting_log(rng=None, start_index=0, num_rows=None):
+    rng = _rng(rng)
+    if num_rows is None:
+        num_rows = DATE_RANGE + 1 - start_index
+    incident_choices = np.array(["0", "1", "2", "3"], dtype=object)
+    shift_choices = ["Day Shift", "Night Shift"]
+
+    return pd.DataFrame({
+        'reporting_id': _running_ids("INC", start_index, num_rows),
+        'reporting_date': START_DATE + np.arange(start_index, start_index + num_rows).astype("timedelta64[D]"),
+        'operation_shift': _choice(rng, shift_choices, num_rows),
+        'no_of_incidents': incident_choices[rng.choice(4, num_rows, p=[0.70, 0.20, 0.07, 0.03])],
+    }).dropna()
+
+
+# Temperature sensors: row i is room (i % rooms) at minute (i // rooms) after
+# START_DATE, so a run of any length can be cut into shards or micro-batches.
+# Freezer rooms hold -18 °C and the two docks +10 °C, each with a daily swing
+# and sensor noise. Within any hour a room may have a door-open or defrost
+# excursion of +4..+9 °C lasting its first 5-40 minutes. Excursions are hashed
+# from (seed, room, hour since START_DATE) rather than drawn from `rng`, so an
+# hour split across calls still gets one excursion, whatever the chunk, batch
+# or shard boundaries.
+TEMPERATURE_ROOMS = 200
+EXCURSION_RATE = 0.02
+_UINT64_MASK = (1 << 64) - 1
+
+
+def _splitmix64(x):
+    # uint64 arrays wrap on overflow, which the mixing relies on
+    x = x + np.uint64(0x9E3779B97F4A7C15)
+    x = (x ^ (x >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    x = (x ^ (x >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return x ^ (x >> np.uint64(31))
+
+
+def _hashed_uniform(seed, stream, *keys):
+    # Uniform [0, 1) per element of `keys`, fixed by (seed, stream, keys) alone
+    x = _splitmix64(np.array([int(seed) & _UINT64_MASK], dtype=np.uint64) ^ np.uint64(stream))
+    for key in keys:
+        x = _splitmix64(x ^ np.asarray(key).astype(np.uint64))
+    return (x >> np.uint64(11)) * 2.0 ** -53
+
+
+def temperature_rooms(rooms=TEMPERATURE_ROOMS):
+    zones = [f"{chr(ord('A') + i // 20)}{i % 20 + 1:02d} Room" for i in range(max(rooms - 2, 0))]
+    return np.array((["Inbound Bay", "Outbound Bay"] + zones)[:rooms], dtype=object)
+
+
+def generate_warehouse_temperature_monitoring_log(num_rows=28800, rng=None, start_index=0, rooms=TEMPERATURE_ROOMS,
+                                                  seed=None):
+    # Pass the same `seed` to every call that makes up one table
+    rng = _rng(rng)
+    if seed is None:
+        seed = int(rng.integers(2 ** 63))
+    codes = temperature_rooms(rooms)
+    setpoints = np.where(np.char.endswith(codes.astype(str), "Bay"), 10.0, -18.0)
+    phases = np.arange(rooms) * (2 * np.pi / rooms)
+
+    rows = np.arange(start_index, start_index + num_rows)
+    room, minute = rows % rooms, rows // rooms
+    minute_of_day = minute % 1440
+    temperature = (setpoints[room]
+                   + 1.5 * np.sin(2 * np.pi * minute_of_day / 1440 + phases[room])
+                   + rng.normal(0, 0.6, num_rows))
+
+    hour = minute // 60
+    excursion = _hashed_uniform(seed, 0, room, hour) < EXCURSION_RATE
+    duration = 5 + (_hashed_uniform(seed, 1, room, hour) * 36).astype(np.int64)
+    rise = 4 + 5 * _hashed_uniform(seed, 2, room, hour)
+    temperature += np.where(excursion & (minute % 60 < duration), rise, 0.0)
+
+    return pd.DataFrame({
+        'monitoring_date': START_DATE + (minute // 1440).astype("timedelta64[D]"),
+        'location_code': codes[room],
+        'inspection_time': AM_PM_LABELS[minute_of_day],
+        'temperature': np.rint(temperature).astype(np.int64),
+    })
+
+
+class OrderReservoir:
+    # Fixed-size uniform sample of (order_id, ordered_qty) over a stream of
+    # outbound chunks (reservoir sampling), so returns can reference orders
+    # without keeping the whole outbound_log in memory.
+    def __init__(self, capacity=100000, rng=None):
+        self.capacity = capacity
+        self.rng = _rng(rng)
+        self.seen = 0
+        self.order_ids = np.empty(capacity, dtype=object)
+        self.ordered_qtys = np.empty(capacity, dtype=np.int64)
+
+    def add(self, outbound_chunk):
+        order_ids = outbound_chunk['order_id'].to_numpy(dtype=object)
+        ordered_qtys = outbound_chunk['ordered_qty'].to_numpy(dtype=np.int64)
+        n = len(order_ids)
+        positions = self.seen + np.arange(n)
+        fill = positions < self.capacity
+        self.order_ids[positions[fill]] = order_ids[fill]
+        self.ordered_qtys[positions[fill]] = ordered_qtys[fill]
+        # Item i (0-based) replaces a random slot with probability capacity / (i + 1)
+        slots = np.floor(self.rng.random(n) * (positions + 1)).astype(np.int64)
+        replace = ~fill & (slots < self.capacity)
+        self.order_ids[slots[replace]] = order_ids[replace]
+        self.ordered_qtys[slots[replace]] = ordered_qtys[replace]
+        self.seen += n
+
+    def to_frame(self):
+        size = min(self.seen, self.capacity)
+        return pd.DataFrame({'order_id': self.order_ids[:size], 'ordered_qty': self.ordered_qtys[:size]})
@@ -0,0 +1,40 @@
+import os
+import sys
+import tempfile
+import pytest
+
+# The modules in src/ import each other as top-level modules, as when run as scripts
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+# Some modules open their log file (loader.log, telemetry.log, ...) in the
+# working directory on import; keep those out of the checkout
+os.chdir(tempfile.mkdtemp(prefix="wiap-tests-"))
+
+
+@pytest.fixture
+def loader_db(monkeypatch):
+    # data_loader against a scratch schema built from sql/schema.sql; the
+    # tests using it run only when WIAP_TEST_DB_URL names a PostgreSQL database
+    url = os.environ.get("WIAP_TEST_DB_URL")
+    if not url:
+        pytest.skip("WIAP_TEST_DB_URL is not set")
+    from sqlalchemy import create_engine
+    import data_loader
+    import integrity
+    import schema
+
+    name = f"wiap_test_{os.getpid()}"
+    admin = create_engine(url)
+    with admin.begin() as conn:
+        conn.exec_driver_sql(f"DROP SCHEMA IF EXISTS {name} CASCADE; CREATE SCHEMA {name}")
+    engine = create_engine(url, connect_args={"options": f"-csearch_path={name}"})
+    with engine.begin() as conn:
+        conn.exec_driver_sql("".join(f"{statement};\n" for _, statement in schema.statements()))
+    monkeypatch.setattr(data_loader, "engine", engine)
+    monkeypatch.setattr(data_loader, "key_indexes", integrity.KeyIndexes(engine))
+    monkeypatch.setattr(data_loader, "CLEANSE", False)
+    yield engine
+    engine.dispose()
+    with admin.begin() as conn:
+        conn.exec_driver_sql(f"DROP SCHEMA {name} CASCADE")
+    admin.dispose()
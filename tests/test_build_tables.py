@@ -0,0 +1,65 @@
+import ast
+import pytest
+import build_tables
+
+
+def test_build_keys_are_stable():
+    assert build_tables.plan(42, "numpy", 1.0, "stub") == build_tables.plan(42, "numpy", 1.0, "stub")
+
+
+def test_build_keys_follow_parameters():
+    base = build_tables.plan(42, "numpy", 1.0, "stub")
+    reseeded = build_tables.plan(43, "numpy", 1.0, "stub")
+    assert all(base[table]["key"] != reseeded[table]["key"] for table in build_tables.TABLES)
+
+    rescaled = build_tables.plan(42, "numpy", 2.0, "stub")
+    assert base["cycle_count_log"]["key"] != rescaled["cycle_count_log"]["key"]
+    # The incident log has one row per day whatever the scale
+    assert base["warehouse_incident_reporting_log"]["key"] == rescaled["warehouse_incident_reporting_log"]["key"]
+
+    other_llm = build_tables.plan(42, "numpy", 1.0, "ollama")
+    assert base["vehicle_details"]["key"] == other_llm["vehicle_details"]["key"]
+    assert base["supplier_details"]["key"] != other_llm["supplier_details"]["key"]
+
+
+def test_code_fingerprint_ignores_comments_and_layout():
+    plain = ast.parse("def f(x):\n    return x + 1\n").body[0]
+    commented = ast.parse("def f(x):  # increment\n\n    return (x\n            + 1)\n").body[0]
+    assert (build_tables.code_fingerprint({("m", "f"): plain}, [("m", "f")])
+            == build_tables.code_fingerprint({("m", "f"): commented}, [("m", "f")]))
+
+
+def test_code_changes_rebuild_downstream(monkeypatch):
+    original = build_tables.plan(42, "numpy", 1.0, "stub")
+    definitions = build_tables.module_definitions()
+    edited = ast.parse("def generate_product_details(supplier_df, num_rows=500):\n    return supplier_df").body[0]
+    monkeypatch.setattr(build_tables, "module_definitions",
+                        lambda: {**definitions, ("data_generator", "generate_product_details"): edited})
+
+    changed = build_tables.plan(42, "numpy", 1.0, "stub")
+    assert changed["supplier_details"]["key"] == original["supplier_details"]["key"]
+    assert changed["product_details"]["key"] != original["product_details"]["key"]
+    # cycle_count_log reads product_details
+    assert changed["cycle_count_log"]["key"] != original["cycle_count_log"]["key"]
+
+
+def test_dependents_are_the_tables_read():
+    tables = build_tables.plan(42, "numpy", 1.0, "stub")
+    assert build_tables.dependents(tables) == {
+        "vehicle_details", "supplier_details", "customer_details", "product_details", "inbound_log", "outbound_log"}
+
+
+def test_parse_args(monkeypatch):
+    monkeypatch.delenv("WIAP_SEED", raising=False)
+    monkeypatch.setenv("WIAP_ROW_SCALE", "0.5")
+    args = build_tables.parse_args(["inbound_log", "--seed", "7", "outbound_log", "--backend", "numpy", "--force"])
+    assert args.tables == ["inbound_log", "outbound_log"]
+    assert (args.seed, args.backend, args.scale, args.force, args.dry_run) == (7, "numpy", 0.5, True, False)
+    assert build_tables.parse_args([]).seed is None
+
+
+@pytest.mark.parametrize("argv", [["inbound_log", "--seed"], ["--seed", "x"], ["--backend", "cuda"], ["--scale", "0"]])
+def test_parse_args_rejects_bad_options(argv):
+    with pytest.raises(SystemExit) as exit_info:
+        build_tables.parse_args(argv)
+    assert exit_info.value.code == 2
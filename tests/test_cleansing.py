@@ -0,0 +1,40 @@
+from decimal import Decimal
+import pandas as pd
+import cleansing
+
+
+def text(*values):
+    return pd.Series(values, dtype=object)
+
+
+def test_clean_text_is_sql_trim_and_coalesce():
+    cleaned = cleansing.clean_text(text(" A1 ", "", "   ", None, "\tB"))
+    assert list(cleaned) == ["A1", "missing", "missing", "missing", "\tB"]
+
+
+def test_to_time_keeps_canonical_times_and_parses_the_rest():
+    times = cleansing.to_time(text("07:05:00", "7:05:09", None, "25:00:00", "not a time"))
+    assert list(times) == ["07:05:00", "07:05:09", "00:00:00", "01:00:00", "00:00:00"]
+
+
+def test_to_int_and_to_money():
+    assert list(cleansing.to_int(text("12", "", None, "x"))) == [12, -999, -999, -999]
+    assert cleansing.to_int(text("12", None), fill=None).isna().tolist() == [False, True]
+    assert list(cleansing.to_money(text("1.005", "2", None))) == [Decimal("1.01"), Decimal("2.00"), Decimal("0.00")]
+
+
+def test_like_cascade_first_match_wins():
+    countries = text("Cosmetics Ltd", "China Light", "Spain", None)
+    cleaned = cleansing.like_cascade(countries, cleansing.SUPPLIER_COUNTRY_RULES, countries)
+    assert cleaned.tolist()[:3] == ["Australia", "Italy", "Spain"]
+    assert pd.isna(cleaned[3])
+
+
+def test_clean_vehicle_details():
+    df = pd.DataFrame({"vehicle_no": [" 123456", "234567", "345678"], "vehicle_capacity": ["10 ton", "12 ton", "20 ton"]})
+    cleaned = cleansing.clean_vehicle_details(df)
+    assert cleaned.to_dict("list") == {
+        "vehicle_no": ["123456", "234567", "345678"],
+        "vehicle_capacity": ["10 ton", "15 ton", "20 ton"],
+        "vehicle_cbm": ["45", "60", "75"],
+    }
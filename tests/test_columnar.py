@@ -0,0 +1,58 @@
+import os
+import datetime
+import io
+import pandas as pd
+import pytest
+import columnar
+
+NCR_ROWS = pd.DataFrame({
+    "ncr_raised_date": [datetime.date(2024, 3, 30), datetime.date(2024, 4, 2), datetime.date(2024, 3, 1)],
+    "ncr_id": ["NCR00001", "NCR00002", "NCR00003"], "vehicle_no": ["100001", "100002", "100001"],
+    "ncr_reason": ["Odor", "Pest", "Odor"], "ncr_status": ["CA completed", "CA pending", "CA pending"],
+    "ca_completed_date": [datetime.date(2024, 4, 5), None, None]})
+
+PRODUCT_ROWS = pd.DataFrame({
+    "supplier_id": ["SUP001", "SUP002"], "delivery_note_id": ["123456", "654321"], "product_id": ["500001", "500002"],
+    "product_name": ["Product_0", "Product_1"], "system_qty": [20, 1000], "product_cost": [5.0, 499.99],
+    "product_price": [6.5, 649.99], "product_carton_volume_cbm": [0.05, 1.5]})
+
+
+def as_csv(table, dtype=str):
+    sink = io.BytesIO()
+    columnar.write_csv(table, sink)
+    return pd.read_csv(io.BytesIO(sink.getvalue()), dtype=dtype, keep_default_na=False)
+
+
+def csv_rows(df, dtype=str):
+    # What the CSV output of the same frame holds
+    return pd.read_csv(io.StringIO(df.to_csv(index=False)), dtype=dtype, keep_default_na=False)
+
+
+def test_partitioned_table_round_trip(tmp_path):
+    columnar.write_table("vehicle_ncr_log", NCR_ROWS.iloc[:2], tmp_path)
+    columnar.write_table("vehicle_ncr_log", NCR_ROWS.iloc[2:], tmp_path, part=1)
+    path = columnar.find_table("vehicle_ncr_log", tmp_path)
+    assert sorted(os.listdir(path)) == ["month=2024-03", "month=2024-04"]
+
+    table = columnar.read_table("vehicle_ncr_log", path)
+    assert table.schema == columnar.TABLE_SCHEMAS["vehicle_ncr_log"]
+    loaded = as_csv(table).sort_values("ncr_id", ignore_index=True)
+    pd.testing.assert_frame_equal(loaded, csv_rows(NCR_ROWS))
+
+
+def test_month_filter_reads_only_later_rows(tmp_path):
+    columnar.write_table("vehicle_ncr_log", NCR_ROWS, tmp_path)
+    path = columnar.find_table("vehicle_ncr_log", tmp_path)
+    table = columnar.read_table("vehicle_ncr_log", path, filter=columnar.month_filter("vehicle_ncr_log", "2024-03-30"))
+    assert table.column("ncr_id").to_pylist() == ["NCR00002"]
+
+
+def test_dimension_table_round_trip(tmp_path):
+    columnar.write_table("product_details", PRODUCT_ROWS, tmp_path)
+    path = columnar.find_table("product_details", tmp_path)
+    assert path.endswith("product_details.parquet")
+    # Decimals are written as 5.00 rather than 5.0: compare the parsed values
+    pd.testing.assert_frame_equal(as_csv(columnar.read_table("product_details", path), dtype=None),
+                                  csv_rows(PRODUCT_ROWS, dtype=None))
+    with pytest.raises(ValueError):
+        columnar.write_table("product_details", PRODUCT_ROWS, tmp_path, part=1)
@@ -0,0 +1,47 @@
+import io
+import re
+import pandas as pd
+import pytest
+import data_generator
+import llm_cache
+
+
+@pytest.fixture(scope="module")
+def backend_tables(tmp_path_factory):
+    # Every table from both backends, as the CSV text they are saved as
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr(llm_cache, "LLM_BACKEND", "stub")
+        monkeypatch.setattr(llm_cache, "CACHE_PATH", str(tmp_path_factory.mktemp("llm") / "llm_cache.sqlite"))
+        # set_backend changes these module globals; put them back afterwards
+        for name in ("GENERATOR_BACKEND", "GENERATOR_SEED", "_numpy_rng"):
+            monkeypatch.setattr(data_generator, name, getattr(data_generator, name))
+        tables = {}
+        for backend in data_generator.BACKENDS:
+            data_generator.set_backend(backend, 7)
+            tables[backend] = {name: pd.read_csv(io.StringIO(df.to_csv(index=False)), dtype=str, keep_default_na=False)
+                               for name, df in data_generator.generate_all_tables(data_generator.scaled_row_counts(0.2))}
+    return tables["python"], tables["numpy"]
+
+
+def shapes(values):
+    # "NCR00012" -> "a9", "2024-03-01" -> "9-9-9", "" stays "" (NULL)
+    return {re.sub(r"[A-Za-z]+", "a", re.sub(r"\d+", "9", value)) for value in values}
+
+
+def test_backends_write_the_same_columns_and_row_counts(backend_tables):
+    python, numpy = backend_tables
+    assert list(python) == list(numpy)
+    for name in python:
+        assert list(python[name].columns) == list(numpy[name].columns), name
+        assert len(python[name]) == len(numpy[name]), name
+
+
+def test_backends_write_the_same_value_formats_and_domains(backend_tables):
+    python, numpy = backend_tables
+    for name, df in python.items():
+        for column in df.columns:
+            assert shapes(df[column]) == shapes(numpy[name][column]), f"{name}.{column}"
+            # Enum-like columns (statuses, reasons, shifts) draw from the same values
+            values = set(df[column])
+            if len(values) <= 12 and len(df) >= 100:
+                assert values == set(numpy[name][column]), f"{name}.{column}"
@@ -0,0 +1,114 @@
+import pandas as pd
+import pytest
+from sqlalchemy import text
+import data_loader
+
+NCR_ROWS = pd.DataFrame({
+    "ncr_raised_date": ["2024-03-01", "2024-03-02"], "ncr_id": ["NCR00001", "NCR00002"],
+    "vehicle_no": ["V1", "V1"], "ncr_reason": ["Odor", "Pest"],
+    "ncr_status": ["CA completed", "CA pending"], "ca_completed_date": ["2024-03-05", None]})
+
+COMPLAINT_ROWS = pd.DataFrame({
+    "complaint_date": ["2024-03-01", "2024-03-02"], "complaint_id": ["C00001", "C00002"],
+    "customer_id": ["CUST1", "CUST1"], "product_id": ["P1", "P1"], "complaint_qty": [3, 5],
+    "complaint_category": ["Damaged", "Expired"], "complaint_status": ["Pending", "Pending"],
+    "resolution_completed_date": [None, None]})
+
+
+@pytest.fixture
+def parents(loader_db):
+    with loader_db.begin() as conn:
+        conn.execute(text("INSERT INTO vehicle_details VALUES ('V1', '3T')"))
+        conn.execute(text("INSERT INTO customer_details VALUES ('CUST1', 'Corner Shop')"))
+        conn.execute(text("INSERT INTO supplier_details VALUES ('S1', 'Acme', 'Kenya')"))
+        conn.execute(text("INSERT INTO product_details VALUES ('P1', 'S1', 'DN1', 'Tea', 10, 1.00, 2.00, 0.01)"))
+    return loader_db
+
+
+@pytest.mark.parametrize("table_name, conflict_key, df, date_column", [
+    ("vehicle_ncr_log", "ncr_id", NCR_ROWS, "ca_completed_date"),
+    ("complaint_handling_log", "complaint_id", COMPLAINT_ROWS, "resolution_completed_date"),
+])
+def test_insert_fallback_sends_empty_dates_as_null(parents, table_name, conflict_key, df, date_column):
+    assert data_loader.insert_load(data_loader.frame_source(df), table_name, conflict_key) == 2
+    with parents.connect() as conn:
+        loaded = dict(conn.execute(text(f"SELECT {conflict_key}, {date_column} FROM {table_name}")).all())
+    expected = {key: None if pd.isna(value) else pd.Timestamp(value).date()
+                for key, value in zip(df[conflict_key], df[date_column])}
+    assert loaded == expected
+
+
+def test_copy_merge_keeps_the_last_row_per_key(parents):
+    first = NCR_ROWS.assign(ncr_status="CA pending", ca_completed_date=None)
+    assert data_loader.load_source(data_loader.frame_source(first), "vehicle_ncr_log", "ncr_id", "copy") == 2
+    # NCR00001 twice in one file: the later row wins, and updates the row loaded before
+    update = pd.concat([NCR_ROWS.iloc[[0]].assign(ncr_status="CA pending", ca_completed_date=None), NCR_ROWS.iloc[[0]]])
+    assert data_loader.load_source(data_loader.frame_source(update), "vehicle_ncr_log", "ncr_id", "copy") == 2
+    with parents.connect() as conn:
+        rows = conn.execute(text("SELECT ncr_id, ncr_status FROM vehicle_ncr_log ORDER BY ncr_id")).all()
+    assert [tuple(row) for row in rows] == [("NCR00001", "CA completed"), ("NCR00002", "CA pending")]
+
+
+def test_copy_merge_keeps_the_last_row_in_a_partitioned_table(parents):
+    # order_id is not unique across partitions: the key's rows are replaced, not upserted
+    order = {"customer_id": "CUST1", "product_id": "P1", "ordered_qty": 10, "picked_qty": 10,
+             "pick_sheet_issued_time": "09:00:00", "pick_completed_time": "09:30:00", "vehicle_no": "V1",
+             "loading_completed_time": "10:00:00"}
+    df = pd.DataFrame([{"outbound_date": "2024-03-31", "order_id": "ORD1", **order},
+                       {"outbound_date": "2024-04-01", "order_id": "ORD1", **order, "picked_qty": 8}])
+    assert data_loader.load_source(data_loader.frame_source(df), "outbound_log", "order_id", "copy") == 2
+    with parents.connect() as conn:
+        rows = conn.execute(text("SELECT tableoid::regclass::text, outbound_date::text, picked_qty FROM outbound_log")).all()
+    assert [tuple(row) for row in rows] == [("outbound_log_y2024m04", "2024-04-01", 8)]
+
+
+def write_csv(directory, name, rows):
+    pd.DataFrame(rows).to_csv(directory / name, index=False)
+
+
+def counts(day, *products):
+    return [{"count_date": day, "product_id": product, "system_qty": 10, "counted_qty": 9} for product in products]
+
+
+@pytest.fixture
+def incremental(parents, tmp_path, monkeypatch):
+    monkeypatch.setattr(data_loader, "CSV_DIR", str(tmp_path))
+    monkeypatch.setattr(data_loader, "INCREMENTAL", True)
+    return tmp_path
+
+
+def test_incremental_load_skips_unchanged_files_and_advances_the_watermark(incremental):
+    write_csv(incremental, "cycle_count_log.csv", counts("2024-03-01", "P1") + counts("2024-03-02", "P1"))
+    assert data_loader.load_table("cycle_count_log.csv", "cycle_count_log", "cycle_id") == 2
+    assert data_loader.load_table("cycle_count_log.csv", "cycle_count_log", "cycle_id") == 0
+
+    # Only the day after the watermark is sent; the late 03-01 row counts as already loaded
+    write_csv(incremental, "cycle_count_log.csv",
+              counts("2024-03-01", "P1", "P1") + counts("2024-03-02", "P1") + counts("2024-03-03", "P1"))
+    assert data_loader.load_table("cycle_count_log.csv", "cycle_count_log", "cycle_id") == 1
+    with data_loader.engine.connect() as conn:
+        assert conn.execute(text("SELECT count(*) FROM cycle_count_log")).scalar() == 3
+        assert data_loader.read_watermark(conn, "cycle_count_log") == "2024-03-03"
+        assert conn.execute(text("SELECT count(*) FROM load_file_manifest")).scalar() == 1
+
+
+def test_first_incremental_load_after_a_full_load_starts_from_the_loaded_dates(incremental, monkeypatch):
+    write_csv(incremental, "cycle_count_log.csv", counts("2024-03-01", "P1") + counts("2024-03-02", "P1"))
+    monkeypatch.setattr(data_loader, "INCREMENTAL", False)
+    assert data_loader.load_table("cycle_count_log.csv", "cycle_count_log", "cycle_id") == 2
+    monkeypatch.setattr(data_loader, "INCREMENTAL", True)
+    assert data_loader.load_table("cycle_count_log.csv", "cycle_count_log", "cycle_id") == 0
+    with data_loader.engine.connect() as conn:
+        assert conn.execute(text("SELECT count(*) FROM cycle_count_log")).scalar() == 2
+
+
+def test_incremental_load_keeps_status_changes_to_older_keyed_rows(incremental):
+    write_csv(incremental, "vehicle_ncr_log.csv", NCR_ROWS)
+    assert data_loader.load_table("vehicle_ncr_log.csv", "vehicle_ncr_log", "ncr_id") == 2
+    # Both NCRs are closed later, with no row dated after the last load
+    closed = NCR_ROWS.assign(ncr_status="CA completed", ca_completed_date="2024-03-09")
+    write_csv(incremental, "vehicle_ncr_log.csv", closed)
+    assert data_loader.load_table("vehicle_ncr_log.csv", "vehicle_ncr_log", "ncr_id") == 2
+    with data_loader.engine.connect() as conn:
+        statuses = conn.execute(text("SELECT DISTINCT ncr_status FROM vehicle_ncr_log")).scalars().all()
+    assert statuses == ["CA completed"]
@@ -0,0 +1,24 @@
+import numpy as np
+import generation_scheduler
+
+
+def test_shard_ranges_cover_every_row_once():
+    ranges = generation_scheduler.shard_ranges(1_000_003, shard_rows=250_000)
+    assert ranges[0] == (0, 250_000)
+    assert ranges[-1] == (1_000_000, 3)
+    assert sum(rows for _, rows in ranges) == 1_000_003
+    assert all(start + rows == next_start for (start, rows), (next_start, _) in zip(ranges, ranges[1:]))
+
+
+def test_shard_ranges_empty_table():
+    assert generation_scheduler.shard_ranges(0) == []
+
+
+def test_shard_seed_is_deterministic():
+    def draws(seed, table, shard_index):
+        return np.random.default_rng(generation_scheduler.shard_seed(seed, table, shard_index)).integers(0, 2 ** 32, 8)
+
+    assert (draws(42, "outbound_log", 3) == draws(42, "outbound_log", 3)).all()
+    assert (draws(42, "outbound_log", 3) != draws(42, "outbound_log", 4)).any()
+    assert (draws(42, "outbound_log", 3) != draws(42, "inbound_log", 3)).any()
+    assert (draws(42, "outbound_log", 3) != draws(43, "outbound_log", 3)).any()
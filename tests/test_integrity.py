@@ -0,0 +1,53 @@
+import threading
+import pandas as pd
+import integrity
+
+FKS = {
+    "product_details": [("supplier_id", "supplier_details", "supplier_id")],
+    "outbound_log": [("customer_id", "customer_details", "customer_id"), ("product_id", "product_details", "product_id")],
+}
+
+
+def test_validate_rejects_unknown_keys():
+    indexes = integrity.KeyIndexes(fks=FKS)
+    indexes.add("customer_details", pd.DataFrame({"customer_id": ["C1", "C2"]}))
+    indexes.add("product_details", pd.DataFrame({"product_id": ["P1"], "supplier_id": ["S1"]}))
+    df = pd.DataFrame({"customer_id": ["C1", "C9", None, "C2"], "product_id": ["P1", "P1", "P1", "P9"]})
+
+    valid, rejects = indexes.validate("outbound_log", df)
+
+    assert list(valid.index) == [0, 2]
+    assert list(rejects.index) == [1, 3]
+    assert rejects.loc[1, "_reason"] == "customer_id not in customer_details.customer_id"
+    assert rejects.loc[3, "_reason"] == "product_id not in product_details.product_id"
+
+
+def test_add_extends_and_invalidate_forgets():
+    indexes = integrity.KeyIndexes(fks=FKS)
+    indexes.add("customer_details", pd.DataFrame({"customer_id": ["C1", "C2"]}))
+    indexes.add("customer_details", pd.DataFrame({"customer_id": ["C2", "C3"]}))
+    assert sorted(indexes.keys("customer_details", "customer_id")) == ["C1", "C2", "C3"]
+
+    indexes.invalidate("customer_details")
+    assert len(indexes.keys("customer_details", "customer_id")) == 0
+
+
+def test_concurrent_adds_keep_every_key():
+    indexes = integrity.KeyIndexes(fks=FKS)
+
+    def add(worker):
+        for batch in range(50):
+            indexes.add("customer_details", pd.DataFrame({"customer_id": [f"C{worker}-{batch}-{i}" for i in range(4)]}))
+
+    threads = [threading.Thread(target=add, args=(worker,)) for worker in range(16)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(indexes.keys("customer_details", "customer_id")) == 16 * 50 * 4
+
+
+def test_foreign_keys_read_from_schema():
+    fks = integrity.foreign_keys()
+    assert ("supplier_id", "supplier_details", "supplier_id") in fks["product_details"]
+    assert ("order_id", "outbound_log", "order_id") in fks["return_handling_log"]
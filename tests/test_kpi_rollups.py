@@ -0,0 +1,28 @@
+import pytest
+import kpi_rollups
+
+
+def test_rollup_dimensions_come_from_the_primary_keys():
+    assert kpi_rollups.ROLLUP_DIMENSIONS["kpi_returns_daily"] == ["shift", "customer_id", "return_reason"]
+    assert kpi_rollups.ROLLUP_DIMENSIONS["kpi_vehicle_daily"] == ["vehicle_no"]
+    assert set(kpi_rollups.ROLLUP_DIMENSIONS) == set(kpi_rollups.ROLLUPS)
+
+
+def test_kpi_filters_are_shared_by_every_rollup_read():
+    assert kpi_rollups.kpi_filters("top_customers_by_rsv_pct") == ["customer_id", "shift"]
+    assert kpi_rollups.kpi_filters("dispatched_to_inbound_cbm_pct") == ["shift"]
+    assert kpi_rollups.kpi_sources("avg_daily_vehicle_utilization_pct") == ["outbound_log", "product_details",
+                                                                            "vehicle_details"]
+
+
+def test_kpi_sql_adds_filters_to_every_period():
+    sql = kpi_rollups.kpi_sql("top_customers_by_rsv_pct", ["shift", "customer_id"])
+    assert sql.count(kpi_rollups.PERIOD) == 2
+    assert sql.count(f"{kpi_rollups.PERIOD} AND customer_id = ANY(:customer_id) AND shift = ANY(:shift)") == 2
+    with pytest.raises(ValueError):
+        kpi_rollups.kpi_sql("avg_daily_vehicle_utilization_pct", ["shift"])
+
+
+def test_rollup_select_limits_the_days():
+    assert "{where}" not in kpi_rollups.rollup_select("kpi_vehicle_daily")
+    assert "o.outbound_date = ANY(CAST(:days AS date[]))" in kpi_rollups.rollup_select("kpi_vehicle_daily", days=[])
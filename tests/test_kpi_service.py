@@ -0,0 +1,62 @@
+import kpi_service
+
+
+def cached(cache, key, value, tables=("outbound_log",)):
+    cache.put(key, value, tables, cache.generations(tables))
+
+
+def test_lru_eviction():
+    cache = kpi_service.ResultCache(max_entries=2, ttl=60)
+    cached(cache, "a", 1)
+    cached(cache, "b", 2)
+    assert cache.get("a") == 1
+    cached(cache, "c", 3)
+
+    assert cache.get("b") is None
+    assert (cache.get("a"), cache.get("c")) == (1, 3)
+    assert cache.stats["evictions"] == 1
+
+
+def test_entries_expire(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(kpi_service.time, "monotonic", lambda: now[0])
+    cache = kpi_service.ResultCache(max_entries=10, ttl=5)
+    cached(cache, "a", 1)
+    now[0] += 4.9
+    assert cache.get("a") == 1
+    now[0] += 0.1
+    assert cache.get("a") is None
+    assert cache.stats["expired"] == 1
+    assert len(cache) == 0
+
+
+def test_invalidate_evicts_only_readers_of_the_table():
+    cache = kpi_service.ResultCache(max_entries=10, ttl=60)
+    cached(cache, "fill_rate", 1, ("outbound_log", "product_details"))
+    cached(cache, "rejection_rate", 2, ("inbound_log", "product_details"))
+
+    assert cache.invalidate("outbound_log") == 1
+    assert cache.get("fill_rate") is None
+    assert cache.get("rejection_rate") == 2
+    assert cache.invalidate("product_details") == 1
+    assert len(cache) == 0
+
+
+def test_result_of_a_query_older_than_a_load_is_discarded():
+    cache = kpi_service.ResultCache(max_entries=10, ttl=60)
+    tables = ("outbound_log",)
+    started = cache.generations(tables)
+    cache.invalidate("outbound_log")
+    cache.put("fill_rate", 1, tables, started)
+
+    assert cache.get("fill_rate") is None
+    assert cache.stats["discarded"] == 1
+
+
+def test_clear_also_discards_running_queries():
+    cache = kpi_service.ResultCache(max_entries=10, ttl=60)
+    cached(cache, "a", 1)
+    started = cache.generations(("outbound_log",))
+    cache.clear()
+    cache.put("b", 2, ("outbound_log",), started)
+    assert len(cache) == 0
@@ -0,0 +1,41 @@
+import pytest
+import llm_cache
+
+
+@pytest.fixture(autouse=True)
+def cache_file(tmp_path, monkeypatch):
+    monkeypatch.setattr(llm_cache, "CACHE_PATH", str(tmp_path / "llm_cache.sqlite"))
+    monkeypatch.setattr(llm_cache, "BATCH_SIZE", 10)
+
+
+def test_stub_items_are_deterministic_and_distinct(tmp_path, monkeypatch):
+    items = llm_cache.generate_items("Realistic FMCG supplier names", num_items=35, backend="stub")
+    assert len(items) == len(set(items)) == 35
+    monkeypatch.setattr(llm_cache, "CACHE_PATH", str(tmp_path / "empty.sqlite"))
+    assert llm_cache.generate_items("Realistic FMCG supplier names", num_items=35, backend="stub") == items
+
+
+def test_second_request_is_served_from_the_cache(monkeypatch):
+    first = llm_cache.generate_items("20 different supplier countries", num_items=20, backend="stub")
+    monkeypatch.setitem(llm_cache.BACKENDS, "stub", lambda *args: pytest.fail("backend called on a cache hit"))
+    assert llm_cache.generate_items("20 different supplier countries", num_items=20, backend="stub") == first
+
+
+def test_short_answers_are_topped_up_then_padded_and_not_cached(monkeypatch):
+    monkeypatch.setitem(llm_cache.BACKENDS, "short", lambda prompt, model, num_items, offset=0: "Alpha, Beta")
+    items = llm_cache.generate_items("names", num_items=4, backend="short")
+    assert items == ["Alpha", "Beta", "Fallback_3", "Fallback_4"]
+    assert llm_cache.cache_get(llm_cache.cache_key("names", "mistral", 4, "short")) is None
+
+
+def test_cache_put_evicts_least_recently_used(monkeypatch):
+    clock = iter(range(1000))
+    monkeypatch.setattr(llm_cache.time, "time", lambda: next(clock))
+    llm_cache.cache_put("a", ["x" * 40], max_bytes=100)
+    llm_cache.cache_put("b", ["y" * 40], max_bytes=100)
+    assert llm_cache.cache_get("a") == ["x" * 40]
+    llm_cache.cache_put("c", ["z" * 40], max_bytes=100)
+
+    assert llm_cache.cache_get("b") is None
+    assert llm_cache.cache_get("a") == ["x" * 40]
+    assert llm_cache.cache_get("c") == ["z" * 40]
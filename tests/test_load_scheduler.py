@@ -0,0 +1,39 @@
+import csv
+import load_scheduler
+
+
+def write_csv(path, rows):
+    with open(path, "w", newline="") as f:
+        csv.writer(f).writerows(rows)
+    return str(path)
+
+
+def read_chunks(chunks):
+    return [list(csv.reader(chunk.buffer.read().decode("utf-8").splitlines())) for chunk in chunks]
+
+
+def test_split_csv_keeps_each_key_in_one_chunk(tmp_path):
+    cols = ["order_id", "qty"]
+    rows = [[f"ORD{i % 37:05d}", str(i)] for i in range(500)]
+    chunks = read_chunks(load_scheduler.split_csv(write_csv(tmp_path / "o.csv", [cols] + rows), cols, "order_id", 4))
+
+    assert len(chunks) == 4
+    assert all(chunk[0] == cols for chunk in chunks)
+    assert sorted(row for chunk in chunks for row in chunk[1:]) == sorted(rows)
+    owners = {}
+    for index, chunk in enumerate(chunks):
+        for order_id, _ in chunk[1:]:
+            assert owners.setdefault(order_id, index) == index
+    # Rows of one key stay in file order, so the last one still wins the upsert
+    for chunk in chunks:
+        for order_id in {row[0] for row in chunk[1:]}:
+            assert [row for row in chunk[1:] if row[0] == order_id] == [row for row in rows if row[0] == order_id]
+
+
+def test_split_csv_deals_keyless_rows_round_robin(tmp_path):
+    cols = ["count_date", "product_id"]
+    rows = [["2024-01-01", f"P{i}"] for i in range(10)]
+    chunks = read_chunks(load_scheduler.split_csv(write_csv(tmp_path / "c.csv", [cols] + rows), cols, None, 3))
+
+    assert [len(chunk) - 1 for chunk in chunks] == [4, 3, 3]
+    assert chunks[1][1:] == [rows[1], rows[4], rows[7]]
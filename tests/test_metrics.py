@@ -0,0 +1,50 @@
+import pytest
+import metrics
+
+
+@pytest.fixture(autouse=True)
+def registry(monkeypatch):
+    monkeypatch.setattr(metrics, "registry", metrics.Registry())
+    return metrics.registry
+
+
+def test_span_records_rows_bytes_and_errors(registry):
+    with metrics.span("send", "outbound_log", rows=10) as span:
+        span.bytes = 2048
+    with pytest.raises(RuntimeError):
+        with metrics.span("send", "outbound_log", rows=5):
+            raise RuntimeError("COPY failed")
+
+    [entry] = registry.snapshot()
+    assert (entry["stage"], entry["table"]) == ("send", "outbound_log")
+    assert (entry["count"], entry["errors"], entry["rows"], entry["bytes"]) == (2, 1, 15, 2048)
+    assert sum(entry["buckets"]) == 2
+
+
+def test_merge_adds_worker_snapshots(registry):
+    worker = metrics.Registry()
+    for seconds in (0.002, 7.0):
+        span = metrics.Span("generate", "inbound_log", rows=100)
+        span.seconds = seconds
+        worker.record(span)
+
+    registry.merge(worker.snapshot())
+    registry.merge(worker.snapshot())
+
+    [entry] = registry.snapshot()
+    assert (entry["count"], entry["rows"], entry["max_seconds"]) == (4, 400, 7.0)
+    assert entry["buckets"][metrics.LATENCY_BUCKETS.index(0.005)] == 2
+    assert entry["buckets"][metrics.LATENCY_BUCKETS.index(10)] == 2
+
+
+def test_prometheus_histogram_is_cumulative(registry):
+    span = metrics.Span("merge", "outbound_log")
+    span.seconds = 0.2
+    registry.record(span)
+
+    lines = metrics.to_prometheus().splitlines()
+    labels = 'stage="merge",table="outbound_log"'
+    assert f'wiap_stage_duration_seconds_bucket{{{labels},le="0.1"}} 0' in lines
+    assert f'wiap_stage_duration_seconds_bucket{{{labels},le="0.25"}} 1' in lines
+    assert f'wiap_stage_duration_seconds_bucket{{{labels},le="+Inf"}} 1' in lines
+    assert f"wiap_stage_duration_seconds_count{{{labels}}} 1" in lines
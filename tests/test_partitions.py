@@ -0,0 +1,26 @@
+import partitions
+
+
+def test_partition_names_and_bounds():
+    assert partitions.partition_name("outbound_log", "2024-03") == "outbound_log_y2024m03"
+    assert partitions.month_bounds("2024-02") == ("2024-02-01", "2024-03-01")
+    assert partitions.month_bounds("2024-12") == ("2024-12-01", "2025-01-01")
+
+
+def test_months_in_skips_missing_and_malformed_dates():
+    dates = ["2024-03-05", "2024-01-31", None, "", "bad", "2024-03-01"]
+    assert partitions.months_in(dates) == ["2024-01", "2024-03"]
+
+
+def test_create_partition_sql():
+    assert partitions.create_partition_sql("inbound_log", "2023-11") == (
+        "CREATE TABLE IF NOT EXISTS inbound_log_y2023m11 PARTITION OF inbound_log "
+        "FOR VALUES FROM ('2023-11-01') TO ('2023-12-01')")
+
+
+def test_partitioned_ddl_is_the_schema_table():
+    for table, column in partitions.PARTITIONED_TABLES.items():
+        ddl = partitions.PARTITIONED_DDL[table]
+        assert f"CREATE TABLE IF NOT EXISTS {table} (" in ddl
+        assert f"PARTITION BY RANGE ({column})" in ddl
+        assert f"ON {table} USING brin ({column})" in ddl
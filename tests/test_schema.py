@@ -0,0 +1,27 @@
+import pytest
+import schema
+
+
+def test_table_ddl_keeps_the_tables_statements_in_file_order():
+    ddl = schema.table_ddl(["load_watermark", "load_file_manifest"])
+    assert ddl.index("CREATE TABLE IF NOT EXISTS load_file_manifest (") < ddl.index(
+        "CREATE TABLE IF NOT EXISTS load_watermark (")
+    assert ddl.count("CREATE TABLE") == 2
+    assert "--" not in ddl
+
+
+def test_table_ddl_includes_indexes_from_every_step():
+    ddl = schema.table_ddl(["clean_outbound_log"])
+    assert "idx_clean_outbound_date" in ddl
+    assert "idx_clean_outbound_vehicle" in ddl
+    assert "kpi_" not in ddl
+
+
+def test_every_index_can_be_rerun():
+    indexes = [statement for _, statement in schema.statements() if statement.upper().startswith("CREATE INDEX")]
+    assert indexes and all("IF NOT EXISTS" in statement for statement in indexes)
+
+
+def test_unknown_table():
+    with pytest.raises(KeyError):
+        schema.table_ddl(["no_such_table"])
@@ -0,0 +1,34 @@
+import numpy as np
+import pandas as pd
+import pytest
+import telemetry
+import vectorized_generator
+
+
+def test_rolling_stats_match_pandas():
+    rng = np.random.default_rng(0)
+    readings = rng.normal(-18, 2, (60, 3))
+    stats = telemetry.RollingStats(window=7, capacity=3)
+    rows = stats.rooms(np.array(["A01 Room", "A02 Room", "Inbound Bay"], dtype=object))
+
+    means, stds = zip(*(stats.push(rows, values) for values in readings))
+
+    expected = pd.DataFrame(readings).rolling(7, min_periods=1)
+    np.testing.assert_allclose(np.array(means), expected.mean().to_numpy())
+    np.testing.assert_allclose(np.array(stds), expected.std(ddof=0).to_numpy(), atol=1e-9)
+
+
+def test_rolling_stats_rooms():
+    stats = telemetry.RollingStats(window=5, capacity=2)
+    assert list(stats.rooms(np.array(["B", "A", "B"], dtype=object))) == [0, 1, 0]
+    assert list(stats.rooms(np.array(["A"], dtype=object))) == [1]
+    with pytest.raises(ValueError):
+        stats.rooms(np.array(["C"], dtype=object))
+
+
+def test_temperature_log_does_not_depend_on_batch_boundaries():
+    generate = vectorized_generator.generate_warehouse_temperature_monitoring_log
+    full = generate(200 * 300, rng=np.random.default_rng(1), seed=7)
+    rng = np.random.default_rng(1)
+    batches = [generate(rows, rng=rng, start_index=start, seed=7) for start, rows in [(0, 4321), (4321, 30000), (34321, 25679)]]
+    pd.testing.assert_frame_equal(pd.concat(batches, ignore_index=True), full)